@@ -88,6 +88,16 @@ from OCC.Core.Graphic3d import (
     Graphic3d_NameOfMaterial,
 )
 from OCC.Core.Aspect import Aspect_TOTP_RIGHT_LOWER, Aspect_FM_STRETCH, Aspect_FM_NONE
+from OCC.Core.MeshDS import MeshDS_DataSource
+from OCC.Core.MeshVS import (
+    MeshVS_Mesh,
+    MeshVS_MeshPrsBuilder,
+    MeshVS_DMF_Shading,
+    MeshVS_DA_DisplayNodes,
+    MeshVS_DA_ShowEdges,
+    MeshVS_DA_InteriorColor,
+)
+from OCC.Core.Poly import Poly_Triangulation
 
 if sys.platform == "win32":
     if "CASROOT" in os.environ:
@@ -591,6 +601,34 @@ class Viewer3d(Display3d):
 
         return self.DisplayShape(shapes, color=clr, update=update)
 
+    def DisplayMesh(
+        self,
+        mesh,
+        color=None,
+        display_edges=False,
+        update=False,
+    ):
+        """display a Poly_Triangulation or a MeshDS_DataSource as a MeshVS_Mesh,
+        without building any BRep topology"""
+        if isinstance(mesh, Poly_Triangulation):
+            mesh = MeshDS_DataSource(mesh)
+        mesh_to_display = MeshVS_Mesh()
+        mesh_to_display.SetDataSource(mesh)
+        mesh_to_display.AddBuilder(MeshVS_MeshPrsBuilder(mesh_to_display), True)
+        drawer = mesh_to_display.GetDrawer()
+        drawer.SetBoolean(MeshVS_DA_DisplayNodes, False)
+        drawer.SetBoolean(MeshVS_DA_ShowEdges, display_edges)
+        if color:
+            if isinstance(color, str):
+                color = get_color_from_name(color)
+            drawer.SetColor(MeshVS_DA_InteriorColor, color)
+        mesh_to_display.SetDisplayMode(MeshVS_DMF_Shading)
+        self.Context.Display(mesh_to_display, False)
+        if update:
+            self.FitAll()
+            self.Repaint()
+        return mesh_to_display
+
     def EnableAntiAliasing(self):
         self.SetNbMsaaSample(4)
 
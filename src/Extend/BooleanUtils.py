@@ -0,0 +1,206 @@
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Boolean operations over many shapes.
+
+Fusing n shapes one after the other makes n operations on a growing result.
+Here the shapes are first ordered so that neighbours in space are neighbours
+in the list, then reduced pairwise, level by level, as a binary tree: each
+level is one native call that runs all its operations in parallel. The
+time spent in each stage is reported along with the result.
+
+Example:
+
+    shape, stages = boolean_operation("fuse", shapes, fuzzy_value=1e-5)
+    for stage in stages:
+        print(stage["stage"], stage["operations"], stage["seconds"])
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from OCC.Core.BOPAlgo import (
+    BOPAlgo_BOP,
+    BOPAlgo_COMMON,
+    BOPAlgo_CUT,
+    BOPAlgo_FUSE,
+    BOPAlgo_GlueFull,
+    BOPAlgo_GlueOff,
+    BOPAlgo_GlueShift,
+)
+from OCC.Core.TopTools import TopTools_ListOfShape
+from OCC.Core.TopoDS import TopoDS_Shape
+
+from OCC.Extend.ShapeFactory import get_boundingboxes
+from OCC.Extend.SpatialQueries import ShapeBVH
+from OCC.Extend.TopologyUtils import compound_children, list_of_shapes_to_compound
+
+_BOOLEAN_OPERATIONS = {
+    "fuse": BOPAlgo_FUSE,
+    "cut": BOPAlgo_CUT,
+    "common": BOPAlgo_COMMON,
+}
+
+_GLUE_OPTIONS = {
+    "off": BOPAlgo_GlueOff,
+    "shift": BOPAlgo_GlueShift,
+    "full": BOPAlgo_GlueFull,
+}
+
+
+def _list_of_shapes(shapes: Iterable[TopoDS_Shape]) -> TopTools_ListOfShape:
+    shape_list = TopTools_ListOfShape()
+    for shape in shapes:
+        shape_list.Append(shape)
+    return shape_list
+
+
+class _StageTimer:
+    """Append the duration of a stage to a list of stages"""
+
+    def __init__(self, stages: List[Dict[str, Any]], stage: str, operations: int):
+        self.stages = stages
+        self.stage = stage
+        self.operations = operations
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stages.append(
+            {
+                "stage": self.stage,
+                "operations": self.operations,
+                "seconds": time.perf_counter() - self.start,
+            }
+        )
+
+
+def spatial_order(shapes: List[TopoDS_Shape], parallel: bool = True) -> np.ndarray:
+    """Return an ordering of the shapes such that the shapes close in space
+    are close in the list: the order of the leaves of a ShapeBVH of their
+    boxes. The shapes without any box come last."""
+    if len(shapes) < 3:
+        return np.arange(len(shapes))
+    boxes = get_boundingboxes(shapes, 1e-6, "control_points", parallel)
+    order = ShapeBVH(boxes, leaf_size=1).items.astype(np.int64)
+    return np.concatenate([order, np.flatnonzero(np.isnan(boxes).any(axis=1))])
+
+
+def _reduce(
+    shapes: List[TopoDS_Shape],
+    operation: int,
+    name: str,
+    fuzzy_value: float,
+    glue: int,
+    parallel: bool,
+    stages: List[Dict[str, Any]],
+) -> TopoDS_Shape:
+    """Reduce the shapes pairwise, one parallel native call per tree level"""
+    level = 0
+    while len(shapes) > 1:
+        level += 1
+        nb_pairs = len(shapes) // 2
+        objects, _ = list_of_shapes_to_compound(shapes[0 : 2 * nb_pairs : 2])
+        tools, _ = list_of_shapes_to_compound(shapes[1 : 2 * nb_pairs : 2])
+        with _StageTimer(stages, f"{name} level {level}", nb_pairs):
+            results = BOPAlgo_BOP.PairwiseOperations(
+                objects, tools, operation, fuzzy_value, glue, parallel
+            )
+        # an odd shape goes up to the next level as is
+        shapes = compound_children(results) + shapes[2 * nb_pairs :]
+    return shapes[0]
+
+
+def boolean_operation(
+    operation: str,
+    objects: Iterable[TopoDS_Shape],
+    tools: Optional[Iterable[TopoDS_Shape]] = None,
+    fuzzy_value: float = 0.0,
+    glue: str = "off",
+    parallel: bool = True,
+) -> Tuple[TopoDS_Shape, List[Dict[str, Any]]]:
+    """Run a boolean operation over lists of shapes.
+
+    Args:
+        operation: "fuse" fuses all the objects and tools together.
+            "cut" removes the union of the tools from the objects.
+            "common" keeps the parts of the objects inside the union of the
+            tools or, without any tool, the common part of all the objects
+        objects: the objects
+        tools: the tools
+        fuzzy_value: the fuzzy value of the operations, i.e. the additional
+            tolerance used to detect the coincidences
+        glue: the BOPAlgo glue option, "off", "shift" or "full". Gluing
+            speeds up the operations on shapes that only share, or partially
+            share, faces, and that don't otherwise intersect
+        parallel: if True, the operations of a same level run in parallel
+
+    Returns:
+        the result and the list of the stages, each one a dict with the
+        "stage" name, the number of "operations" and their duration in "seconds"
+    """
+    if operation not in _BOOLEAN_OPERATIONS:
+        raise AssertionError(f"Unknown boolean operation {operation}")
+    if glue not in _GLUE_OPTIONS:
+        raise AssertionError(f"Unknown glue option {glue}")
+    objects = list(objects)
+    tools = [] if tools is None else list(tools)
+    if not objects:
+        raise AssertionError("No object to operate on.")
+    if operation == "cut" and not tools:
+        raise AssertionError("cut requires at least one tool.")
+    if any(shape.IsNull() for shape in objects + tools):
+        raise AssertionError("Can't operate on a null shape.")
+    glue_option = _GLUE_OPTIONS[glue]
+    stages = []
+
+    def reduce(shapes, bop_operation, name):
+        with _StageTimer(stages, f"{name} ordering", len(shapes)):
+            order = spatial_order(shapes, parallel)
+        return _reduce(
+            [shapes[i] for i in order],
+            bop_operation,
+            name,
+            fuzzy_value,
+            glue_option,
+            parallel,
+            stages,
+        )
+
+    if operation == "fuse":
+        return reduce(objects + tools, BOPAlgo_FUSE, "fuse"), stages
+    if operation == "common" and not tools:
+        return reduce(objects, BOPAlgo_COMMON, "common"), stages
+    # cut, or common with tools: the objects against the union of the tools,
+    # in one operation
+    tool = reduce(tools, BOPAlgo_FUSE, "tools fuse")
+    bop = BOPAlgo_BOP()
+    bop.SetArguments(_list_of_shapes(objects))
+    bop.SetTools(_list_of_shapes([tool]))
+    bop.SetOperation(_BOOLEAN_OPERATIONS[operation])
+    bop.SetFuzzyValue(fuzzy_value)
+    bop.SetGlue(glue_option)
+    bop.SetNonDestructive(True)
+    bop.SetRunParallel(parallel)
+    with _StageTimer(stages, operation, 1):
+        bop.Perform()
+    if bop.HasErrors():
+        raise AssertionError(f"Boolean operation failed: {bop.DumpErrors()}")
+    return bop.Shape(), stages
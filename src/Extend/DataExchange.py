@@ -15,15 +15,29 @@
 ##You should have received a copy of the GNU Lesser General Public License
 ##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
+import math
 import os
-from typing import Union, List
-
-from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Edge, TopoDS_Shape
+import struct
+import threading
+import zipfile
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from OCC.Core.TopoDS import (
+    TopoDS_Compound,
+    TopoDS_Edge,
+    TopoDS_Shape,
+)
 from OCC.Core.BRepTools import breptools
+from OCC.Core.BinTools import bintools
 from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 from OCC.Core.StlAPI import stlapi, StlAPI_Writer
+from OCC.Core.RWStl import rwstl
 from OCC.Core.BRep import BRep_Builder
-from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Pnt2d
+from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Pnt2d, gp_Trsf
 from OCC.Core.Bnd import Bnd_Box2d
 from OCC.Core.IGESControl import (
     IGESControl_Controller,
@@ -31,11 +45,19 @@ from OCC.Core.IGESControl import (
     IGESControl_Writer,
 )
 from OCC.Core.STEPControl import (
+    STEPControl_Controller,
     STEPControl_Reader,
     STEPControl_Writer,
     STEPControl_AsIs,
+    STEPControl_ActorRead,
 )
 from OCC.Core.Interface import Interface_Static
+from OCC.Core.APIHeaderSection import APIHeaderSection_MakeHeader
+from OCC.Core.StepBasic import StepBasic_ProductDefinition
+from OCC.Core.StepRepr import StepRepr_NextAssemblyUsageOccurrence
+from OCC.Core.StepShape import StepShape_ContextDependentShapeRepresentation
+from OCC.Core.StepData import StepData_Factors
+from OCC.Core.TColStd import TColStd_SequenceOfAsciiString
 from OCC.Core.IFSelect import IFSelect_RetDone, IFSelect_ItemsByEntity
 from OCC.Core.TDocStd import TDocStd_Document
 from OCC.Core.XCAFDoc import (
@@ -60,7 +82,19 @@ from OCC.Core.RWMesh import (
 )
 from OCC.Core.UnitsMethods import unitsmethods
 
-from OCC.Extend.TopologyUtils import discretize_edge, get_sorted_hlr_edges
+from OCC.Extend.TopologyUtils import (
+    compound_children,
+    discretize_edge,
+    discretize_edges,
+    get_sorted_hlr_edges,
+)
+from OCC.Extend.MeshUtils import (
+    merge_vertices,
+    mesh_shapes,
+    numpy_to_triangulation,
+    to_numpy_mesh,
+    triangulation_to_numpy,
+)
 
 try:
     import svgwrite
@@ -77,6 +111,60 @@ def check_svgwrite_installed():
         )
 
 
+##########################
+# Translation parameters #
+##########################
+# The parameters of the STEP and IGES translators are process wide
+# Interface_Static values, read by the readers and writers when they
+# translate. Each translation holds this lock, and sets the parameters it
+# needs for its own duration only, so that concurrent calls from several
+# threads don't see each other's settings.
+_TRANSLATION_LOCK = threading.RLock()
+
+
+@contextmanager
+def _translation_parameters(parameters: Optional[dict] = None):
+    """Context manager that serializes a translation, and sets Interface_Static
+    parameters for the duration of the with block.
+
+    Args:
+        parameters: a dict that maps parameter names (for instance
+                    "write.step.schema") to str, int or float values.
+                    The previous values are restored on exit. The STEP and
+                    IGES controllers are initialized first, so that their
+                    parameters exist even before any translation.
+    """
+    with _TRANSLATION_LOCK:
+        previous_values = {}
+        if parameters:
+            # the STEP and IGES parameters are only registered once their
+            # controller is initialized, usually by the first reader or writer
+            STEPControl_Controller.Init()
+            IGESControl_Controller.Init()
+        try:
+            for name, value in (parameters or {}).items():
+                if isinstance(value, str):
+                    previous_values[name] = Interface_Static.CVal(name)
+                    ok = Interface_Static.SetCVal(name, value)
+                elif isinstance(value, int):
+                    previous_values[name] = Interface_Static.IVal(name)
+                    ok = Interface_Static.SetIVal(name, value)
+                else:
+                    previous_values[name] = Interface_Static.RVal(name)
+                    ok = Interface_Static.SetRVal(name, value)
+                if not ok:
+                    raise AssertionError(f"Can't set {name} to {value}.")
+            yield
+        finally:
+            for name, value in previous_values.items():
+                if isinstance(value, str):
+                    Interface_Static.SetCVal(name, value)
+                elif isinstance(value, int):
+                    Interface_Static.SetIVal(name, value)
+                else:
+                    Interface_Static.SetRVal(name, value)
+
+
 ##########################
 # Step import and export #
 ##########################
@@ -103,17 +191,18 @@ def read_step_file(
     if not os.path.isfile(filename):
         raise FileNotFoundError(f"STEP file not found: {filename}")
 
-    step_reader = STEPControl_Reader()
-    status = step_reader.ReadFile(filename)
+    with _translation_parameters():
+        step_reader = STEPControl_Reader()
+        status = step_reader.ReadFile(filename)
 
-    if status != IFSelect_RetDone:
-        raise AssertionError("Error: can't read file.")
+        if status != IFSelect_RetDone:
+            raise AssertionError("Error: can't read file.")
 
-    if verbosity:
-        step_reader.PrintCheckLoad(False, IFSelect_ItemsByEntity)
-        step_reader.PrintCheckTransfer(False, IFSelect_ItemsByEntity)
+        if verbosity:
+            step_reader.PrintCheckLoad(False, IFSelect_ItemsByEntity)
+            step_reader.PrintCheckTransfer(False, IFSelect_ItemsByEntity)
 
-    transfer_result = step_reader.TransferRoots()
+        transfer_result = step_reader.TransferRoots()
     if not transfer_result:
         raise AssertionError("Transfer failed.")
 
@@ -172,13 +261,11 @@ def write_step_file(
     if os.path.isfile(filename):
         print(f"Warning: {filename} file already exists and will be replaced")
 
-    # Initialize STEP writer
-    writer = STEPControl_Writer()
-    Interface_Static.SetCVal("write.step.schema", application_protocol)
-
-    # Convert and write shape
-    writer.Transfer(shape, STEPControl_AsIs)
-    status = writer.Write(filename)
+    # The schema is set for this export only
+    with _translation_parameters({"write.step.schema": application_protocol}):
+        writer = STEPControl_Writer()
+        writer.Transfer(shape, STEPControl_AsIs)
+        status = writer.Write(filename)
 
     if status != IFSelect_RetDone:
         raise IOError("Error while writing shape to STEP file.")
@@ -186,6 +273,321 @@ def write_step_file(
         raise IOError(f"{filename} not saved to filesystem.")
 
 
+def _hascii_to_str(h_ascii_string) -> str:
+    """converts a (possibly null) TCollection_HAsciiString to a python str"""
+    if h_ascii_string is None:
+        return ""
+    return h_ascii_string.ToCString()
+
+
+def _sequence_of_ascii_string_to_list(sequence) -> List[str]:
+    return [sequence.Value(i).ToCString() for i in range(1, sequence.Length() + 1)]
+
+
+def _step_product_structure(model, count_entities: bool = False):
+    """Collect the product structure of a STEP model in a single loop over
+    its entities, without any transfer.
+
+    Returns:
+        a tuple (entity_counts, product_definitions, assembly_links, placements)
+        * entity_counts maps each STEP type name to its number of entities
+          (empty if count_entities is False)
+        * product_definitions maps the entity number of each product
+          definition to its product name
+        * assembly_links is a list of (parent number, child number,
+          instance name, NAUO number) tuples
+        * placements maps each NAUO number to the representation relationship
+          that holds the placement of the instance
+    """
+    entity_counts = {}
+    product_definitions = {}
+    assembly_links = []
+    placements = {}
+    for i in range(1, model.NbEntities() + 1):
+        entity = model.Value(i)
+        type_name = entity.DynamicType().Name()
+        if count_entities:
+            entity_counts[type_name] = entity_counts.get(type_name, 0) + 1
+        if type_name == "StepBasic_ProductDefinition":
+            product_definition = StepBasic_ProductDefinition.DownCast(entity)
+            product = product_definition.Formation().OfProduct()
+            product_definitions[i] = _hascii_to_str(product.Name())
+        elif type_name == "StepRepr_NextAssemblyUsageOccurrence":
+            nauo = StepRepr_NextAssemblyUsageOccurrence.DownCast(entity)
+            assembly_links.append(
+                (
+                    model.Number(nauo.RelatingProductDefinition()),
+                    model.Number(nauo.RelatedProductDefinition()),
+                    _hascii_to_str(nauo.Name()),
+                    i,
+                )
+            )
+        elif type_name == "StepShape_ContextDependentShapeRepresentation":
+            cdsr = StepShape_ContextDependentShapeRepresentation.DownCast(entity)
+            product_definition_shape = cdsr.RepresentedProductRelation()
+            if product_definition_shape is None:
+                continue
+            relationship = (
+                product_definition_shape.Definition().ProductDefinitionRelationship()
+            )
+            if relationship is not None:
+                placements[model.Number(relationship)] = cdsr.RepresentationRelation()
+    return entity_counts, product_definitions, assembly_links, placements
+
+
+def _step_product_tree(product_definitions: dict, assembly_links: list) -> list:
+    """Build the product tree from the output of _step_product_structure.
+
+    Each node is a dict with "name", "instance_name", "children",
+    "product_definition" (entity number) and "nauo" (entity number, 0 for
+    the roots) keys.
+    """
+    children = {}
+    child_numbers = set()
+    for parent, child, instance_name, nauo in assembly_links:
+        children.setdefault(parent, []).append((child, instance_name, nauo))
+        child_numbers.add(child)
+
+    def _make_node(number, instance_name, nauo, ancestors):
+        node = {
+            "name": product_definitions.get(number, ""),
+            "instance_name": instance_name,
+            "children": [],
+            "product_definition": number,
+            "nauo": nauo,
+        }
+        if number in ancestors:  # malformed file, cyclic assembly
+            return node
+        for child, child_instance_name, child_nauo in children.get(number, []):
+            node["children"].append(
+                _make_node(child, child_instance_name, child_nauo, ancestors | {number})
+            )
+        return node
+
+    return [
+        _make_node(number, "", 0, frozenset())
+        for number in product_definitions
+        if number not in child_numbers
+    ]
+
+
+def scan_step_file(filename: str, count_entities: bool = True) -> dict:
+    """Parse a STEP file and report its metadata, without transferring any shape.
+
+    Only the STEP entities are loaded, no BRep geometry is built, so that this
+    function can be used to index large amounts of files.
+
+    Args:
+        filename: Path to the STEP file to scan
+        count_entities: If True, count the entities of each OCCT class.
+                        Defaults to True.
+
+    Returns:
+        A dict with the following keys:
+        * "header": the header section (name, authors, organizations,
+          originating_system, preprocessor_version, authorisation, descriptions
+          and schemas)
+        * "units": the length, angle and solid angle unit names
+        * "nb_entities": the total number of entities
+        * "entity_counts": a dict that maps the name of the OCCT class of the
+          entities, e.g. "StepBasic_Product" rather than the STEP entity name
+          PRODUCT, to their number (empty if count_entities is False)
+        * "products": the list of product names
+        * "assembly": the product tree, as a list of root nodes. Each node is
+          a dict with "name", "instance_name" and "children" keys
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist
+        IOError: If the file can't be parsed
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"STEP file not found: {filename}")
+
+    with _translation_parameters():
+        step_reader = STEPControl_Reader()
+        status = step_reader.ReadFile(filename)
+    if status != IFSelect_RetDone:
+        raise IOError(f"Error: can't read file {filename}.")
+    model = step_reader.StepModel()
+
+    # header section
+    header = APIHeaderSection_MakeHeader(model)
+    header_info = {
+        "name": _hascii_to_str(header.Name()),
+        "authors": [
+            _hascii_to_str(header.AuthorValue(i))
+            for i in range(1, header.NbAuthor() + 1)
+        ],
+        "organizations": [
+            _hascii_to_str(header.OrganizationValue(i))
+            for i in range(1, header.NbOrganization() + 1)
+        ],
+        "originating_system": _hascii_to_str(header.OriginatingSystem()),
+        "preprocessor_version": _hascii_to_str(header.PreprocessorVersion()),
+        "authorisation": _hascii_to_str(header.Authorisation()),
+        "descriptions": [
+            _hascii_to_str(header.DescriptionValue(i))
+            for i in range(1, header.NbDescription() + 1)
+        ],
+        "schemas": [
+            _hascii_to_str(header.SchemaIdentifiersValue(i))
+            for i in range(1, header.NbSchemaIdentifiers() + 1)
+        ],
+    }
+
+    # units
+    length_units = TColStd_SequenceOfAsciiString()
+    angle_units = TColStd_SequenceOfAsciiString()
+    solid_angle_units = TColStd_SequenceOfAsciiString()
+    step_reader.FileUnits(length_units, angle_units, solid_angle_units)
+    units = {
+        "length": _sequence_of_ascii_string_to_list(length_units),
+        "angle": _sequence_of_ascii_string_to_list(angle_units),
+        "solid_angle": _sequence_of_ascii_string_to_list(solid_angle_units),
+    }
+
+    entity_counts, product_definitions, assembly_links, _ = _step_product_structure(
+        model, count_entities
+    )
+    assembly = _step_product_tree(product_definitions, assembly_links)
+
+    # the entity numbers are not part of the report
+    def _strip(node):
+        return {
+            "name": node["name"],
+            "instance_name": node["instance_name"],
+            "children": [_strip(child) for child in node["children"]],
+        }
+
+    return {
+        "header": header_info,
+        "units": units,
+        "nb_entities": model.NbEntities(),
+        "entity_counts": entity_counts,
+        "products": list(product_definitions.values()),
+        "assembly": [_strip(root) for root in assembly],
+    }
+
+
+def read_step_file_subtrees(
+    filename: str,
+    product_names: Optional[Iterable[str]] = None,
+    paths: Optional[Iterable[str]] = None,
+    predicate: Optional[Callable[[dict], bool]] = None,
+) -> List[Tuple[str, TopoDS_Shape, gp_Trsf]]:
+    """Read only the subtrees of a STEP assembly that match a filter.
+
+    The product tree is first walked without any transfer, then only the
+    product definitions of the matching nodes are translated, so that the
+    load time and memory depend on what is requested rather than on the
+    size of the whole assembly. Once a node matches, its whole subtree is
+    translated and its descendants are not tested.
+
+    Each node of the tree is identified by a path, made of the instance
+    names (or the product name if the instance name is empty) from the root
+    down to the node, joined with "/", for instance "as1/rod-assembly_1/nut_1".
+
+    Args:
+        filename: Path to the STEP file to read
+        product_names: a node matches if its product name is in this list
+        paths: a node matches if its path is in this list
+        predicate: a node matches if predicate(node) is True. node is a dict
+                   with "name", "instance_name" and "path" keys
+
+    Returns:
+        A list of (path, shape, placement) tuples, in the order of the
+        product tree. shape is located in the frame of the root product,
+        placement is the gp_Trsf from the frame of the subtree to the frame
+        of the root product. The list is empty if no node matches.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist
+        AssertionError: If no filter is given, or if the transfer fails
+    """
+    if product_names is None and paths is None and predicate is None:
+        raise AssertionError("product_names, paths or predicate must be set.")
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"STEP file not found: {filename}")
+    product_names = set(product_names) if product_names is not None else set()
+    paths = set(paths) if paths is not None else set()
+
+    with _translation_parameters():
+        step_reader = STEPControl_Reader()
+        status = step_reader.ReadFile(filename)
+        if status != IFSelect_RetDone:
+            raise AssertionError("Error: can't read file.")
+        model = step_reader.StepModel()
+
+        _, product_definitions, assembly_links, placements = _step_product_structure(
+            model
+        )
+
+        # walk the product tree, and stop at the first matching node of each branch
+        selection = []  # (path, product definition number, NAUO numbers from the root)
+
+        def _select(node, parent_path, nauos):
+            path_item = node["instance_name"] or node["name"]
+            path = f"{parent_path}/{path_item}" if parent_path else path_item
+            if node["nauo"]:
+                nauos = nauos + [node["nauo"]]
+            if (
+                node["name"] in product_names
+                or path in paths
+                or (
+                    predicate is not None
+                    and predicate(
+                        {
+                            "name": node["name"],
+                            "instance_name": node["instance_name"],
+                            "path": path,
+                        }
+                    )
+                )
+            ):
+                selection.append((path, node["product_definition"], nauos))
+                return
+            for child in node["children"]:
+                _select(child, path, nauos)
+
+        for root in _step_product_tree(product_definitions, assembly_links):
+            _select(root, "", [])
+
+        # translate the selected product definitions only. A product instanced
+        # several times is translated once, the transfer results are cached
+        subtrees = []
+        for path, product_definition, nauos in selection:
+            if not step_reader.TransferEntity(model.Value(product_definition)):
+                raise AssertionError(f"Transfer of {path} failed.")
+            subtrees.append((path, step_reader.Shape(step_reader.NbShapes()), nauos))
+        if not subtrees:
+            return []
+
+        # compose the placements of the instances from the root to each subtree.
+        # The STEP actor computes each one from the entities, with the file units
+        transient_process = step_reader.WS().TransferReader().TransientProcess()
+        actor = STEPControl_ActorRead(model)
+        instance_placements = {}
+
+        def _instance_placement(nauo):
+            if nauo not in instance_placements:
+                trsf = gp_Trsf()
+                relationship = placements.get(nauo)
+                if relationship is not None:
+                    factors = StepData_Factors()
+                    actor.PrepareUnits(relationship.Rep1(), transient_process, factors)
+                    actor.ComputeSRRWT(relationship, transient_process, trsf, factors)
+                instance_placements[nauo] = trsf
+            return instance_placements[nauo]
+
+        result = []
+        for path, shape, nauos in subtrees:
+            placement = gp_Trsf()
+            for nauo in nauos:
+                placement.Multiply(_instance_placement(nauo))
+            result.append((path, shape.Moved(TopLoc_Location(placement)), placement))
+        return result
+
+
 def read_step_file_with_names_colors(filename: str):
     """Returns list of tuples (topods_shape, label, color)
     Use OCAF.
@@ -204,16 +606,17 @@ def read_step_file_with_names_colors(filename: str):
     # layer_tool = XCAFDoc_DocumentTool_LayerTool(doc.Main())
     # mat_tool = XCAFDoc_DocumentTool_MaterialTool(doc.Main())
 
-    step_reader = STEPCAFControl_Reader()
-    step_reader.SetColorMode(True)
-    step_reader.SetLayerMode(True)
-    step_reader.SetNameMode(True)
-    step_reader.SetMatMode(True)
-    step_reader.SetGDTMode(True)
+    with _translation_parameters():
+        step_reader = STEPCAFControl_Reader()
+        step_reader.SetColorMode(True)
+        step_reader.SetLayerMode(True)
+        step_reader.SetNameMode(True)
+        step_reader.SetMatMode(True)
+        step_reader.SetGDTMode(True)
 
-    status = step_reader.ReadFile(filename)
-    if status == IFSelect_RetDone:
-        step_reader.Transfer(doc)
+        status = step_reader.ReadFile(filename)
+        if status == IFSelect_RetDone:
+            step_reader.Transfer(doc)
 
     locs = []
 
@@ -428,6 +831,218 @@ def read_stl_file(filename: str):
     return the_shape
 
 
+def read_stl_file_as_mesh(
+    filename: str,
+    merge_angle: float = math.pi / 2.0,
+    merge_tolerance: float = 0.0,
+    as_numpy: bool = False,
+):
+    """Read an ascii or binary STL file without building any BRep topology.
+
+    Contrary to read_stl_file, that creates one TopoDS_Face per triangle, the
+    file is loaded into a single Poly_Triangulation. The result can directly
+    be passed to MeshDS_DataSource or to the viewers DisplayMesh method.
+
+    Args:
+        filename: Path to the STL file to read
+        merge_angle: Coincident nodes are merged if the angle between the
+                     triangles they belong to is lower than this value, in radians.
+                     The default, pi/2, merges all coincident nodes.
+        merge_tolerance: If strictly positive, nodes closer than this distance
+                         are merged as well. Defaults to 0.
+        as_numpy: If True, return a (vertices, triangles) pair of numpy arrays
+                  instead of a Poly_Triangulation. Defaults to False.
+
+    Returns:
+        Either a Poly_Triangulation or a (N, 3) float64 vertices array and
+        a (M, 3) int32 array of zero based triangle indices
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist
+        IOError: If the file can't be read
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"{filename} not found.")
+
+    triangulation = rwstl.ReadFile(filename, merge_angle)
+    if triangulation is None:
+        raise IOError(f"Error while reading STL file {filename}.")
+
+    if merge_tolerance <= 0.0 and not as_numpy:
+        return triangulation
+
+    vertices, triangles = triangulation_to_numpy(triangulation)
+    if merge_tolerance > 0.0:
+        vertices, triangles = merge_vertices(vertices, triangles, merge_tolerance)
+    if as_numpy:
+        return vertices, triangles
+    return numpy_to_triangulation(vertices, triangles)
+
+
+# size of the write buffer used by the mesh exporters
+MESH_EXPORT_BUFFER_SIZE = 16 * 1024 * 1024
+# number of triangles converted at once by the mesh exporters
+MESH_EXPORT_CHUNK_SIZE = 1000000
+
+# layout of a binary STL triangle record
+STL_BINARY_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+def _iter_numpy_meshes(meshes, linear_deflection, angular_deflection, parallel):
+    """yields (vertices, triangles) for each mesh. The TopoDS_Shape instances
+    that don't carry any triangulation are all meshed at once, in parallel"""
+    if not isinstance(meshes, list):
+        meshes = [meshes]
+    shapes = [mesh for mesh in meshes if isinstance(mesh, TopoDS_Shape)]
+    if shapes:
+        mesh_shapes(shapes, linear_deflection, angular_deflection, parallel)
+    for mesh in meshes:
+        yield to_numpy_mesh(mesh)
+
+
+def write_stl_mesh_file(
+    meshes,
+    filename: str,
+    linear_deflection: float = 0.9,
+    angular_deflection: float = 0.5,
+    parallel: bool = True,
+) -> None:
+    """Export one or several meshes to a binary STL file.
+
+    Contrary to write_stl_file, existing triangulations are reused and the
+    file is written sequentially through a large buffer, by chunks of
+    triangles converted with numpy.
+
+    Args:
+        meshes: a mesh, or a list of meshes. Each mesh is either a
+                (vertices, triangles) pair of numpy arrays, a Poly_Triangulation,
+                a computed ShapeTesselator or a TopoDS_Shape
+        filename: Target STL file path
+        linear_deflection: Linear deflection used to mesh the shapes that
+                           don't have any triangulation yet. Defaults to 0.9
+        angular_deflection: Angular deflection used to mesh the shapes that
+                            don't have any triangulation yet. Defaults to 0.5
+        parallel: If True, shapes are meshed in parallel. Defaults to True
+
+    Raises:
+        IOError: If export fails
+    """
+    if os.path.isfile(filename):
+        print(f"Warning: {filename} already exists and will be replaced")
+
+    nb_triangles = 0
+    with open(filename, "wb", buffering=MESH_EXPORT_BUFFER_SIZE) as stl_file:
+        # the header must not start with 'solid', the triangle count
+        # is updated when all triangles are written
+        stl_file.write(b"pythonocc binary STL export".ljust(80, b" "))
+        stl_file.write(struct.pack("<I", 0))
+        for vertices, triangles in _iter_numpy_meshes(
+            meshes, linear_deflection, angular_deflection, parallel
+        ):
+            for start in range(0, len(triangles), MESH_EXPORT_CHUNK_SIZE):
+                corners = vertices[triangles[start : start + MESH_EXPORT_CHUNK_SIZE]]
+                normals = np.cross(
+                    corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+                )
+                lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+                np.divide(normals, lengths, out=normals, where=lengths > 0.0)
+                records = np.zeros(len(corners), dtype=STL_BINARY_RECORD)
+                records["normal"] = normals
+                records["vertices"] = corners
+                stl_file.write(records.tobytes())
+                nb_triangles += len(corners)
+        stl_file.seek(80)
+        stl_file.write(struct.pack("<I", nb_triangles))
+
+    if not os.path.isfile(filename):
+        raise IOError("File not written to disk.")
+
+
+def write_3mf_file(
+    meshes,
+    filename: str,
+    unit: str = "millimeter",
+    linear_deflection: float = 0.9,
+    angular_deflection: float = 0.5,
+    parallel: bool = True,
+) -> None:
+    """Export one or several meshes to a 3MF file, one object per mesh.
+
+    Args:
+        meshes: a mesh, or a list of meshes, see write_stl_mesh_file
+        filename: Target 3MF file path
+        unit: the 3MF model unit. Defaults to "millimeter"
+        linear_deflection, angular_deflection, parallel: meshing parameters
+            for the shapes that don't have any triangulation yet
+
+    Raises:
+        IOError: If export fails
+    """
+    if os.path.isfile(filename):
+        print(f"Warning: {filename} already exists and will be replaced")
+
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="model" '
+        'ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+        "</Types>"
+    )
+    relationships = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Target="/3D/3dmodel.model" Id="rel0" '
+        'Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+        "</Relationships>"
+    )
+
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", relationships)
+        with archive.open("3D/3dmodel.model", "w", force_zip64=True) as raw_stream:
+            model = io.TextIOWrapper(raw_stream, encoding="utf-8")
+            model.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<model unit="{unit}" xml:lang="en-US" '
+                'xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+                "<resources>\n"
+            )
+            nb_objects = 0
+            for vertices, triangles in _iter_numpy_meshes(
+                meshes, linear_deflection, angular_deflection, parallel
+            ):
+                nb_objects += 1
+                model.write(f'<object id="{nb_objects}" type="model"><mesh>\n')
+                model.write("<vertices>\n")
+                for start in range(0, len(vertices), MESH_EXPORT_CHUNK_SIZE):
+                    np.savetxt(
+                        model,
+                        vertices[start : start + MESH_EXPORT_CHUNK_SIZE],
+                        fmt='<vertex x="%.9g" y="%.9g" z="%.9g"/>',
+                    )
+                model.write("</vertices>\n<triangles>\n")
+                for start in range(0, len(triangles), MESH_EXPORT_CHUNK_SIZE):
+                    np.savetxt(
+                        model,
+                        triangles[start : start + MESH_EXPORT_CHUNK_SIZE],
+                        fmt='<triangle v1="%d" v2="%d" v3="%d"/>',
+                    )
+                model.write("</triangles>\n</mesh></object>\n")
+            model.write("</resources>\n<build>\n")
+            for object_id in range(1, nb_objects + 1):
+                model.write(f'<item objectid="{object_id}"/>\n')
+            model.write("</build>\n</model>\n")
+            model.flush()
+            model.detach()
+
+    if not os.path.isfile(filename):
+        raise IOError("File not written to disk.")
+
+
 ######################
 # IGES import/export #
 ######################
@@ -446,21 +1061,22 @@ def read_iges_file(
     if not os.path.isfile(filename):
         raise FileNotFoundError(f"{filename} not found.")
 
-    IGESControl_Controller.Init()
+    with _translation_parameters():
+        IGESControl_Controller.Init()
 
-    iges_reader = IGESControl_Reader()
-    iges_reader.SetReadVisible(visible_only)
-    status = iges_reader.ReadFile(filename)
+        iges_reader = IGESControl_Reader()
+        iges_reader.SetReadVisible(visible_only)
+        status = iges_reader.ReadFile(filename)
 
-    if status != IFSelect_RetDone:  # check status
-        raise IOError("Cannot read IGES file")
+        if status != IFSelect_RetDone:  # check status
+            raise IOError("Cannot read IGES file")
 
-    if verbosity:
-        failsonly = False
-        iges_reader.PrintCheckLoad(failsonly, IFSelect_ItemsByEntity)
-        iges_reader.PrintCheckTransfer(failsonly, IFSelect_ItemsByEntity)
-    iges_reader.ClearShapes()
-    iges_reader.TransferRoots()
+        if verbosity:
+            failsonly = False
+            iges_reader.PrintCheckLoad(failsonly, IFSelect_ItemsByEntity)
+            iges_reader.PrintCheckTransfer(failsonly, IFSelect_ItemsByEntity)
+        iges_reader.ClearShapes()
+        iges_reader.TransferRoots()
     nbr = iges_reader.NbShapes()
 
     _shapes = []
@@ -493,9 +1109,10 @@ def write_iges_file(a_shape: TopoDS_Shape, filename: str):
     if os.path.isfile(filename):
         print(f"Warning: {filename} already exists and will be replaced")
     # create and initialize the step exporter
-    iges_writer = IGESControl_Writer()
-    iges_writer.AddShape(a_shape)
-    status = iges_writer.Write(filename)
+    with _translation_parameters():
+        iges_writer = IGESControl_Writer()
+        iges_writer.AddShape(a_shape)
+        status = iges_writer.Write(filename)
 
     if status != IFSelect_RetDone:
         raise AssertionError("Not done.")
@@ -531,6 +1148,38 @@ def edge_to_svg_polyline(topods_edge: TopoDS_Edge, tol: float = 0.1, unit: str =
     return svgwrite.shapes.Polyline(points_2d, fill="none"), box2d
 
 
+def edges_to_svg_polylines(
+    topods_edges: List[TopoDS_Edge], tol: float = 0.1, unit: str = "mm"
+) -> List[Tuple[Any, Bnd_Box2d]]:
+    """Same as edge_to_svg_polyline, for a list of edges discretized in one
+    batch. Returns a list of (svgwrite.Polyline, 2d bounding box) pairs"""
+    check_svgwrite_installed()
+
+    unit_factor = 1e3 if unit == "m" else 1
+
+    points_3d, offsets = discretize_edges(topods_edges, tol)
+    # we take only the first 2 coordinates (x and y, leave z)
+    points_2d = points_3d[:, :2] * unit_factor
+    points_2d[:, 0] *= -1
+    polylines = []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        edge_points = points_2d[start:end]
+        box2d = Bnd_Box2d()
+        if len(edge_points):
+            x_min, y_min = edge_points.min(axis=0)
+            x_max, y_max = edge_points.max(axis=0)
+            box2d.Update(x_min, y_min, x_max, y_max)
+        polylines.append(
+            (
+                svgwrite.shapes.Polyline(
+                    [tuple(point) for point in edge_points.tolist()], fill="none"
+                ),
+                box2d,
+            )
+        )
+    return polylines
+
+
 def export_shape_to_svg(
     shape: TopoDS_Shape,
     filename: str = None,
@@ -544,6 +1193,7 @@ def export_shape_to_svg(
     color: str = "black",
     line_width: str = "1px",
     unit: str = "mm",
+    hlr_algorithm: str = "exact",
 ):
     """export a single shape to an svg file and/or string.
     shape: the TopoDS_Shape to export
@@ -555,6 +1205,8 @@ def export_shape_to_svg(
     direction (optional): to set up the projector direction
     color (optional), "default to "black".
     line_width (optional, default to 1): an integer
+    hlr_algorithm (optional): "exact", or "poly" for the faster hidden line
+    removal of the triangulation, see get_sorted_hlr_edges
     """
     check_svgwrite_installed()
 
@@ -567,6 +1219,7 @@ def export_shape_to_svg(
         position=location,
         direction=direction,
         export_hidden_edges=export_hidden_edges,
+        algorithm=hlr_algorithm,
     )
 
     # compute polylines for all edges
@@ -576,17 +1229,15 @@ def export_shape_to_svg(
     global_2d_bounding_box = Bnd_Box2d()
 
     polylines = []
-    for visible_edge in visible_edges:
-        visible_svg_line, visible_edge_box2d = edge_to_svg_polyline(
-            visible_edge, 0.1, unit
-        )
+    for visible_svg_line, visible_edge_box2d in edges_to_svg_polylines(
+        visible_edges, 0.1, unit
+    ):
         polylines.append(visible_svg_line)
         global_2d_bounding_box.Add(visible_edge_box2d)
     if export_hidden_edges:
-        for hidden_edge in hidden_edges:
-            hidden_svg_line, hidden_edge_box2d = edge_to_svg_polyline(
-                hidden_edge, 0.1, unit
-            )
+        for hidden_svg_line, hidden_edge_box2d in edges_to_svg_polylines(
+            hidden_edges, 0.1, unit
+        ):
             # hidden lines are dashed style
             hidden_svg_line.dasharray([5, 5])
             polylines.append(hidden_svg_line)
@@ -753,3 +1404,59 @@ def write_gltf_file(a_shape: TopoDS_Shape, gltf_filename: str, binary=True):
 
     if status != IFSelect_RetDone:
         raise IOError("Error while writing shape to GLTF file.")
+
+
+#######################
+# Binary BRep batches #
+#######################
+def shapes_to_bytes(shapes: List[TopoDS_Shape], with_triangles: bool = True) -> bytes:
+    """Serialize a list of shapes to one single binary BRep (BinTools) stream.
+
+    The shapes are gathered into a compound, so that the sub-shapes and the
+    geometry shared by several shapes are written only once.
+
+    Args:
+        shapes: the shapes to serialize
+        with_triangles: if False, the triangulations are not written
+
+    Returns:
+        the binary stream, to be read back with shapes_from_bytes
+    """
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        if shape.IsNull():
+            raise AssertionError("Can't serialize a null shape.")
+        builder.Add(compound, shape)
+    return bintools.WriteToBytes(compound, with_triangles)
+
+
+def shapes_from_bytes(data) -> List[TopoDS_Shape]:
+    """Read back the list of shapes serialized by shapes_to_bytes.
+
+    data can be any bytes-like object (bytes, memoryview, mmap...).
+    """
+    return compound_children(bintools.ReadFromBytes(data))
+
+
+def _shape_batch_from_bytes(data) -> "ShapeBatch":
+    return ShapeBatch(shapes_from_bytes(data))
+
+
+class ShapeBatch(list):
+    """A list of shapes that pickles as one single binary BRep stream.
+
+    Pickling shapes one by one writes the geometry they share once per
+    shape. A ShapeBatch writes it once for the whole list, which is what
+    should be sent to multiprocessing workers.
+    """
+
+    # if False, the triangulations are not pickled
+    with_triangles = True
+
+    def __reduce__(self):
+        return (
+            _shape_batch_from_bytes,
+            (shapes_to_bytes(self, self.with_triangles),),
+        )
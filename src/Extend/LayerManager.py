@@ -17,6 +17,7 @@
 
 from OCC.Core.Graphic3d import Graphic3d_NOM_DEFAULT
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 class Layer:
@@ -98,7 +99,12 @@ class Layer:
         -------
         None
         """
-        shape_moved = BRepBuilderAPI_Transform(shape, transformations, True).Shape()
+        # a rigid transformation only changes the location, the geometry is
+        # shared with the original shape
+        try:
+            shape_moved = shape.Moved(TopLoc_Location(transformations), True)
+        except RuntimeError:
+            shape_moved = BRepBuilderAPI_Transform(shape, transformations, True).Shape()
         self.replace_shape(shape_moved, index)
 
     def merge(self, layer, clear=False):
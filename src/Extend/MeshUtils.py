@@ -0,0 +1,250 @@
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Conversions between OCCT triangulations and numpy arrays.
+
+Meshes are exchanged as a pair of arrays:
+
+* ``vertices``: a (N, 3) float64 array of node coordinates
+* ``triangles``: a (M, 3) int32 array of zero based node indices
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from OCC.Core.BRep import BRep_Builder, BRep_Tool
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.Poly import Poly_Triangulation, Poly_Array1OfTriangle
+from OCC.Core.TColgp import TColgp_Array1OfPnt
+from OCC.Core.Tesselator import ShapeTesselator
+from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Face, TopoDS_Shape, topods
+
+
+def trsf_to_numpy_matrix(trsf) -> np.ndarray:
+    """Return the 4x4 homogeneous matrix of a gp_Trsf"""
+    matrix = np.eye(4)
+    for row in range(3):
+        for col in range(4):
+            matrix[row, col] = trsf.Value(row + 1, col + 1)
+    return matrix
+
+
+def transform_points(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Apply a 4x4 homogeneous matrix to a (N, 3) array of points"""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def triangulation_to_numpy(
+    triangulation: Poly_Triangulation,
+    location: Optional[TopLoc_Location] = None,
+    reversed_orientation: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a Poly_Triangulation to a (vertices, triangles) pair of arrays.
+
+    Args:
+        triangulation: the triangulation to convert
+        location: if provided, nodes are moved to this location
+        reversed_orientation: if True, the triangle winding is flipped, which
+            is what a REVERSED face requires
+
+    Returns:
+        a (N, 3) float64 vertices array and a (M, 3) int32 triangles array
+    """
+    if triangulation is None or triangulation.NbNodes() == 0:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int32)
+    # the nodes and triangles are copied in one native call each
+    vertices = triangulation.MapNodeArray().to_numpy_array()
+    triangles = triangulation.MapTriangleArray().to_numpy_array().astype(np.int32) - 1
+    if location is not None and not location.IsIdentity():
+        vertices = transform_points(
+            vertices, trsf_to_numpy_matrix(location.Transformation())
+        )
+    if reversed_orientation:
+        triangles = triangles[:, ::-1]
+    return vertices, np.ascontiguousarray(triangles)
+
+
+def numpy_to_triangulation(
+    vertices: np.ndarray, triangles: np.ndarray
+) -> Poly_Triangulation:
+    """Build a Poly_Triangulation from a (vertices, triangles) pair of arrays"""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    triangles = np.ascontiguousarray(triangles, dtype=np.int64)
+    if vertices.ndim != 2 or vertices.shape[1] != 3:
+        raise AssertionError("vertices must be a (N, 3) array")
+    if triangles.ndim != 2 or triangles.shape[1] != 3:
+        raise AssertionError("triangles must be a (M, 3) array")
+    nodes = TColgp_Array1OfPnt.from_numpy_array(vertices)
+    # Poly_Triangle indices are one based
+    trias = Poly_Array1OfTriangle.from_numpy_array(triangles + 1)
+    return Poly_Triangulation(nodes, trias)
+
+
+def merge_vertices(
+    vertices: np.ndarray, triangles: np.ndarray, tolerance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge coincident vertices and drop the triangles that become degenerated.
+
+    Args:
+        vertices: (N, 3) array of node coordinates
+        triangles: (M, 3) array of zero based node indices
+        tolerance: vertices that fall in the same cell of a grid of this size
+            are merged. If 0., only strictly equal vertices are merged
+
+    Returns:
+        the merged (vertices, triangles) pair
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if tolerance > 0.0:
+        keys = np.round(vertices / tolerance).astype(np.int64)
+    else:
+        keys = vertices
+    _, first_index, inverse = np.unique(
+        keys, axis=0, return_index=True, return_inverse=True
+    )
+    merged_vertices = vertices[first_index]
+    merged_triangles = inverse.reshape(-1)[triangles].astype(np.int32)
+    is_valid = (
+        (merged_triangles[:, 0] != merged_triangles[:, 1])
+        & (merged_triangles[:, 1] != merged_triangles[:, 2])
+        & (merged_triangles[:, 2] != merged_triangles[:, 0])
+    )
+    return merged_vertices, np.ascontiguousarray(merged_triangles[is_valid])
+
+
+def triangulation_to_face(triangulation: Poly_Triangulation) -> TopoDS_Face:
+    """Wrap a triangulation into a single TopoDS_Face without any surface.
+
+    Such a face can be passed to any viewer DisplayShape method, and costs one
+    topological entity instead of one face per triangle.
+    """
+    face = TopoDS_Face()
+    BRep_Builder().MakeFace(face, triangulation)
+    return face
+
+
+def has_triangulation(shape: TopoDS_Shape) -> bool:
+    """Return True if all the faces of the shape already carry a triangulation"""
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        location = TopLoc_Location()
+        if BRep_Tool.Triangulation(topods.Face(explorer.Current()), location) is None:
+            return False
+        explorer.Next()
+    return True
+
+
+def mesh_shapes(
+    shapes: List[TopoDS_Shape],
+    linear_deflection: float = 0.9,
+    angular_deflection: float = 0.5,
+    parallel: bool = True,
+    only_if_needed: bool = True,
+) -> None:
+    """Mesh a list of shapes in place, within one single BRepMesh call.
+
+    All the shapes are gathered into a compound so that, if parallel is True,
+    BRepMesh dispatches the faces of all the solids over all the available cores.
+    If only_if_needed is True, shapes that already carry a triangulation
+    are left untouched.
+    """
+    if only_if_needed:
+        shapes = [shp for shp in shapes if not has_triangulation(shp)]
+    if not shapes:
+        return
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shp in shapes:
+        builder.Add(compound, shp)
+    # the constructor performs the meshing
+    mesh = BRepMesh_IncrementalMesh(
+        compound, linear_deflection, False, angular_deflection, parallel
+    )
+    if not mesh.IsDone():
+        raise AssertionError("Mesh is not done.")
+
+
+def shape_to_numpy(shape: TopoDS_Shape) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather the existing triangulations of all the faces of a shape.
+
+    Face locations and orientations are taken into account. Faces without any
+    triangulation are skipped, use mesh_shapes first if required.
+
+    Returns:
+        a (N, 3) float64 vertices array and a (M, 3) int32 triangles array
+    """
+    all_vertices = []
+    all_triangles = []
+    offset = 0
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        face = topods.Face(explorer.Current())
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation(face, location)
+        if triangulation is not None:
+            vertices, triangles = triangulation_to_numpy(
+                triangulation, location, face.Orientation() == TopAbs_REVERSED
+            )
+            all_vertices.append(vertices)
+            all_triangles.append(triangles + offset)
+            offset += len(vertices)
+        explorer.Next()
+    if not all_vertices:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int32)
+    return np.concatenate(all_vertices), np.concatenate(all_triangles)
+
+
+def tesselator_to_numpy(tesselator: ShapeTesselator) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert the output of a computed ShapeTesselator to numpy arrays.
+
+    The tesselator exports a triangle soup, i.e. three distinct vertices
+    per triangle. Use merge_vertices to get an indexed mesh.
+    """
+    vertices = np.array(tesselator.GetVerticesPositionAsTuple(), dtype=np.float64)
+    vertices = vertices.reshape(-1, 3)
+    triangles = np.arange(len(vertices), dtype=np.int32).reshape(-1, 3)
+    return vertices, triangles
+
+
+def to_numpy_mesh(
+    mesh: Union[
+        Tuple[np.ndarray, np.ndarray],
+        Poly_Triangulation,
+        ShapeTesselator,
+        TopoDS_Shape,
+    ],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (vertices, triangles) arrays of any supported mesh container:
+    a (vertices, triangles) pair, a Poly_Triangulation, a computed
+    ShapeTesselator or a TopoDS_Shape that was already meshed."""
+    if isinstance(mesh, tuple):
+        vertices, triangles = mesh
+        return np.asarray(vertices, dtype=np.float64), np.asarray(
+            triangles, dtype=np.int32
+        )
+    if isinstance(mesh, Poly_Triangulation):
+        return triangulation_to_numpy(mesh)
+    if isinstance(mesh, ShapeTesselator):
+        return tesselator_to_numpy(mesh)
+    if isinstance(mesh, TopoDS_Shape):
+        return shape_to_numpy(mesh)
+    raise TypeError(f"Can't convert {type(mesh)} to a numpy mesh")
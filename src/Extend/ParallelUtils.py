@@ -0,0 +1,251 @@
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Share shapes between the processes of a process pool.
+
+The wrapped OCCT calls hold the GIL, so CPU bound work on many shapes scales
+with processes rather than with threads. Sending the shapes to each worker
+through the executor pipes serializes one copy per task. A SharedShapeStore
+writes the binary BRep of the shapes once into a memory-mapped file, that
+the workers open by name and read by key without any copy through the pipes.
+
+Example:
+
+    def volume(shape):
+        props = GProp_GProps()
+        brepgprop.VolumeProperties(shape, props)
+        return props.Mass()
+
+    with SharedShapeStore.create({"part1": shp1, "part2": shp2}) as store:
+        volumes = map_shapes(volume, store)
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+from OCC.Core.BinTools import bintools
+from OCC.Core.TopoDS import TopoDS_Shape
+
+# file header: magic number, then the length of the json index
+_STORE_MAGIC = b"OCCSHP01"
+_STORE_HEADER = struct.Struct("<8sQ")
+
+
+def _default_store_directory() -> str:
+    """On Linux, files in /dev/shm are backed by shared memory only"""
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+class SharedShapeStore:
+    """A read only set of shapes, stored as binary BRep in a memory-mapped file.
+
+    Use SharedShapeStore.create to write a new store. The process that creates
+    the store owns the file, and removes it on close. Any other process opens
+    the store from its filename, pickling a store only sends its filename.
+    The shapes read from the store are cached, by key, in each process.
+    """
+
+    def __init__(self, filename: str) -> None:
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(f"Shape store not found: {filename}")
+        self.filename = filename
+        self._owner = False
+        self._cache = {}
+        with open(filename, "rb") as store_file:
+            self._mmap = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_size = _STORE_HEADER.unpack_from(self._mmap, 0)
+        if magic != _STORE_MAGIC:
+            self._mmap.close()
+            raise IOError(f"{filename} is not a shape store.")
+        index_start = _STORE_HEADER.size
+        self._index = json.loads(
+            self._mmap[index_start : index_start + index_size].decode("utf-8")
+        )
+        # offsets in the index are relative to the end of the index
+        self._data_start = index_start + index_size
+
+    @classmethod
+    def create(
+        cls,
+        shapes: Mapping[str, TopoDS_Shape],
+        filename: Optional[str] = None,
+        with_triangles: bool = True,
+    ) -> "SharedShapeStore":
+        """Write the shapes to a new store.
+
+        Args:
+            shapes: a mapping from keys to shapes. The keys are converted
+                    to str, the store is read with either form of the key
+            filename: the store file. If None, a temporary file is created,
+                      in shared memory if available
+            with_triangles: if False, the triangulations are not stored
+
+        Returns:
+            the store, owned by the calling process
+        """
+        blobs = []
+        index = {}
+        offset = 0
+        for key, shape in shapes.items():
+            if shape.IsNull():
+                raise AssertionError(f"Shape {key} is null.")
+            if str(key) in index:
+                raise AssertionError(f"Duplicate key {key} once converted to str.")
+            blob = bintools.WriteToBytes(shape, with_triangles)
+            index[str(key)] = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+        json_index = json.dumps(index).encode("utf-8")
+        if filename is None:
+            file_descriptor, filename = tempfile.mkstemp(
+                prefix="occ_shapes_", suffix=".bin", dir=_default_store_directory()
+            )
+            os.close(file_descriptor)
+        with open(filename, "wb") as store_file:
+            store_file.write(_STORE_HEADER.pack(_STORE_MAGIC, len(json_index)))
+            store_file.write(json_index)
+            for blob in blobs:
+                store_file.write(blob)
+        store = cls(filename)
+        store._owner = True
+        return store
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return str(key) in self._index
+
+    def __getitem__(self, key: str) -> TopoDS_Shape:
+        # the index keys are str, as written by create
+        key = str(key)
+        if key not in self._cache:
+            if key not in self._index:
+                raise KeyError(key)
+            offset, size = self._index[key]
+            start = self._data_start + offset
+            # the shape is read straight from the mapped memory
+            with memoryview(self._mmap) as buffer:
+                self._cache[key] = bintools.ReadFromBytes(buffer[start : start + size])
+        return self._cache[key]
+
+    def nbytes(self, key: str) -> int:
+        """Return the size of the binary BRep of a shape"""
+        return self._index[str(key)][1]
+
+    def close(self) -> None:
+        """Unmap the store. If the calling process owns the store, the file is
+        removed"""
+        self._cache.clear()
+        if not self._mmap.closed:
+            self._mmap.close()
+        if self._owner and os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+    def __enter__(self) -> "SharedShapeStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # only the filename goes through the pipes
+        return (SharedShapeStore, (self.filename,))
+
+
+########################
+# Process pool helpers #
+########################
+# the store opened by the initializer of each worker process
+_worker_store = None
+
+
+def _init_worker(filename: str) -> None:
+    global _worker_store
+    _worker_store = SharedShapeStore(filename)
+
+
+def get_worker_store() -> SharedShapeStore:
+    """Return the store opened by the current worker of a store_executor"""
+    if _worker_store is None:
+        raise AssertionError("Not called from a store_executor worker.")
+    return _worker_store
+
+
+def store_executor(
+    store: SharedShapeStore, max_workers: Optional[int] = None, **kwargs
+) -> ProcessPoolExecutor:
+    """Return a ProcessPoolExecutor whose workers open the store once, at
+    start up. In the submitted functions, get_worker_store() returns it.
+
+    The other keyword arguments are passed to ProcessPoolExecutor.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(store.filename,),
+        **kwargs,
+    )
+
+
+def _apply_to_stored_shape(func: Callable, key: str, args: tuple) -> Any:
+    return func(get_worker_store()[key], *args)
+
+
+def map_shapes(
+    func: Callable,
+    store: SharedShapeStore,
+    keys: Optional[Iterable[str]] = None,
+    args: tuple = (),
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Any]:
+    """Call func(shape, *args) for the shapes of the store, in a process pool.
+
+    Args:
+        func: a picklable function, i.e. defined at the top level of a module
+        store: the shape store
+        keys: the keys of the shapes to process. Defaults to all the keys
+        args: extra arguments passed to func
+        max_workers: the number of processes, defaults to the number of cores
+        chunksize: the number of keys sent to a worker at a time
+
+    Returns:
+        the list of results, in the order of the keys
+    """
+    keys = store.keys() if keys is None else list(keys)
+    with store_executor(store, max_workers) as executor:
+        return list(
+            executor.map(
+                _apply_to_stored_shape,
+                repeat(func),
+                keys,
+                repeat(args),
+                chunksize=chunksize,
+            )
+        )
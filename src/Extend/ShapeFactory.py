@@ -15,8 +15,11 @@
 ##You should have received a copy of the GNU Lesser General Public License
 ##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
 
+import hashlib
 from math import radians
 
+import numpy as np
+
 from OCC.Core.BRepBndLib import brepbndlib
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakePrism
 from OCC.Core.BRepBuilderAPI import (
@@ -25,6 +28,7 @@ from OCC.Core.BRepBuilderAPI import (
     BRepBuilderAPI_MakeWire,
     BRepBuilderAPI_MakeFace,
     BRepBuilderAPI_MakeEdge2d,
+    BRepBuilderAPI_MakePolygon,
     BRepBuilderAPI_Transform,
 )
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_GTransform
@@ -32,6 +36,7 @@ from OCC.Core.BRepFill import BRepFill_Filling
 from OCC.Core.Bnd import Bnd_Box, Bnd_OBB
 from OCC.Core.GeomAbs import (
     GeomAbs_C0,
+    GeomAbs_C2,
     GeomAbs_Plane,
     GeomAbs_Cylinder,
     GeomAbs_Cone,
@@ -49,7 +54,8 @@ from OCC.Core.GeomAPI import GeomAPI_PointsToBSpline
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.TColgp import TColgp_Array1OfPnt
-from OCC.Core.TopoDS import TopoDS_Face
+from OCC.Core.TopAbs import TopAbs_FORWARD
+from OCC.Core.TopoDS import TopoDS_Face, TopoDS_Shape
 from OCC.Core.gp import (
     gp,
     gp_Vec,
@@ -63,7 +69,13 @@ from OCC.Core.gp import (
 )
 from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 
-from OCC.Extend.TopologyUtils import is_edge, is_face
+from OCC.Extend.TopologyUtils import (
+    TopologyExplorer,
+    compound_children,
+    is_edge,
+    is_face,
+    list_of_shapes_to_compound,
+)
 
 
 #
@@ -80,12 +92,33 @@ def assert_isdone(inst, message):
 
 
 def point_list_to_TColgp_Array1OfPnt(li):
+    """li: a list of gp_Pnt, or a (N, 3) numpy array, copied in one call"""
+    if isinstance(li, np.ndarray):
+        return TColgp_Array1OfPnt.from_numpy_array(_as_points_array(li))
     pts = TColgp_Array1OfPnt(0, len(li) - 1)
     for n, i in enumerate(li):
         pts.SetValue(n, i)
     return pts
 
 
+def _as_points_array(points):
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise AssertionError("points must be a (N, 3) array")
+    return points
+
+
+def _as_offsets_array(offsets, nb_points):
+    offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+    if offsets.ndim != 1 or len(offsets) < 1:
+        raise AssertionError("offsets must be a 1d array")
+    if offsets[0] != 0 or offsets[-1] != nb_points or np.any(np.diff(offsets) < 0):
+        raise AssertionError(
+            "offsets must increase from 0 to the number of points, included"
+        )
+    return offsets
+
+
 #
 # 0D
 def make_vertex(*args):
@@ -110,6 +143,9 @@ def make_edge2d(*args):
 
 
 def make_wire(*args):
+    # if we get a (N, 3) array of points, build the polyline
+    if isinstance(args[0], np.ndarray):
+        return make_polylines(args[0], [0, len(args[0])])[0]
     # if we get an iterable, than add all edges to wire builder
     if isinstance(args[0], (list, tuple)):
         wire = BRepBuilderAPI_MakeWire()
@@ -123,13 +159,67 @@ def make_wire(*args):
 
 
 def points_to_bspline(pnts):
-    pts = TColgp_Array1OfPnt(0, len(pnts) - 1)
-    for n, i in enumerate(pnts):
-        pts.SetValue(n, i)
+    """pnts: a list of gp_Pnt, or a (N, 3) numpy array"""
+    pts = point_list_to_TColgp_Array1OfPnt(pnts)
     crv = GeomAPI_PointsToBSpline(pts)
     return crv.Curve()
 
 
+def stack_ragged_points(point_arrays):
+    """Stack a list of (Ni, 3) arrays of points into the (points, offsets)
+    pair of arrays expected by make_polylines and make_bspline_edges"""
+    point_arrays = [_as_points_array(arr) for arr in point_arrays]
+    offsets = np.zeros(len(point_arrays) + 1, dtype=np.int64)
+    np.cumsum([len(arr) for arr in point_arrays], out=offsets[1:])
+    if not point_arrays:
+        return np.empty((0, 3), dtype=np.float64), offsets
+    return np.concatenate(point_arrays), offsets
+
+
+def make_polylines(points, offsets, closed=False, parallel=True):
+    """Build many polygonal wires at once, natively and in parallel
+
+    points: a (N, 3) array of all the points of all the polylines
+    offsets: the points of the polyline i are points[offsets[i]:offsets[i + 1]]
+    closed: if True, each wire is closed back to its first point
+    parallel: if False, the wires are built one after the other
+
+    returns the list of the TopoDS_Wire
+    """
+    points = _as_points_array(points)
+    offsets = _as_offsets_array(offsets, len(points))
+    return compound_children(
+        BRepBuilderAPI_MakePolygon.Polylines(points, offsets, closed, parallel)
+    )
+
+
+def make_bspline_edges(
+    points,
+    offsets,
+    deg_min=3,
+    deg_max=8,
+    continuity=GeomAbs_C2,
+    tol=1e-3,
+    parallel=True,
+):
+    """Build many BSpline edges at once, approximating each curve of points
+    with GeomAPI_PointsToBSpline, natively and in parallel
+
+    points: a (N, 3) array of all the points of all the curves
+    offsets: the points of the curve i are points[offsets[i]:offsets[i + 1]]
+    parallel: if False, the curves are approximated one after the other
+
+    returns the list of the TopoDS_Edge
+    """
+    points = _as_points_array(points)
+    offsets = _as_offsets_array(offsets, len(points))
+    return compound_children(
+        BRepBuilderAPI_MakeEdge.BSplineEdges(
+            points, offsets, deg_min, deg_max, continuity, tol, parallel
+        )
+    )
+
+
 def edge_to_bezier(topods_edge):
     """take an edge and returns:
     * a bool is_bezier
@@ -274,7 +364,7 @@ def midpoint(point_A, point_B):
     return gp_Pnt(mid.XYZ())
 
 
-def center_boundingbox(shape):
+def center_boundingbox(shape, cache=None):
     """compute the center point of a TopoDS_Shape, based on its bounding box
 
     Parameters
@@ -282,17 +372,20 @@ def center_boundingbox(shape):
 
     shape : TopoDS_Shape instance or a subclass like TopoDS_Face
 
+    cache : BoundingBoxCache, optional
+        if provided, the bounding box is taken from, or stored into, the cache
+
     Returns
     -------
 
     gp_Pnt
 
     """
-    xmin, ymin, zmin, xmax, ymax, zmax = get_boundingbox(shape, 1e-6)
+    xmin, ymin, zmin, xmax, ymax, zmax = get_boundingbox(shape, 1e-6, cache=cache)
     return midpoint(gp_Pnt(xmin, ymin, zmin), gp_Pnt(xmax, ymax, zmax))
 
 
-def get_boundingbox(shape, tol=1e-6, use_mesh=True):
+def get_boundingbox(shape, tol=1e-6, use_mesh=True, cache=None):
     """return the bounding box of the TopoDS_Shape `shape`
     Parameters
     ----------
@@ -303,7 +396,11 @@ def get_boundingbox(shape, tol=1e-6, use_mesh=True):
     use_mesh : bool
         a flag that tells whether or not the shape has first to be meshed before the bbox
         computation. This produces more accurate results
+    cache : BoundingBoxCache, optional
+        if provided, the bounding box is taken from, or stored into, the cache
     """
+    if cache is not None:
+        return cache.get(shape, tol, "mesh" if use_mesh else "control_points")
     bbox = Bnd_Box()
     bbox.SetGap(tol)
     if use_mesh:
@@ -319,6 +416,107 @@ def get_boundingbox(shape, tol=1e-6, use_mesh=True):
     return xmin, ymin, zmin, xmax, ymax, zmax
 
 
+# the methods of get_boundingboxes, and the BRepBndLib.BoundingBoxes method ids
+_BOUNDING_BOX_METHODS = {
+    "control_points": 0,
+    "triangulation": 1,
+    "mesh": 1,
+    "optimal": 2,
+}
+
+
+def get_boundingboxes(shapes, tol=1e-6, method="triangulation", parallel=True):
+    """return the bounding boxes of a list of shapes, computed in one native
+    call, in parallel across the shapes
+
+    Parameters
+    ----------
+    shapes : an iterable of TopoDS_Shape
+    tol : float
+        tolerance of the computed boundingboxes
+    method : str
+        "control_points": from the geometry only, the poles of the BSplines
+        bound the surfaces. The fastest, but may be a bit large
+        "triangulation": use the existing triangulations, the geometry for the
+        faces without any
+        "mesh": mesh all the shapes first, in one parallel BRepMesh call, as
+        get_boundingbox does
+        "optimal": the precise, and slower, brepbndlib.AddOptimal
+    parallel : bool
+
+    Returns
+    -------
+    a (N, 6) array of xmin, ymin, zmin, xmax, ymax, zmax, NaN for void boxes
+    """
+    if method not in _BOUNDING_BOX_METHODS:
+        raise AssertionError(f"Unknown bounding box method {method}")
+    compound, all_shapes_converted = list_of_shapes_to_compound(list(shapes))
+    if not all_shapes_converted:
+        raise AssertionError("Can't compute the bounding box of a null shape.")
+    if method == "mesh":
+        # the default deflections of BRepMesh_IncrementalMesh(), but parallel
+        # is set for this mesh only, not through the process wide default
+        mesh = BRepMesh_IncrementalMesh(compound, 0.001, False, 0.5, parallel)
+        if not mesh.IsDone():
+            raise AssertionError("Mesh not done.")
+    boxes = brepbndlib.BoundingBoxes(
+        compound, _BOUNDING_BOX_METHODS[method], tol, parallel
+    )
+    return np.frombuffer(boxes, dtype=np.float64).reshape(-1, 6)
+
+
+class BoundingBoxCache:
+    """Cache of the bounding boxes of shapes
+
+    The boxes are cached per shape, i.e. per TShape and location whatever
+    the orientation, and per tolerance and method of get_boundingboxes. The
+    cache keeps a reference to the shapes. A shape modified in place must
+    be invalidated.
+
+    >>> cache = BoundingBoxCache()
+    >>> xmin, ymin, zmin, xmax, ymax, zmax = cache.get(shape)
+    >>> center = center_boundingbox(shape, cache=cache)  # no new computation
+    """
+
+    def __init__(self):
+        self._boxes = {}
+
+    @staticmethod
+    def _key(shape, tol, method):
+        return shape.Oriented(TopAbs_FORWARD), tol, method
+
+    def get(self, shape, tol=1e-6, method="mesh"):
+        """return the xmin, ymin, zmin, xmax, ymax, zmax of the shape"""
+        return tuple(self.get_many([shape], tol, method)[0])
+
+    def get_many(self, shapes, tol=1e-6, method="mesh", parallel=True):
+        """return the (N, 6) array of the boxes of the shapes, the missing
+        ones being computed with one get_boundingboxes call"""
+        keys = [self._key(shape, tol, method) for shape in shapes]
+        missing = list({key: None for key in keys if key not in self._boxes})
+        if missing:
+            boxes = get_boundingboxes(
+                [key[0] for key in missing], tol, method, parallel
+            )
+            for key, box in zip(missing, boxes):
+                self._boxes[key] = tuple(box)
+        return np.array([self._boxes[key] for key in keys], dtype=np.float64).reshape(
+            -1, 6
+        )
+
+    def invalidate(self, shape):
+        """remove all the boxes of a shape from the cache"""
+        shape = shape.Oriented(TopAbs_FORWARD)
+        for key in [key for key in self._boxes if key[0] == shape]:
+            del self._boxes[key]
+
+    def clear(self):
+        self._boxes.clear()
+
+    def __len__(self):
+        return len(self._boxes)
+
+
 def translate_shp(shp, vec, copy=False):
     trns = gp_Trsf()
     trns.SetTranslation(vec)
@@ -327,6 +525,48 @@ def translate_shp(shp, vec, copy=False):
     return brep_trns.Shape()
 
 
+def place_shapes(shapes, matrices, compose=True):
+    """Place many shapes at once, by setting their TopLoc_Location only: the
+    geometry is shared, never copied, and the loop runs natively.
+
+    Parameters
+    ----------
+    shapes : a list of N TopoDS_Shape
+    matrices : a (N, 4, 4) or (N, 3, 4) array of rigid transformations, or a
+        single (4, 4) or (3, 4) matrix applied to all the shapes
+    compose : bool
+        if True, the transformations are composed with the current locations
+        of the shapes, as TopoDS_Shape.Moved does, else they replace them,
+        as TopoDS_Shape.Located does
+
+    Returns
+    -------
+    the list of the placed shapes
+    """
+    shapes = list(shapes)
+    matrices = np.asarray(matrices, dtype=np.float64)
+    if matrices.ndim == 2:
+        matrices = matrices[np.newaxis]
+    if matrices.ndim != 3 or matrices.shape[1:] not in ((4, 4), (3, 4)):
+        raise AssertionError("matrices must be (N, 4, 4) or (N, 3, 4) arrays")
+    matrices = np.ascontiguousarray(
+        np.broadcast_to(matrices[:, :3, :], (len(shapes), 3, 4))
+    )
+    return TopoDS_Shape.PlaceShapes(shapes, matrices, compose)
+
+
+def translate_shapes(shapes, vectors, compose=True):
+    """Translate many shapes at once, see place_shapes
+
+    vectors: a (N, 3) array of translations, or a single (3,) translation
+    """
+    shapes = list(shapes)
+    matrices = np.zeros((len(shapes), 3, 4))
+    matrices[:, :, :3] = np.eye(3)
+    matrices[:, :, 3] = vectors
+    return place_shapes(shapes, matrices, compose)
+
+
 def rotate_shape(shape, axis, angle, unite="deg"):
     """Rotate a shape around an axis, with a given angle.
 
@@ -458,6 +698,99 @@ def recognize_face(topods_face):
         return "Unknown", None, None
 
 
+# one record per face, see face_descriptors
+FACE_DESCRIPTOR_DTYPE = np.dtype(
+    [
+        ("surface_type", np.int32),
+        ("area", np.float64),
+        ("centroid", np.float64, (3,)),
+        ("bbox_min", np.float64, (3,)),
+        ("bbox_max", np.float64, (3,)),
+        ("direction", np.float64, (3,)),
+        ("nb_adjacent_faces", np.int32),
+    ]
+)
+
+
+def face_descriptors(shape, parallel=True):
+    """Returns a structured numpy array of FACE_DESCRIPTOR_DTYPE, with one
+    record for each face of the shape, in the order of topexp.MapShapes:
+
+    - surface_type: the GeomAbs_SurfaceType of the face
+    - area, centroid: from brepgprop.SurfaceProperties
+    - bbox_min, bbox_max: the corners of the bounding box of the face
+    - direction: the normal of a plane, oriented as the face, the axis of a
+      cylinder, cone, sphere, torus or surface of revolution, the direction
+      of a surface of extrusion, else the normal at the middle of the
+      parametric domain
+    - nb_adjacent_faces: the number of faces sharing an edge with the face
+
+    All the faces are processed natively, in one pass, in parallel across
+    the faces if parallel is True.
+    """
+    assert_shape_not_null(shape)
+    rows = np.frombuffer(
+        BRepAdaptor_Surface.FaceDescriptors(shape, parallel), dtype=np.float64
+    ).reshape(-1, 15)
+    descriptors = np.zeros(len(rows), dtype=FACE_DESCRIPTOR_DTYPE)
+    descriptors["surface_type"] = rows[:, 0]
+    descriptors["area"] = rows[:, 1]
+    descriptors["centroid"] = rows[:, 2:5]
+    descriptors["bbox_min"] = rows[:, 5:8]
+    descriptors["bbox_max"] = rows[:, 8:11]
+    descriptors["direction"] = rows[:, 11:14]
+    descriptors["nb_adjacent_faces"] = rows[:, 14]
+    return descriptors
+
+
+def shape_content_hash(shape, tolerance=1e-6, ignore_placement=False, parallel=True):
+    """Returns a hex digest that only depends on the geometry of the faces of
+    the shape, so that it is stable across files, imports and sessions.
+
+    Each face is described by its surface type, number of edges, area,
+    perimeter and principal moments of inertia, computed natively in
+    parallel. These values are converted to lengths, then rounded to the
+    tolerance, so that two shapes that differ by less than the tolerance
+    get the same hash, except for values that fall on both sides of a
+    rounding boundary. The faces are sorted, so the hash does not depend on
+    their order.
+
+    If ignore_placement is False, the centroid of each face is also hashed.
+    Else, only the distance from each face centroid to the centroid of all
+    the faces is, and the hash is invariant by any rigid motion of the shape.
+    """
+    assert_shape_not_null(shape)
+    if tolerance <= 0.0:
+        raise AssertionError("tolerance must be > 0.")
+    rows = np.frombuffer(
+        BRepAdaptor_Surface.FaceHashFeatures(shape, parallel), dtype=np.float64
+    ).reshape(-1, 10)
+    if len(rows) == 0:
+        raise AssertionError("The shape has no face to hash.")
+    area = rows[:, 1]
+    centroids = rows[:, 7:10]
+    # all the continuous features are converted to lengths before rounding
+    lengths = [
+        np.sqrt(area),
+        rows[:, 2],
+        np.power(np.maximum(rows[:, 4:7], 0.0), 0.25),
+    ]
+    if ignore_placement:
+        center = (centroids * area[:, None]).sum(axis=0) / max(area.sum(), 1e-300)
+        lengths.append(np.linalg.norm(centroids - center, axis=1))
+    else:
+        lengths.append(centroids)
+    features = np.column_stack(
+        [rows[:, 0], rows[:, 3]] + [np.round(values / tolerance) for values in lengths]
+    ).astype(np.int64)
+    # sort the faces, whatever their order in the shape
+    features = features[np.lexsort(features.T[::-1])]
+    digest = hashlib.sha256()
+    digest.update(f"occ-shape-v1 {tolerance!r} {ignore_placement}".encode("utf-8"))
+    digest.update(np.ascontiguousarray(features).astype("<i8").tobytes())
+    return digest.hexdigest()
+
+
 ##############################################################################
 # Measure functions
 ##############################################################################
@@ -485,3 +818,42 @@ def measure_shape_mass_center_of_gravity(shape):
     cog = inertia_props.CentreOfMass()
     mass = inertia_props.Mass()
     return cog, mass, mass_property
+
+
+def measure_shapes_mass_properties(shapes, approximate=False, parallel=True):
+    """Returns the mass properties of many shapes, computed in one native
+    call, in parallel across the shapes
+
+    Parameters
+    ----------
+    shapes : a list of TopoDS_Shape, or a TopoDS_Shape whose solids are
+        measured
+    approximate : bool
+        if True, the faces that already have a triangulation are measured
+        from it, which is much faster but only as precise as the mesh
+    parallel : bool
+
+    Returns
+    -------
+    a dict of numpy arrays, for N shapes:
+        "volume": (N,), "area": (N,), "center_of_mass": (N, 3) and
+        "inertia": (N, 3, 3), the matrix of inertia at the center of mass.
+        The volume is 0 for the shapes without solids, such as faces or open
+        shells. The center of mass and inertia are the ones of the volume, or
+        of the surface for the shapes without solids. NaN if a shape can't be
+        measured
+    """
+    if isinstance(shapes, TopoDS_Shape):
+        shapes = TopologyExplorer(shapes).solids()
+    compound, all_shapes_converted = list_of_shapes_to_compound(list(shapes))
+    if not all_shapes_converted:
+        raise AssertionError("Can't measure a null shape.")
+    rows = np.frombuffer(
+        brepgprop.MassProperties(compound, approximate, parallel), dtype=np.float64
+    ).reshape(-1, 14)
+    return {
+        "volume": rows[:, 0],
+        "area": rows[:, 1],
+        "center_of_mass": rows[:, 2:5],
+        "inertia": rows[:, 5:14].reshape(-1, 3, 3),
+    }
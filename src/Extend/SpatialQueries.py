@@ -0,0 +1,766 @@
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch spatial queries of shapes, on numpy arrays of points.
+
+Each query runs in one native call, that loops over all the points in
+parallel with the GIL released, instead of one wrapped call per point.
+Points are passed as (N, 3) float64 arrays.
+
+ShapeBVH is a bounding volume hierarchy of the boxes of the faces or of the
+solids of a shape, built once, queried by batches from numpy and pickled
+along with the shape. find_interferences uses it as the broad phase of the
+clash detection between the parts of an assembly.
+
+slice_shape cuts a shape by a family of parallel planes, and returns the
+contours of all the slices as ragged numpy arrays.
+"""
+
+import io
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Common, BRepAlgoAPI_Section
+from OCC.Core.BRepClass3d import BRepClass3d_SolidClassifier
+from OCC.Core.BRepExtrema import BRepExtrema_DistShapeShape, BRepExtrema_ShapeProximity
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.IntCurvesFace import IntCurvesFace_ShapeIntersector
+from OCC.Core.TopAbs import TopAbs_IN
+from OCC.Core.TopoDS import TopoDS_Shape
+
+from OCC.Extend.MeshUtils import merge_vertices, mesh_shapes, shape_to_numpy
+from OCC.Extend.ShapeFactory import get_boundingboxes
+from OCC.Extend.TopologyUtils import TopologyExplorer, list_of_shapes_to_compound
+
+
+def _as_points(points) -> np.ndarray:
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise AssertionError("points must be a (N, 3) array")
+    return points
+
+
+# the modes of cast_rays, and the IntCurvesFace_ShapeIntersector.CastRays mode ids
+_RAY_CASTING_MODES = {"exact": 0, "triangulation": 1}
+
+_SLICING_MODES = ("exact", "triangulation")
+
+
+def classify_points(
+    shape: TopoDS_Shape, points, tolerance: float = 1e-6, parallel: bool = True
+) -> np.ndarray:
+    """Classify points against a solid.
+
+    Args:
+        shape: a solid, or a compound of solids
+        points: a (N, 3) array of points
+        tolerance: the points closer than tolerance to the boundary are ON
+        parallel: if True, the points are dispatched over all the cores
+
+    Returns:
+        a (N,) int8 array of TopAbs_State: TopAbs_IN, TopAbs_OUT, TopAbs_ON
+        or TopAbs_UNKNOWN
+    """
+    if shape.IsNull():
+        raise AssertionError("Can't classify points against a null shape.")
+    points = _as_points(points)
+    states = BRepClass3d_SolidClassifier.ClassifyPoints(
+        shape, points, tolerance, parallel
+    )
+    return np.frombuffer(states, dtype=np.int8)
+
+
+def project_points(
+    shape: TopoDS_Shape, points, parallel: bool = True
+) -> Dict[str, np.ndarray]:
+    """Project points on the faces of a shape.
+
+    The faces are searched through a box tree, closest boxes first. Face
+    boundaries are taken into account, i.e. the closest point of a point
+    outside of a trimmed face lies on one of its edges.
+
+    Args:
+        shape: the shape, its faces are the projection targets
+        points: a (N, 3) array of points
+        parallel: if True, the points are dispatched over all the cores
+
+    Returns:
+        a dict of arrays:
+        "points": (N, 3) the closest points on the shape,
+        "distances": (N,) the distances from the points to the shape,
+        "face_ids": (N,) int32 the indices of the closest faces, in the
+        TopologyExplorer / TopologyIndex order,
+        "uv": (N, 2) the parameters of the closest points on these faces.
+        Points are NaN and face ids -1 if the shape has no face
+    """
+    if shape.IsNull():
+        raise AssertionError("Can't project points on a null shape.")
+    points = _as_points(points)
+    closest, distances, face_ids, uv = BRepExtrema_DistShapeShape.ProjectPoints(
+        shape, points, parallel
+    )
+    return {
+        "points": np.frombuffer(closest, dtype=np.float64).reshape(-1, 3),
+        "distances": np.frombuffer(distances, dtype=np.float64),
+        "face_ids": np.frombuffer(face_ids, dtype=np.int32),
+        "uv": np.frombuffer(uv, dtype=np.float64).reshape(-1, 2),
+    }
+
+
+def cast_rays(
+    shape: TopoDS_Shape,
+    origins,
+    directions,
+    mode: str = "exact",
+    tolerance: float = 1e-6,
+    parallel: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Cast rays on the faces of a shape and return the first hit of each ray.
+
+    Args:
+        shape: the shape
+        origins: a (N, 3) array of ray origins
+        directions: a (N, 3) array of ray directions, not necessarily
+            normalized. A single (3,) direction is used for all the rays
+        mode: "exact" intersects the faces themselves. "triangulation"
+            intersects the triangulations of the faces, through a box tree
+            of the triangles, which is much faster. The shape is meshed
+            first, with the mesh_shapes defaults, if it has no triangulation
+        tolerance: the intersection tolerance
+        parallel: if True, the rays are dispatched over all the cores
+
+    Returns:
+        a dict of arrays:
+        "distances": (N,) the distances from the origins to the first hits,
+        "points": (N, 3) the first hit points,
+        "face_ids": (N,) int32 the indices of the hit faces and
+        "solid_ids": (N,) int32 the indices of their solids, both in the
+        TopologyExplorer / TopologyIndex order, -1 for a face outside any solid.
+        Distances are inf, points NaN and ids -1 for the rays that miss
+    """
+    if mode not in _RAY_CASTING_MODES:
+        raise AssertionError(f"Unknown ray casting mode {mode}")
+    if shape.IsNull():
+        raise AssertionError("Can't cast rays on a null shape.")
+    origins = _as_points(origins)
+    directions = np.asarray(directions, dtype=np.float64)
+    if directions.shape == (3,):
+        directions = np.broadcast_to(directions, origins.shape)
+    directions = _as_points(directions)
+    if len(directions) != len(origins):
+        raise AssertionError("origins and directions must have the same length")
+    if mode == "triangulation":
+        mesh_shapes([shape])
+    distances, hits, face_ids, solid_ids = IntCurvesFace_ShapeIntersector.CastRays(
+        shape, origins, directions, _RAY_CASTING_MODES[mode], tolerance, parallel
+    )
+    return {
+        "distances": np.frombuffer(distances, dtype=np.float64),
+        "points": np.frombuffer(hits, dtype=np.float64).reshape(-1, 3),
+        "face_ids": np.frombuffer(face_ids, dtype=np.int32),
+        "solid_ids": np.frombuffer(solid_ids, dtype=np.int32),
+    }
+
+
+def _box_distances(points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Row wise distances from points to boxes, 0 for a point in its box"""
+    gaps = np.maximum(boxes[:, :3] - points, 0.0) + np.maximum(
+        points - boxes[:, 3:], 0.0
+    )
+    return np.sqrt(np.einsum("ij,ij->i", gaps, gaps))
+
+
+def _box_farthest_distances(points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Row wise distances from points to the farthest corner of boxes"""
+    gaps = np.maximum(np.abs(boxes[:, :3] - points), np.abs(points - boxes[:, 3:]))
+    return np.sqrt(np.einsum("ij,ij->i", gaps, gaps))
+
+
+def _pairs_to_csr(
+    queries: np.ndarray, items: np.ndarray, nb_queries: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    order = np.lexsort((items, queries))
+    offsets = np.zeros(nb_queries + 1, dtype=np.int64)
+    np.cumsum(np.bincount(queries, minlength=nb_queries), out=offsets[1:])
+    return offsets, items[order].astype(np.int32)
+
+
+class ShapeBVH:
+    """A bounding volume hierarchy of axis aligned boxes, stored as flat
+    numpy arrays.
+
+    The items are the faces or the solids of a shape, numbered as in
+    TopologyExplorer and TopologyIndex, or any (N, 6) array of boxes. The
+    queries are batched: each one walks the tree for all the query objects
+    at once, level by level. The tree only holds arrays, so that it can be
+    pickled, or saved with to_bytes, and cached along with the shape.
+
+    >>> bvh = ShapeBVH.from_shape(shape, "face")
+    >>> offsets, face_ids = bvh.query_spheres(points, 1.0)
+    >>> face_ids[offsets[0] : offsets[1]]  # the faces within 1 of points[0]
+    """
+
+    def __init__(self, boxes, leaf_size: int = 4, topology_type: str = "") -> None:
+        """Build the tree.
+
+        Args:
+            boxes: a (N, 6) array of xmin, ymin, zmin, xmax, ymax, zmax. The
+                void boxes, i.e. with NaN, are left out of the tree
+            leaf_size: the maximum number of items per leaf
+            topology_type: "face", "solid" or "" if the boxes are not the
+                ones of the sub-shapes of a shape
+        """
+        boxes = np.ascontiguousarray(boxes, dtype=np.float64)
+        if boxes.ndim != 2 or boxes.shape[1] != 6:
+            raise AssertionError("boxes must be a (N, 6) array")
+        if leaf_size < 1:
+            raise AssertionError("leaf_size must be at least 1")
+        self.boxes = boxes
+        self.topology_type = topology_type
+        self._build(np.flatnonzero(~np.isnan(boxes).any(axis=1)), leaf_size)
+
+    @classmethod
+    def from_shape(
+        cls,
+        shape: TopoDS_Shape,
+        topology_type: str = "face",
+        tol: float = 1e-6,
+        method: str = "triangulation",
+        parallel: bool = True,
+        leaf_size: int = 4,
+    ) -> "ShapeBVH":
+        """Build the tree of the boxes of the faces or of the solids of a shape.
+
+        Args:
+            shape: the shape
+            topology_type: "face" or "solid"
+            tol, method, parallel: passed to get_boundingboxes
+            leaf_size: the maximum number of items per leaf
+        """
+        explorer = TopologyExplorer(shape)
+        if topology_type == "face":
+            items = list(explorer.faces())
+        elif topology_type == "solid":
+            items = list(explorer.solids())
+        else:
+            raise AssertionError(f"Unknown topology type {topology_type}")
+        if items:
+            boxes = get_boundingboxes(items, tol, method, parallel)
+        else:
+            boxes = np.empty((0, 6), dtype=np.float64)
+        return cls(boxes, leaf_size, topology_type)
+
+    def _build(self, item_ids: np.ndarray, leaf_size: int) -> None:
+        # top down, the items of each node are split at the median of their
+        # box centers, along the largest extent of the centers
+        centers = (self.boxes[:, :3] + self.boxes[:, 3:]) * 0.5
+        self.items = item_ids.astype(np.int32)
+        node_boxes = []
+        children = []
+        ranges = []
+        stack = [(-1, 0, 0, len(self.items))] if len(self.items) else []
+        while stack:
+            parent, side, start, end = stack.pop()
+            node = len(node_boxes)
+            if parent >= 0:
+                children[parent][side] = node
+            segment = self.items[start:end]
+            boxes = self.boxes[segment]
+            node_boxes.append(
+                np.concatenate([boxes[:, :3].min(axis=0), boxes[:, 3:].max(axis=0)])
+            )
+            children.append([-1, -1])
+            ranges.append((start, end))
+            if end - start <= leaf_size:
+                continue
+            segment_centers = centers[segment]
+            axis = np.argmax(np.ptp(segment_centers, axis=0))
+            middle = (end - start) // 2
+            order = np.argpartition(segment_centers[:, axis], middle)
+            self.items[start:end] = segment[order]
+            stack.append((node, 1, start + middle, end))
+            stack.append((node, 0, start, start + middle))
+        self.node_boxes = np.array(node_boxes, dtype=np.float64).reshape(-1, 6)
+        self.children = np.array(children, dtype=np.int32).reshape(-1, 2)
+        self.ranges = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    @property
+    def nb_nodes(self) -> int:
+        return len(self.node_boxes)
+
+    def _traverse(self, nb_queries: int, reject_nodes, reject_items):
+        """Walk the tree for all the queries at once.
+
+        reject_nodes(query_ids, node_ids) and reject_items(query_ids,
+        item_ids) return a boolean array, True where the pair is rejected.
+
+        Returns:
+            the query ids and item ids of the accepted pairs
+        """
+        query_ids = np.arange(nb_queries if self.nb_nodes else 0, dtype=np.int64)
+        node_ids = np.zeros(len(query_ids), dtype=np.int64)
+        accepted_queries = []
+        accepted_items = []
+        while len(query_ids):
+            keep = ~reject_nodes(query_ids, node_ids)
+            query_ids, node_ids = query_ids[keep], node_ids[keep]
+            is_leaf = self.children[node_ids, 0] < 0
+            # the leaves expand to all their items
+            leaf_queries, leaf_nodes = query_ids[is_leaf], node_ids[is_leaf]
+            counts = self.ranges[leaf_nodes, 1] - self.ranges[leaf_nodes, 0]
+            pair_queries = np.repeat(leaf_queries, counts)
+            positions = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts
+            )
+            pair_items = self.items[
+                np.repeat(self.ranges[leaf_nodes, 0], counts) + positions
+            ].astype(np.int64)
+            keep = ~reject_items(pair_queries, pair_items)
+            accepted_queries.append(pair_queries[keep])
+            accepted_items.append(pair_items[keep])
+            # the inner nodes expand to their two children
+            inner_queries, inner_nodes = query_ids[~is_leaf], node_ids[~is_leaf]
+            query_ids = np.concatenate([inner_queries, inner_queries])
+            node_ids = np.concatenate(
+                [self.children[inner_nodes, 0], self.children[inner_nodes, 1]]
+            ).astype(np.int64)
+        if not accepted_queries:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(accepted_queries), np.concatenate(accepted_items)
+
+    def query_boxes(self, boxes, tol: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the items whose box overlaps each query box.
+
+        Args:
+            boxes: a (M, 6) array of xmin, ymin, zmin, xmax, ymax, zmax. The
+                void boxes, i.e. with NaN, overlap no item
+            tol: the boxes closer than tol overlap
+
+        Returns:
+            a pair of arrays (offsets, item_ids) such that the items that
+            overlap the box i are item_ids[offsets[i]:offsets[i + 1]]
+        """
+        boxes = np.ascontiguousarray(boxes, dtype=np.float64)
+        if boxes.ndim != 2 or boxes.shape[1] != 6:
+            raise AssertionError("boxes must be a (M, 6) array")
+        # the comparisons with NaN are all False, and never reject a node
+        is_void = np.isnan(boxes).any(axis=1)
+
+        def overlap(query_boxes, other_boxes):
+            return np.any(
+                (query_boxes[:, :3] > other_boxes[:, 3:] + tol)
+                | (other_boxes[:, :3] > query_boxes[:, 3:] + tol),
+                axis=1,
+            )
+
+        queries, items = self._traverse(
+            len(boxes),
+            lambda q, n: overlap(boxes[q], self.node_boxes[n]) | is_void[q],
+            lambda q, i: overlap(boxes[q], self.boxes[i]),
+        )
+        return _pairs_to_csr(queries, items, len(boxes))
+
+    def query_spheres(self, centers, radii) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the items whose box intersects each query sphere.
+
+        Args:
+            centers: a (M, 3) array of sphere centers
+            radii: a (M,) array of radii, or a single radius
+
+        Returns:
+            a pair of arrays (offsets, item_ids) such that the items that
+            intersect the sphere i are item_ids[offsets[i]:offsets[i + 1]]
+        """
+        centers = _as_points(centers)
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), len(centers))
+        queries, items = self._traverse(
+            len(centers),
+            lambda q, n: _box_distances(centers[q], self.node_boxes[n]) > radii[q],
+            lambda q, i: _box_distances(centers[q], self.boxes[i]) > radii[q],
+        )
+        return _pairs_to_csr(queries, items, len(centers))
+
+    def nearest(
+        self, points, max_distance: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the item whose box is the closest to each point.
+
+        The distances are the distances to the boxes, i.e. lower bounds of
+        the distances to the sub-shapes: use project_points on the returned
+        items for the exact ones.
+
+        Args:
+            points: a (M, 3) array of points
+            max_distance: the items farther than max_distance are ignored
+
+        Returns:
+            the (M,) int32 item ids, -1 if none, and the (M,) distances to
+            their boxes, inf if none
+        """
+        points = _as_points(points)
+        best = np.full(
+            len(points), np.inf if max_distance is None else float(max_distance)
+        )
+
+        def reject_nodes(query_ids, node_ids):
+            node_boxes = self.node_boxes[node_ids]
+            # any item box of a node is closer than the farthest corner of
+            # the node, which bounds the distance to the nearest item
+            np.minimum.at(
+                best, query_ids, _box_farthest_distances(points[query_ids], node_boxes)
+            )
+            return _box_distances(points[query_ids], node_boxes) > best[query_ids]
+
+        queries, items = self._traverse(
+            len(points),
+            reject_nodes,
+            lambda q, i: _box_distances(points[q], self.boxes[i]) > best[q],
+        )
+        nearest_ids = np.full(len(points), -1, dtype=np.int32)
+        distances = np.full(len(points), np.inf)
+        if len(queries):
+            candidate_distances = _box_distances(points[queries], self.boxes[items])
+            # the closest candidate of each query comes first
+            order = np.lexsort((candidate_distances, queries))
+            queries, items = queries[order], items[order]
+            first = np.r_[True, queries[1:] != queries[:-1]]
+            nearest_ids[queries[first]] = items[first]
+            distances[queries[first]] = candidate_distances[order][first]
+        return nearest_ids, distances
+
+    def to_bytes(self) -> bytes:
+        """Serialize the tree, see from_bytes"""
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            boxes=self.boxes,
+            items=self.items,
+            node_boxes=self.node_boxes,
+            children=self.children,
+            ranges=self.ranges,
+            topology_type=np.array(self.topology_type),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ShapeBVH":
+        """Read a tree serialized by to_bytes, without building it again"""
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            bvh = cls.__new__(cls)
+            bvh.boxes = arrays["boxes"]
+            bvh.items = arrays["items"]
+            bvh.node_boxes = arrays["node_boxes"]
+            bvh.children = arrays["children"]
+            bvh.ranges = arrays["ranges"]
+            bvh.topology_type = str(arrays["topology_type"])
+        return bvh
+
+
+def _penetration_depths(
+    shapes: List[TopoDS_Shape],
+    boxes: np.ndarray,
+    pairs: np.ndarray,
+    tolerance: float,
+    parallel: bool,
+) -> np.ndarray:
+    """For each pair of shapes, the largest distance from the mesh nodes of a
+    shape that are inside the other shape to the boundary of that other shape.
+
+    The nodes to test against a shape are gathered from all its pairs, and
+    classified then projected in one call per shape.
+    """
+    nodes = {}
+    # for each target shape, the pair ids and the nodes of the other shapes
+    candidates = {}
+    for k, (i, j) in enumerate(pairs):
+        common_box = np.concatenate(
+            [
+                np.maximum(boxes[i, :3], boxes[j, :3]),
+                np.minimum(boxes[i, 3:], boxes[j, 3:]),
+            ]
+        )
+        for source, target in ((i, j), (j, i)):
+            if source not in nodes:
+                nodes[source] = shape_to_numpy(shapes[source])[0]
+            in_box = np.all(
+                (nodes[source] >= common_box[:3]) & (nodes[source] <= common_box[3:]),
+                axis=1,
+            )
+            if in_box.any():
+                candidates.setdefault(target, []).append((k, nodes[source][in_box]))
+    depths = np.zeros(len(pairs))
+    for target, groups in candidates.items():
+        pair_ids = np.concatenate([np.full(len(group), k) for k, group in groups])
+        points = np.concatenate([group for _, group in groups])
+        is_in = (
+            classify_points(shapes[target], points, tolerance, parallel) == TopAbs_IN
+        )
+        if not is_in.any():
+            continue
+        distances = project_points(shapes[target], points[is_in], parallel)["distances"]
+        is_valid = ~np.isnan(distances)
+        np.maximum.at(depths, pair_ids[is_in][is_valid], distances[is_valid])
+    return depths
+
+
+def find_interferences(
+    shapes: Iterable[TopoDS_Shape],
+    tolerance: float = 0.0,
+    exact: bool = False,
+    parallel: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Find the pairs of interfering shapes, e.g. the clashes between the
+    parts of an assembly.
+
+    The broad phase is a ShapeBVH of the boxes of the shapes, queried with the
+    same boxes. The pairs of overlapping boxes are then tested in one native
+    parallel call, on the triangulations of the shapes: the triangles of the
+    two shapes overlap, or one shape is inside the other. The shapes are
+    meshed first, if needed, with the mesh_shapes defaults.
+
+    Args:
+        shapes: the shapes, usually solids
+        tolerance: the shapes closer than tolerance interfere
+        exact: if True, the pairs found on the triangulations are checked
+            against the exact geometry: the pairs farther than tolerance are
+            removed, and the volume of the common part of each pair is computed
+        parallel: if True, all the cores are used
+
+    Returns:
+        a dict of arrays:
+        "pairs": (K, 2) int32 the indices of the interfering shapes, i < j,
+        "contained": (K,) bool True if a shape is inside the other one,
+        "depths": (K,) the estimated penetration depths, i.e. the largest
+        distance from a mesh node of a shape inside the other shape to the
+        boundary of that other shape, 0 for shapes in contact,
+        "volumes": (K,) the volumes of the common parts, if exact is True,
+        NaN if the common part can't be computed
+    """
+    shapes = list(shapes)
+    compound, all_shapes_converted = list_of_shapes_to_compound(shapes)
+    if not all_shapes_converted:
+        raise AssertionError("Can't check the interferences of a null shape.")
+    mesh_shapes(shapes, parallel=parallel)
+    boxes = get_boundingboxes(shapes, 1e-6, "triangulation", parallel)
+    offsets, others = ShapeBVH(boxes).query_boxes(boxes, tolerance)
+    firsts = np.repeat(np.arange(len(shapes)), np.diff(offsets))
+    is_upper = firsts < others
+    pairs = np.ascontiguousarray(
+        np.stack([firsts[is_upper], others[is_upper]], axis=1), dtype=np.int32
+    ).reshape(-1, 2)
+    status = np.frombuffer(
+        BRepExtrema_ShapeProximity.OverlapPairs(compound, pairs, tolerance, parallel),
+        dtype=np.int8,
+    )
+    pairs = pairs[status > 0]
+    status = status[status > 0]
+    result = {}
+    if exact:
+        volumes = np.full(len(pairs), np.nan)
+        is_kept = np.ones(len(pairs), dtype=bool)
+        for k, (i, j) in enumerate(pairs):
+            distance = BRepExtrema_DistShapeShape(shapes[i], shapes[j])
+            if distance.IsDone() and distance.Value() > tolerance:
+                is_kept[k] = False
+                continue
+            common = BRepAlgoAPI_Common(shapes[i], shapes[j])
+            if common.IsDone():
+                props = GProp_GProps()
+                brepgprop.VolumeProperties(common.Shape(), props)
+                volumes[k] = props.Mass()
+        pairs, status = pairs[is_kept], status[is_kept]
+        result["volumes"] = volumes[is_kept]
+    result["pairs"] = pairs
+    result["contained"] = status == 2
+    result["depths"] = _penetration_depths(shapes, boxes, pairs, tolerance, parallel)
+    return result
+
+
+def _chain_segments(
+    starts: np.ndarray, ends: np.ndarray, nb_points: int
+) -> Tuple[List[List[int]], List[bool]]:
+    """Chain oriented segments, given as pairs of point ids, into polylines.
+    Closed polylines end with their first point."""
+    next_points = np.full(nb_points, -1, dtype=np.int64)
+    next_points[starts] = ends
+    has_previous = np.zeros(nb_points, dtype=bool)
+    has_previous[ends] = True
+    is_visited = np.zeros(nb_points, dtype=bool)
+    chains = []
+    closed = []
+    # the open chains start at a point without any previous point
+    heads = np.concatenate([starts[~has_previous[starts]], starts])
+    for head in heads.tolist():
+        if is_visited[head]:
+            continue
+        chain = [head]
+        is_visited[head] = True
+        current = next_points[head]
+        while current >= 0 and not is_visited[current]:
+            chain.append(current)
+            is_visited[current] = True
+            current = next_points[current]
+        is_closed = current == head
+        if is_closed:
+            chain.append(head)
+        chains.append(chain)
+        closed.append(is_closed)
+    return chains, closed
+
+
+def _slice_triangulation(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    normal: np.ndarray,
+    offsets: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    heights = vertices @ normal
+    order = np.argsort(offsets, kind="stable")
+    sorted_offsets = offsets[order]
+    # a node is below a plane if its height is strictly lower than the offset,
+    # the triangles with nodes on both sides cross the plane
+    triangle_heights = heights[triangles]
+    first = np.searchsorted(sorted_offsets, triangle_heights.min(axis=1), "right")
+    last = np.searchsorted(sorted_offsets, triangle_heights.max(axis=1), "right")
+    counts = last - first
+    triangle_ids = np.repeat(np.arange(len(triangles)), counts)
+    planes = np.repeat(first, counts) + (
+        np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    )
+    nodes = triangles[triangle_ids]
+    is_below = triangle_heights[triangle_ids] < sorted_offsets[planes][:, np.newaxis]
+    # the triangle edge that goes up through the plane starts the segment, the
+    # one that goes down ends it: the segments of consistently oriented
+    # triangles chain head to tail
+    edge_ends = {}
+    for name, sign in (("up", True), ("down", False)):
+        conditions = [
+            (is_below[:, a] == sign) & (is_below[:, b] != sign)
+            for a, b in ((0, 1), (1, 2), (2, 0))
+        ]
+        node_a = np.select(conditions, [nodes[:, 0], nodes[:, 1], nodes[:, 2]])
+        node_b = np.select(conditions, [nodes[:, 1], nodes[:, 2], nodes[:, 0]])
+        edge_ends[name] = np.stack(
+            [planes, np.minimum(node_a, node_b), np.maximum(node_a, node_b)], axis=1
+        )
+    # the crossing points are numbered by plane and triangle edge
+    keys, inverse = np.unique(
+        np.concatenate([edge_ends["up"], edge_ends["down"]]),
+        axis=0,
+        return_inverse=True,
+    )
+    inverse = inverse.reshape(-1)
+    low, high = vertices[keys[:, 1]], vertices[keys[:, 2]]
+    ratios = (sorted_offsets[keys[:, 0]] - heights[keys[:, 1]]) / (
+        heights[keys[:, 2]] - heights[keys[:, 1]]
+    )
+    crossing_points = low + ratios[:, np.newaxis] * (high - low)
+    chains, closed = _chain_segments(
+        inverse[: len(planes)], inverse[len(planes) :], len(keys)
+    )
+    # the contours are grouped by slice, in the order of the given offsets
+    chain_slices = order[keys[[chain[0] for chain in chains], 0]]
+    chain_order = np.argsort(chain_slices, kind="stable")
+    point_ids = [chains[k] for k in chain_order]
+    lengths = np.array([len(chain) for chain in point_ids], dtype=np.int64)
+    contour_offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    slice_offsets = np.searchsorted(
+        chain_slices[chain_order], np.arange(len(offsets) + 1)
+    ).astype(np.int64)
+    if point_ids:
+        points = crossing_points[np.concatenate(point_ids)]
+    else:
+        points = np.empty((0, 3), dtype=np.float64)
+    return points, contour_offsets, slice_offsets, np.array(closed)[chain_order]
+
+
+def slice_shape(
+    shape: TopoDS_Shape,
+    normal,
+    offsets,
+    mode: str = "exact",
+    deflection: float = 0.1,
+    tolerance: float = 1e-6,
+    parallel: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Slice a shape by a family of parallel planes.
+
+    Args:
+        shape: the shape to slice
+        normal: the (3,) normal of the planes, not necessarily normalized
+        offsets: the (S,) offsets of the planes along the normal: the plane i
+            is the set of the points P such that dot(n, P) = offsets[i], with
+            n the normalized normal
+        mode: "exact" computes one BRepAlgoAPI_Section per plane, all in
+            one native parallel call, and discretizes the section edges with
+            deflection. "triangulation" cuts the triangulation of the shape
+            with numpy, much faster, but only as precise as the mesh. The
+            shape is meshed first, with the mesh_shapes defaults, if needed
+        deflection: the deflection of the discretization of the exact sections
+        tolerance: the tolerance used to weld the nodes of the triangulations
+            of the faces, in triangulation mode
+        parallel: if True, the planes are dispatched over all the cores, in
+            exact mode
+
+    Returns:
+        a dict of arrays:
+        "points": (N, 3) the points of all the contours,
+        "contour_offsets": (C + 1,) int64, the points of the contour j are
+        points[contour_offsets[j]:contour_offsets[j + 1]],
+        "slice_offsets": (S + 1,) int64, the contours of the slice i are the
+        contours slice_offsets[i] to slice_offsets[i + 1] - 1,
+        "closed": (C,) bool, True for a closed contour. The last point of a
+        closed contour is its first point
+    """
+    if mode not in _SLICING_MODES:
+        raise AssertionError(f"Unknown slicing mode {mode}")
+    if shape.IsNull():
+        raise AssertionError("Can't slice a null shape.")
+    normal = np.asarray(normal, dtype=np.float64).reshape(3)
+    norm = np.linalg.norm(normal)
+    if norm == 0.0:
+        raise AssertionError("The normal of the planes can't be null.")
+    normal = normal / norm
+    offsets = np.ascontiguousarray(offsets, dtype=np.float64).reshape(-1)
+    if mode == "exact":
+        points, contour_offsets, slice_offsets, closed = (
+            BRepAlgoAPI_Section.SliceContours(
+                shape, *normal.tolist(), offsets, deflection, parallel
+            )
+        )
+        return {
+            "points": np.frombuffer(points, dtype=np.float64).reshape(-1, 3),
+            "contour_offsets": np.frombuffer(contour_offsets, dtype=np.int64),
+            "slice_offsets": np.frombuffer(slice_offsets, dtype=np.int64),
+            "closed": np.frombuffer(closed, dtype=np.uint8).astype(bool),
+        }
+    mesh_shapes([shape], parallel=parallel)
+    vertices, triangles = merge_vertices(*shape_to_numpy(shape), tolerance)
+    points, contour_offsets, slice_offsets, closed = _slice_triangulation(
+        vertices, triangles, normal, offsets
+    )
+    return {
+        "points": points,
+        "contour_offsets": contour_offsets,
+        "slice_offsets": slice_offsets,
+        "closed": closed.astype(bool),
+    }
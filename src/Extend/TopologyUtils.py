@@ -17,12 +17,21 @@
 ##You should have received a copy of the GNU Lesser General Public License
 ##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Iterable, Iterator, List, Optional, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from OCC.Core.BRep import BRep_Tool, BRep_Builder
 from OCC.Core.BRepTools import BRepTools_WireExplorer
 from OCC.Core.gp import gp_Ax2, gp_Dir, gp_Pnt
-from OCC.Core.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape
+from OCC.Core.HLRBRep import (
+    HLRBRep_Algo,
+    HLRBRep_HLRToShape,
+    HLRBRep_PolyAlgo,
+    HLRBRep_PolyHLRToShape,
+)
 from OCC.Core.HLRAlgo import HLRAlgo_Projector
 from OCC.Core.TopAbs import (
     TopAbs_VERTEX,
@@ -40,6 +49,7 @@ from OCC.Core.TopExp import TopExp_Explorer, topexp
 from OCC.Core.TopTools import (
     TopTools_ListIteratorOfListOfShape,
     TopTools_IndexedDataMapOfShapeListOfShape,
+    TopTools_IndexedMapOfShape,
 )
 from OCC.Core.TopoDS import (
     Wire,
@@ -66,7 +76,9 @@ from OCC.Core.GCPnts import (
     GCPnts_QuasiUniformDeflection,
     GCPnts_UniformDeflection,
 )
-from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
+
+from OCC.Extend.MeshUtils import mesh_shapes
 
 
 def _number_of_topo(iterable: Iterable) -> int:
@@ -174,6 +186,8 @@ class TopologyExplorer:
             TopAbs_COMPOUND: Compound,
             TopAbs_COMPSOLID: CompSolid,
         }
+        # the unique sub-shapes of my_shape, see _unique_shapes_map
+        self._unique_shapes_maps = {}
 
     def _loop_topo(
         self,
@@ -197,9 +211,35 @@ class TopologyExplorer:
             TopAbs_COMPOUND: TopoDS_Compound,
             TopAbs_COMPSOLID: TopoDS_CompSolid,
         }
-        topology_explorer = TopExp_Explorer()
         if topology_type not in topo_types:
             raise AssertionError(f"{topology_type} not one of {topo_types.keys()}")
+        if self.ignore_orientation:
+            # the sub-shapes that differ only by their orientation are
+            # filtered out natively by an indexed map, then created lazily
+            shape_map = self._unique_shapes_map(
+                topology_type, topological_entity, topology_type_to_avoid
+            )
+            factory = self.topology_factory[topology_type]
+            return (factory(shape) for shape in shape_map)
+
+        topology_explorer = self._init_explorer(
+            topology_type, topological_entity, topology_type_to_avoid
+        )
+        seq = []
+        while topology_explorer.More():
+            current_item = topology_explorer.Current()
+            topo_to_add = self.topology_factory[topology_type](current_item)
+            seq.append(topo_to_add)
+            topology_explorer.Next()
+        return iter(seq)
+
+    def _init_explorer(
+        self,
+        topology_type: TopAbs_ShapeEnum,
+        topological_entity=None,
+        topology_type_to_avoid=None,
+    ) -> TopExp_Explorer:
+        topology_explorer = TopExp_Explorer()
         # use self.my_shape if nothing is specified
         if topological_entity is None and topology_type_to_avoid is None:
             topology_explorer.Init(self.my_shape, topology_type)
@@ -211,36 +251,42 @@ class TopologyExplorer:
             topology_explorer.Init(
                 topological_entity, topology_type, topology_type_to_avoid
             )
-        seq = []
-        while topology_explorer.More():
-            current_item = topology_explorer.Current()
-            topo_to_add = self.topology_factory[topology_type](current_item)
-            seq.append(topo_to_add)
-            topology_explorer.Next()
+        return topology_explorer
 
+    def _unique_shapes_map(
+        self,
+        topology_type: TopAbs_ShapeEnum,
+        topological_entity=None,
+        topology_type_to_avoid=None,
+    ) -> TopTools_IndexedMapOfShape:
+        """Return the indexed map of the sub-shapes of topology_type, where
+        shapes that are IsSame are stored once, in the exploration order.
+        The maps of the whole shape are cached."""
+        cache_key = (topology_type, topology_type_to_avoid)
+        if topological_entity is None and cache_key in self._unique_shapes_maps:
+            return self._unique_shapes_maps[cache_key]
+        shape_map = TopTools_IndexedMapOfShape()
+        if topology_type_to_avoid is None:
+            topexp.MapShapes(
+                self.my_shape if topological_entity is None else topological_entity,
+                topology_type,
+                shape_map,
+            )
+        else:
+            topology_explorer = self._init_explorer(
+                topology_type, topological_entity, topology_type_to_avoid
+            )
+            while topology_explorer.More():
+                shape_map.Add(topology_explorer.Current())
+                topology_explorer.Next()
+        if topological_entity is None:
+            self._unique_shapes_maps[cache_key] = shape_map
+        return shape_map
+
+    def _number_of_topo(self, topology_type: TopAbs_ShapeEnum) -> int:
         if self.ignore_orientation:
-            # filter out those entities that share the same TShape
-            # but do *not* share the same orientation
-            filter_orientation_seq: List = []
-            filter_orientation_hash_codes = {}
-            for i in seq:
-                i_hash_code = hash(i)
-                if i_hash_code not in filter_orientation_hash_codes:
-                    filter_orientation_seq.append(i)
-                    filter_orientation_hash_codes[i_hash_code] = [
-                        len(filter_orientation_seq) - 1
-                    ]
-                else:
-                    index_list = filter_orientation_hash_codes[i_hash_code]
-                    unique = not any(
-                        i.IsSame(filter_orientation_seq[j]) for j in index_list
-                    )
-                    if unique:
-                        filter_orientation_seq.append(i)
-                        index_list.append(len(filter_orientation_seq) - 1)
-            return iter(filter_orientation_seq)
-
-        return iter(seq)
+            return self._unique_shapes_map(topology_type).Extent()
+        return _number_of_topo(self._loop_topo(topology_type))
 
     def faces(self) -> Iterator[TopoDS_Face]:
         """
@@ -249,7 +295,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_FACE)
 
     def number_of_faces(self) -> int:
-        return _number_of_topo(self.faces())
+        return self._number_of_topo(TopAbs_FACE)
 
     def vertices(self) -> Iterator[TopoDS_Vertex]:
         """
@@ -258,7 +304,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_VERTEX)
 
     def number_of_vertices(self) -> int:
-        return _number_of_topo(self.vertices())
+        return self._number_of_topo(TopAbs_VERTEX)
 
     def edges(self) -> Iterator[TopoDS_Edge]:
         """
@@ -267,7 +313,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_EDGE)
 
     def number_of_edges(self) -> int:
-        return _number_of_topo(self.edges())
+        return self._number_of_topo(TopAbs_EDGE)
 
     def wires(self) -> Iterator[TopoDS_Wire]:
         """
@@ -276,7 +322,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_WIRE)
 
     def number_of_wires(self) -> int:
-        return _number_of_topo(self.wires())
+        return self._number_of_topo(TopAbs_WIRE)
 
     def shells(self) -> Iterator[TopoDS_Shell]:
         """
@@ -285,7 +331,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_SHELL, None)
 
     def number_of_shells(self) -> int:
-        return _number_of_topo(self.shells())
+        return self._number_of_topo(TopAbs_SHELL)
 
     def solids(self) -> Iterator[TopoDS_Solid]:
         """
@@ -294,7 +340,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_SOLID, None)
 
     def number_of_solids(self) -> int:
-        return _number_of_topo(self.solids())
+        return self._number_of_topo(TopAbs_SOLID)
 
     def comp_solids(self) -> Iterator[TopoDS_CompSolid]:
         """
@@ -303,7 +349,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_COMPSOLID)
 
     def number_of_comp_solids(self) -> int:
-        return _number_of_topo(self.comp_solids())
+        return self._number_of_topo(TopAbs_COMPSOLID)
 
     def compounds(self) -> Iterator[TopoDS_Compound]:
         """
@@ -312,7 +358,7 @@ class TopologyExplorer:
         return self._loop_topo(TopAbs_COMPOUND)
 
     def number_of_compounds(self) -> int:
-        return _number_of_topo(self.compounds())
+        return self._number_of_topo(TopAbs_COMPOUND)
 
     def number_of_ordered_vertices_from_wire(self, wire: TopoDS_Wire) -> int:
         return _number_of_topo(ordered_vertices_from_wire(wire))
@@ -502,6 +548,197 @@ class TopologyExplorer:
         return sum(1 for _ in self._loop_topo(TopAbs_FACE, solid))
 
 
+def _csr_transpose(
+    offsets: np.ndarray, indices: np.ndarray, nb_columns: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Transpose a (offsets, indices) compressed sparse rows adjacency"""
+    rows = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+    order = np.argsort(indices, kind="stable")
+    transposed_offsets = np.zeros(nb_columns + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=nb_columns), out=transposed_offsets[1:])
+    return transposed_offsets, rows[order]
+
+
+def _csr_compose(
+    offsets_ab: np.ndarray,
+    indices_ab: np.ndarray,
+    offsets_ba: np.ndarray,
+    indices_ba: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compose the A->B and B->A adjacencies to get the A->A one, without
+    the self loops"""
+    nb_rows = len(offsets_ab) - 1
+    rows = np.repeat(np.arange(nb_rows, dtype=np.int64), np.diff(offsets_ab))
+    # expand, for each (a, b) pair, all the b -> a' pairs
+    counts = np.diff(offsets_ba)[indices_ab]
+    total = int(counts.sum())
+    starts = np.repeat(offsets_ba[indices_ab] - np.cumsum(counts) + counts, counts)
+    neighbours = indices_ba[starts + np.arange(total)].astype(np.int64)
+    rows = np.repeat(rows, counts)
+    is_not_self = rows != neighbours
+    keys = np.unique(rows[is_not_self] * nb_rows + neighbours[is_not_self])
+    offsets = np.zeros(nb_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // nb_rows, minlength=nb_rows), out=offsets[1:])
+    return offsets, (keys % nb_rows).astype(np.int32)
+
+
+class TopologyIndex:
+    """
+    Integer ids and adjacency arrays of the sub-shapes of a shape
+
+    The vertices, edges, wires, faces, shells and solids are numbered once,
+    from zero, in the order of topexp.MapShapes. As in TopologyExplorer with
+    ignore_orientation=True, the sub-shapes that differ only by their
+    orientation get the same id.
+
+    The adjacencies are returned as compressed sparse rows: a pair of numpy
+    arrays (offsets, indices) such that the ids of the entities adjacent to
+    the entity i are indices[offsets[i]:offsets[i + 1]]. They are computed
+    on demand, natively, and cached.
+
+    >>> index = TopologyIndex(box)
+    >>> offsets, edge_ids = index.adjacency(TopAbs_FACE, TopAbs_EDGE)
+    >>> edge_ids[offsets[0] : offsets[1]]  # the 4 edges of the first face
+    """
+
+    topology_types = (
+        TopAbs_VERTEX,
+        TopAbs_EDGE,
+        TopAbs_WIRE,
+        TopAbs_FACE,
+        TopAbs_SHELL,
+        TopAbs_SOLID,
+    )
+
+    # the default sub-shapes that make two entities of a same type neighbours
+    default_bridge_types = {
+        TopAbs_VERTEX: TopAbs_EDGE,
+        TopAbs_EDGE: TopAbs_VERTEX,
+        TopAbs_WIRE: TopAbs_EDGE,
+        TopAbs_FACE: TopAbs_EDGE,
+        TopAbs_SHELL: TopAbs_FACE,
+        TopAbs_SOLID: TopAbs_FACE,
+    }
+
+    def __init__(self, shape: TopoDS_Shape) -> None:
+        self.shape = shape
+        self.maps: Dict[TopAbs_ShapeEnum, TopTools_IndexedMapOfShape] = {}
+        for topology_type in self.topology_types:
+            shape_map = TopTools_IndexedMapOfShape()
+            topexp.MapShapes(shape, topology_type, shape_map)
+            self.maps[topology_type] = shape_map
+        self._cache = {}
+        self._topology_factory = {
+            TopAbs_VERTEX: Vertex,
+            TopAbs_EDGE: Edge,
+            TopAbs_FACE: Face,
+            TopAbs_WIRE: Wire,
+            TopAbs_SHELL: Shell,
+            TopAbs_SOLID: Solid,
+        }
+
+    def _check_type(self, topology_type: TopAbs_ShapeEnum) -> None:
+        if topology_type not in self.maps:
+            raise AssertionError(f"{topology_type} not one of {self.topology_types}")
+
+    def count(self, topology_type: TopAbs_ShapeEnum) -> int:
+        """Return the number of entities of a type"""
+        self._check_type(topology_type)
+        return self.maps[topology_type].Extent()
+
+    def counts(self) -> Dict[TopAbs_ShapeEnum, int]:
+        return {topology_type: self.count(topology_type) for topology_type in self.maps}
+
+    def get_shape(self, topology_type: TopAbs_ShapeEnum, shape_id: int) -> Any:
+        """Return the TopoDS_* entity of an id"""
+        self._check_type(topology_type)
+        if not 0 <= shape_id < self.count(topology_type):
+            raise IndexError(f"{shape_id} out of range")
+        return self._topology_factory[topology_type](
+            self.maps[topology_type].FindKey(shape_id + 1)
+        )
+
+    def shapes(self, topology_type: TopAbs_ShapeEnum) -> Iterator[Any]:
+        """Loop over the entities of a type, in the order of their ids"""
+        for shape_id in range(self.count(topology_type)):
+            yield self.get_shape(topology_type, shape_id)
+
+    def get_id(self, shape: TopoDS_Shape) -> int:
+        """Return the id of a sub-shape, or -1 if it is not part of the shape"""
+        topology_type = shape.ShapeType()
+        self._check_type(topology_type)
+        return self.maps[topology_type].FindIndex(shape) - 1
+
+    def adjacency(
+        self, from_type: TopAbs_ShapeEnum, to_type: TopAbs_ShapeEnum
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (offsets, indices) arrays that link each entity of
+        from_type to the entities of to_type it contains, or it belongs to.
+
+        For instance adjacency(TopAbs_FACE, TopAbs_EDGE) gives the edges of
+        each face, adjacency(TopAbs_EDGE, TopAbs_FACE) the faces of each edge.
+        For two entities of the same type, see neighbours.
+        """
+        self._check_type(from_type)
+        self._check_type(to_type)
+        if from_type == to_type:
+            return self.neighbours(from_type)
+        key = (from_type, to_type)
+        if key not in self._cache:
+            # the TopAbs_ShapeEnum values decrease from vertex to compound
+            if from_type > to_type:
+                offsets, indices = topexp.MapShapesAndAncestorsIndices(
+                    self.shape,
+                    from_type,
+                    to_type,
+                    self.maps[from_type],
+                    self.maps[to_type],
+                )
+                self._cache[key] = (
+                    np.frombuffer(offsets, dtype=np.int64),
+                    np.frombuffer(indices, dtype=np.int32),
+                )
+            else:
+                self._cache[key] = _csr_transpose(
+                    *self.adjacency(to_type, from_type), self.count(from_type)
+                )
+        return self._cache[key]
+
+    def neighbours(
+        self,
+        topology_type: TopAbs_ShapeEnum,
+        bridge_type: Optional[TopAbs_ShapeEnum] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (offsets, indices) arrays that link each entity to the
+        other entities of the same type it shares a bridge_type entity with.
+
+        bridge_type defaults to edges for faces and wires, faces for solids
+        and shells, vertices for edges and edges for vertices. For instance
+        neighbours(TopAbs_FACE) gives the face adjacency graph.
+        """
+        self._check_type(topology_type)
+        if bridge_type is None:
+            bridge_type = self.default_bridge_types[topology_type]
+        if bridge_type == topology_type:
+            raise AssertionError("bridge_type must differ from topology_type")
+        key = (topology_type, topology_type, bridge_type)
+        if key not in self._cache:
+            self._cache[key] = _csr_compose(
+                *self.adjacency(topology_type, bridge_type),
+                *self.adjacency(bridge_type, topology_type),
+            )
+        return self._cache[key]
+
+    def adjacency_pairs(
+        self, from_type: TopAbs_ShapeEnum, to_type: TopAbs_ShapeEnum
+    ) -> np.ndarray:
+        """Return the adjacency as a (K, 2) array of (from id, to id) pairs,
+        i.e. the edge list of the graph"""
+        offsets, indices = self.adjacency(from_type, to_type)
+        rows = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+        return np.stack([rows, indices], axis=1)
+
+
 def dump_topology_to_string(
     shape: TopoDS_Shape, level: Optional[int] = 0, buffer: Optional[str] = ""
 ) -> None:
@@ -537,12 +774,9 @@ def discretize_wire(
             "You must provide a TopoDS_Wire to the discretize_wire function."
         )
     wire_explorer = WireExplorer(a_wire)
-    wire_pnts = []
-    # loop over ordered edges
-    for edg in wire_explorer.ordered_edges():
-        edg_pnts = discretize_edge(edg, deflection)
-        wire_pnts += edg_pnts
-    return wire_pnts
+    # the ordered edges are discretized in one batch
+    points, _ = discretize_edges(list(wire_explorer.ordered_edges()), deflection)
+    return [tuple(pnt) for pnt in points.tolist()]
 
 
 def discretize_edge(
@@ -592,6 +826,105 @@ def discretize_edge(
     return points
 
 
+# the algorithm ids of BRepAdaptor_Curve.DiscretizeEdges
+_DISCRETIZATION_ALGORITHMS = {
+    "QuasiUniformDeflection": 0,
+    "UniformAbscissa": 1,
+    "UniformDeflection": 2,
+}
+
+
+def discretize_edges(
+    edges: Any,
+    deflection: float = 0.2,
+    algorithm: str = "QuasiUniformDeflection",
+    parallel: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Discretize many edges at once, natively and in parallel across the edges.
+
+    Args:
+        edges: a shape, whose edges are taken in the order of topexp.MapShapes
+            (i.e. the edge ids of TopologyIndex), or an iterable of edges,
+            kept in order
+        deflection: as in discretize_edge, the abscissa for UniformAbscissa
+        algorithm: "QuasiUniformDeflection", "UniformAbscissa"
+            or "UniformDeflection"
+        parallel: if False, the edges are discretized in the calling thread
+
+    Returns:
+        a (N, 3) float64 array of all the points, and a (E + 1,) int64 array
+        of offsets: the points of the edge i are points[offsets[i]:offsets[i + 1]].
+        As in discretize_edge, the points of a REVERSED edge are reversed.
+        Degenerated edges have no point.
+    """
+    if algorithm not in _DISCRETIZATION_ALGORITHMS:
+        raise AssertionError("Unknown algorithm")
+    if isinstance(edges, TopoDS_Shape):
+        shape = edges
+        unique = True
+    else:
+        # gather the edges into a compound, that is explored in order
+        shape = TopoDS_Compound()
+        builder = BRep_Builder()
+        builder.MakeCompound(shape)
+        for edge in edges:
+            if not is_edge(edge):
+                raise AssertionError(
+                    "You must provide TopoDS_Edges to the discretize_edges function."
+                )
+            builder.Add(shape, edge)
+        unique = False
+    coords, offsets = BRepAdaptor_Curve.DiscretizeEdges(
+        shape, _DISCRETIZATION_ALGORITHMS[algorithm], deflection, unique, parallel
+    )
+    points = np.frombuffer(coords, dtype=np.float64).reshape(-1, 3)
+    return points, np.array(offsets, dtype=np.int64)
+
+
+def sample_faces_uv_grid(
+    shape: TopoDS_Shape, nb_u: int = 10, nb_v: int = 10, parallel: bool = True
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample each face of a shape on a regular nb_u x nb_v grid of its UV bounds.
+
+    The faces are taken in the order of topexp.MapShapes (i.e. the face ids
+    of TopologyIndex), and sampled natively, in parallel across the faces.
+
+    Returns:
+        a (F, nb_u, nb_v, 3) float64 array of points, a (F, nb_u, nb_v, 3)
+        float64 array of unit normals, oriented as the faces, and a
+        (F, nb_u, nb_v) bool mask, False for the samples trimmed away
+    """
+    points, normals, masks = BRepAdaptor_Surface.SampleFacesUVGrid(
+        shape, nb_u, nb_v, parallel
+    )
+    grid_shape = (-1, nb_u, nb_v)
+    return (
+        np.frombuffer(points, dtype=np.float64).reshape(grid_shape + (3,)),
+        np.frombuffer(normals, dtype=np.float64).reshape(grid_shape + (3,)),
+        np.frombuffer(masks, dtype=np.uint8).reshape(grid_shape).astype(bool),
+    )
+
+
+def sample_edges(
+    shape: TopoDS_Shape, nb_samples: int = 10, parallel: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample each edge of a shape at nb_samples uniform parameters.
+
+    The edges are taken in the order of topexp.MapShapes (i.e. the edge ids
+    of TopologyIndex), in the direction of their parameter, and sampled
+    natively, in parallel across the edges. Degenerated edges are left to 0.
+
+    Returns:
+        a (E, nb_samples, 3) float64 array of points and a (E, nb_samples, 3)
+        float64 array of unit tangents
+    """
+    points, tangents = BRepAdaptor_Curve.SampleEdges(shape, nb_samples, parallel)
+    return (
+        np.frombuffer(points, dtype=np.float64).reshape(-1, nb_samples, 3),
+        np.frombuffer(tangents, dtype=np.float64).reshape(-1, nb_samples, 3),
+    )
+
+
 #
 # TopoDS_Shape type utils
 #
@@ -657,13 +990,99 @@ def get_type_as_string(shape: TopoDS_Shape) -> str:
     return types[shape.ShapeType()]
 
 
+# the view directions of get_sorted_hlr_edges_views
+HLR_VIEW_DIRECTIONS = {
+    "front": (0.0, -1.0, 0.0),
+    "back": (0.0, 1.0, 0.0),
+    "top": (0.0, 0.0, 1.0),
+    "bottom": (0.0, 0.0, -1.0),
+    "left": (-1.0, 0.0, 0.0),
+    "right": (1.0, 0.0, 0.0),
+    "side": (1.0, 0.0, 0.0),
+    "iso": (1.0, 1.0, 1.0),
+}
+
+
+def _hlr_algo(shape: TopoDS_Shape, algorithm: str, deflection: float) -> Any:
+    """Load the shape into an HLR algorithm, that can be reused for any number
+    of projections"""
+    if algorithm == "exact":
+        hlr = HLRBRep_Algo()
+        hlr.Add(shape)
+    elif algorithm == "poly":
+        # the polygonal algorithm works on the triangulations
+        mesh_shapes([shape], deflection)
+        hlr = HLRBRep_PolyAlgo()
+        hlr.Load(shape)
+    else:
+        raise AssertionError(f"Unknown HLR algorithm {algorithm}")
+    return hlr
+
+
+def _hlr_project(
+    hlr: Any,
+    position: Tuple[float, float, float],
+    direction: Tuple[float, float, float],
+    export_hidden_edges: bool,
+) -> Tuple[List[TopoDS_Shape], List[TopoDS_Shape]]:
+    """Return the visible and hidden compounds of a projection"""
+    hlr.Projector(HLRAlgo_Projector(gp_Ax2(gp_Pnt(*position), gp_Dir(*direction))))
+    hlr.Update()
+    if isinstance(hlr, HLRBRep_PolyAlgo):
+        hlr_shapes = HLRBRep_PolyHLRToShape()
+        hlr_shapes.Update(hlr)
+    else:
+        hlr.Hide()
+        hlr_shapes = HLRBRep_HLRToShape(hlr)
+    # visible sharp, smooth and contour edges
+    visible = [
+        hlr_shapes.VCompound(),
+        hlr_shapes.Rg1LineVCompound(),
+        hlr_shapes.OutLineVCompound(),
+    ]
+    # hidden sharp and contour edges
+    hidden = []
+    if export_hidden_edges:
+        hidden = [hlr_shapes.HCompound(), hlr_shapes.OutLineHCompound()]
+    return [cmp for cmp in visible if cmp], [cmp for cmp in hidden if cmp]
+
+
+def _hlr_views(
+    shape: TopoDS_Shape,
+    algorithm: str,
+    deflection: float,
+    position: Tuple[float, float, float],
+    directions: List[Tuple[float, float, float]],
+    export_hidden_edges: bool,
+) -> List[Tuple[List[TopoDS_Shape], List[TopoDS_Shape]]]:
+    hlr = _hlr_algo(shape, algorithm, deflection)
+    return [
+        _hlr_project(hlr, position, direction, export_hidden_edges)
+        for direction in directions
+    ]
+
+
+def _compounds_to_edges(compounds: List[TopoDS_Shape]) -> List[TopoDS_Edge]:
+    edges = []
+    for compound in compounds:
+        edges += list(TopologyExplorer(compound).edges())
+    return edges
+
+
 def get_sorted_hlr_edges(
     shape: TopoDS_Shape,
     position: Optional[gp_Pnt] = None,
     direction: Optional[gp_Dir] = None,
     export_hidden_edges: Optional[bool] = True,
+    algorithm: Optional[str] = "exact",
+    deflection: Optional[float] = 0.5,
 ) -> Tuple[List, List]:
-    """Return hidden and visible edges as two lists of edges"""
+    """Return hidden and visible edges as two lists of edges
+
+    algorithm: "exact" for HLRBRep_Algo, or "poly" for HLRBRep_PolyAlgo, which
+    is much faster and works on the triangulations of the shape. The shape
+    is meshed with the deflection if it is not already.
+    """
     if position is None:
         position = gp_Pnt()
     if not isinstance(position, gp_Pnt):
@@ -673,37 +1092,94 @@ def get_sorted_hlr_edges(
     if not isinstance(direction, gp_Dir):
         raise TypeError("position must be a gp_Dir")
 
-    hlr = HLRBRep_Algo()
-    hlr.Add(shape)
+    [(visible, hidden)] = _hlr_views(
+        shape,
+        algorithm,
+        deflection,
+        position.Coord(),
+        [direction.Coord()],
+        export_hidden_edges,
+    )
+    return _compounds_to_edges(visible), _compounds_to_edges(hidden)
 
-    projector = HLRAlgo_Projector(gp_Ax2(position, direction))
 
-    hlr.Projector(projector)
-    hlr.Update()
-    hlr.Hide()
-
-    hlr_shapes = HLRBRep_HLRToShape(hlr)
-
-    # visible edges
-    visible = []
-    if visible_sharp_edges_as_compound := hlr_shapes.VCompound():
-        visible += list(TopologyExplorer(visible_sharp_edges_as_compound).edges())
-    if visible_smooth_edges_as_compound := hlr_shapes.Rg1LineVCompound():
-        visible += list(TopologyExplorer(visible_smooth_edges_as_compound).edges())
-    if visible_contour_edges_as_compound := hlr_shapes.OutLineVCompound():
-        visible += list(TopologyExplorer(visible_contour_edges_as_compound).edges())
-    # visible_isoparameter_edges_as_compound = hlr_shapes.IsoLineVCompound()
-    # if visible_isoparameter_edges_as_compound:
-    #    visible += list(TopologyExplorer(visible_isoparameter_edges_as_compound).edges())
-    # hidden edges
-    hidden = []
-    if export_hidden_edges:
-        if hidden_sharp_edges_as_compound := hlr_shapes.HCompound():
-            hidden += list(TopologyExplorer(hidden_sharp_edges_as_compound).edges())
-        if hidden_contour_edges_as_compound := hlr_shapes.OutLineHCompound():
-            hidden += list(TopologyExplorer(hidden_contour_edges_as_compound).edges())
-
-    return visible, hidden
+def get_sorted_hlr_edges_views(
+    shape: TopoDS_Shape,
+    views: Any = ("front", "top", "side", "iso"),
+    position: Optional[gp_Pnt] = None,
+    export_hidden_edges: Optional[bool] = True,
+    algorithm: Optional[str] = "exact",
+    deflection: Optional[float] = 0.5,
+    max_workers: Optional[int] = 1,
+) -> Dict[str, Tuple[List, List]]:
+    """Return the hidden and visible edges of several views of a shape
+
+    views: names of HLR_VIEW_DIRECTIONS, or a dict from view names to gp_Dir
+    or (x, y, z) directions
+    algorithm, deflection: see get_sorted_hlr_edges
+    max_workers: by default, the views are computed in the calling process,
+    with the shape loaded once into the HLR algorithm. Only the projector
+    changes from one view to the next, but each projector still needs a full
+    Update(). If more than 1, or None for one per core, the views are split
+    among that many processes, each with its own pickled copy of the shape.
+
+    Returns a dict from view names to (visible, hidden) lists of edges
+    """
+    if position is None:
+        position = gp_Pnt()
+    if not isinstance(position, gp_Pnt):
+        raise TypeError("position must be a gp_Pnt")
+    if isinstance(views, dict):
+        directions = {
+            name: direction.Coord() if isinstance(direction, gp_Dir) else direction
+            for name, direction in views.items()
+        }
+    else:
+        for name in views:
+            if name not in HLR_VIEW_DIRECTIONS:
+                raise AssertionError(f"Unknown view {name}")
+        directions = {name: HLR_VIEW_DIRECTIONS[name] for name in views}
+    names = list(directions)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(names)))
+    if algorithm == "poly":
+        # mesh once, the triangulations are sent to the workers with the shape
+        mesh_shapes([shape], deflection)
+    if max_workers == 1:
+        results = _hlr_views(
+            shape,
+            algorithm,
+            deflection,
+            position.Coord(),
+            list(directions.values()),
+            export_hidden_edges,
+        )
+    else:
+        # round robin split of the views among the workers
+        chunks = [names[i::max_workers] for i in range(max_workers)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _hlr_views,
+                    shape,
+                    algorithm,
+                    deflection,
+                    position.Coord(),
+                    [directions[name] for name in chunk],
+                    export_hidden_edges,
+                )
+                for chunk in chunks
+            ]
+            chunk_results = [future.result() for future in futures]
+        results_by_name = {}
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            results_by_name.update(zip(chunk, chunk_result))
+        results = [results_by_name[name] for name in names]
+    return {
+        name: (_compounds_to_edges(visible), _compounds_to_edges(hidden))
+        for name, (visible, hidden) in zip(names, results)
+    }
 
 
 def list_of_shapes_to_compound(
@@ -724,3 +1200,15 @@ def list_of_shapes_to_compound(
             continue
         the_builder.Add(the_compound, shp)
     return the_compound, all_shapes_converted
+
+
+def compound_children(compound: TopoDS_Shape) -> List[TopoDS_Shape]:
+    """returns the list of the direct sub-shapes of a compound, in order,
+    i.e. the shapes gathered by list_of_shapes_to_compound
+    """
+    children = []
+    iterator = TopoDS_Iterator(compound)
+    while iterator.More():
+        children.append(iterator.Value())
+        iterator.Next()
+    return children
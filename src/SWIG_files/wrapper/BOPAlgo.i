@@ -4980,6 +4980,78 @@ No available documentation.
 	}
 };
 
+%{
+#include <vector>
+#include <BRep_Builder.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopoDS_Compound.hxx>
+#include <TopoDS_Iterator.hxx>
+%}
+%extend BOPAlgo_BOP {
+    %feature("autodoc", "Run one boolean operation per pair of shapes, in parallel across the pairs and with the GIL released.
+
+Each pair is a non destructive BOPAlgo_BOP, with the object i as argument and the tool i as tool, so that the concurrent operations don't modify the shapes they may share.
+
+Parameters
+----------
+theObjects: TopoDS_Shape, a compound whose direct sub-shapes are the objects
+theTools: TopoDS_Shape, a compound whose direct sub-shapes are the tools, as many as the objects
+theOperation: BOPAlgo_Operation
+theFuzzyValue: float
+theGlue: BOPAlgo_GlueEnum
+theParallel: bool, if True the pairs run in parallel, and each operation may use the remaining threads
+
+Return
+-------
+TopoDS_Compound: the results, in the order of the pairs. A RuntimeError is raised if any operation fails.") PairwiseOperations;
+    static TopoDS_Shape PairwiseOperations(const TopoDS_Shape& theObjects, const TopoDS_Shape& theTools, const BOPAlgo_Operation theOperation, const Standard_Real theFuzzyValue=0.0, const BOPAlgo_GlueEnum theGlue=BOPAlgo_GlueOff, const Standard_Boolean theParallel=Standard_True) {
+        std::vector<TopoDS_Shape> anObjects, aTools;
+        for (TopoDS_Iterator it(theObjects); it.More(); it.Next()) {
+            anObjects.push_back(it.Value());
+        }
+        for (TopoDS_Iterator it(theTools); it.More(); it.Next()) {
+            aTools.push_back(it.Value());
+        }
+        if (anObjects.size() != aTools.size()) {
+            throw Standard_Failure("PairwiseOperations expects as many objects as tools");
+        }
+        const Standard_Integer aNbPairs = (Standard_Integer) anObjects.size();
+        std::vector<TopoDS_Shape> aResults(aNbPairs);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbPairs, [&](const Standard_Integer i) {
+            try {
+                OCC_CATCH_SIGNALS
+                BOPAlgo_BOP aBOP;
+                aBOP.AddArgument(anObjects[i]);
+                aBOP.AddTool(aTools[i]);
+                aBOP.SetOperation(theOperation);
+                aBOP.SetFuzzyValue(theFuzzyValue);
+                aBOP.SetGlue(theGlue);
+                aBOP.SetNonDestructive(Standard_True);
+                aBOP.SetRunParallel(theParallel);
+                aBOP.Perform();
+                if (!aBOP.HasErrors()) {
+                    aResults[i] = aBOP.Shape();
+                }
+            } catch (Standard_Failure const&) {
+                // the result of a failed operation is left null
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        BRep_Builder aBuilder;
+        TopoDS_Compound aCompound;
+        aBuilder.MakeCompound(aCompound);
+        for (Standard_Integer i = 0; i < aNbPairs; ++i) {
+            if (aResults[i].IsNull()) {
+                throw Standard_Failure((TCollection_AsciiString("Boolean operation failed on pair ") + TCollection_AsciiString(i)).ToCString());
+            }
+            aBuilder.Add(aCompound, aResults[i]);
+        }
+        return aCompound;
+    }
+};
+
 /*************************
 * class BOPAlgo_Splitter *
 *************************/
@@ -475,6 +475,8 @@ class BOPAlgo_BOP(BOPAlgo_ToolsProvider):
     def __init__(self, theAllocator: NCollection_BaseAllocator) -> None: ...
     def Clear(self) -> None: ...
     def Operation(self) -> BOPAlgo_Operation: ...
+    @staticmethod
+    def PairwiseOperations(theObjects: TopoDS_Shape, theTools: TopoDS_Shape, theOperation: BOPAlgo_Operation, theFuzzyValue: Optional[float] = 0.0, theGlue: Optional[BOPAlgo_GlueEnum] = BOPAlgo_GlueOff, theParallel: Optional[bool] = True) -> TopoDS_Compound: ...
     def Perform(self, theRange: Optional[Message_ProgressRange] = Message_ProgressRange()) -> None: ...
     def SetOperation(self, theOperation: BOPAlgo_Operation) -> None: ...
 
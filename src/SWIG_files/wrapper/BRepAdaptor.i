@@ -1349,6 +1349,190 @@ Computes the point of parameter U on the curve.
 	__repr__ = _dumps_object
 	}
 };
+%{
+#include <algorithm>
+#include <vector>
+#include <BRep_Tool.hxx>
+#include <GCPnts_QuasiUniformDeflection.hxx>
+#include <GCPnts_UniformAbscissa.hxx>
+#include <GCPnts_UniformDeflection.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopExp.hxx>
+#include <TopExp_Explorer.hxx>
+#include <TopTools_IndexedMapOfShape.hxx>
+%}
+%extend BRepAdaptor_Curve {
+    %feature("autodoc", "Discretize all the edges of a shape, in parallel across the edges.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theAlgorithm: int, 0 for QuasiUniformDeflection, 1 for UniformAbscissa, 2 for UniformDeflection
+theDeflection: float, the deflection, or the abscissa for UniformAbscissa
+theUnique: bool, if True the edges are the ones of TopExp::MapShapes, else the ones of TopExp_Explorer, duplicates included
+theParallel: bool
+
+Return
+-------
+tuple: the float64 x, y, z coordinates of the points, as bytes, and the list of the per edge offsets, in points.
+
+Description
+-----------
+The points of a REVERSED edge are reversed. Null and degenerated edges have no point.") DiscretizeEdges;
+    static PyObject* DiscretizeEdges(const TopoDS_Shape& theShape, const Standard_Integer theAlgorithm, const Standard_Real theDeflection, const Standard_Boolean theUnique=Standard_True, const Standard_Boolean theParallel=Standard_True) {
+        if (theAlgorithm < 0 || theAlgorithm > 2) {
+            throw Standard_Failure("Unknown discretization algorithm");
+        }
+        std::vector<TopoDS_Edge> anEdges;
+        if (theUnique) {
+            TopTools_IndexedMapOfShape aMap;
+            TopExp::MapShapes(theShape, TopAbs_EDGE, aMap);
+            anEdges.reserve(aMap.Extent());
+            for (Standard_Integer i = 1; i <= aMap.Extent(); ++i) {
+                anEdges.push_back(TopoDS::Edge(aMap(i)));
+            }
+        } else {
+            for (TopExp_Explorer anExp(theShape, TopAbs_EDGE); anExp.More(); anExp.Next()) {
+                anEdges.push_back(TopoDS::Edge(anExp.Current()));
+            }
+        }
+        const Standard_Integer aNbEdges = (Standard_Integer) anEdges.size();
+        std::vector<std::vector<gp_Pnt> > aPoints(aNbEdges);
+        std::vector<char> aFailed(aNbEdges, 0);
+        // each edge gets its own adaptor and discretizer
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbEdges, [&](const Standard_Integer i) {
+            const TopoDS_Edge& anEdge = anEdges[i];
+            if (anEdge.IsNull() || BRep_Tool::Degenerated(anEdge)) {
+                return;
+            }
+            try {
+                OCC_CATCH_SIGNALS
+                BRepAdaptor_Curve aCurve(anEdge);
+                const Standard_Real aFirst = aCurve.FirstParameter();
+                const Standard_Real aLast = aCurve.LastParameter();
+                Standard_Boolean isDone = Standard_False;
+                Standard_Integer aNbPoints = 0;
+                std::vector<Standard_Real> aParams;
+                if (theAlgorithm == 0) {
+                    GCPnts_QuasiUniformDeflection aDiscretizer(aCurve, theDeflection, aFirst, aLast);
+                    isDone = aDiscretizer.IsDone();
+                    aNbPoints = isDone ? aDiscretizer.NbPoints() : 0;
+                    for (Standard_Integer j = 1; j <= aNbPoints; ++j) aParams.push_back(aDiscretizer.Parameter(j));
+                } else if (theAlgorithm == 1) {
+                    GCPnts_UniformAbscissa aDiscretizer(aCurve, theDeflection, aFirst, aLast);
+                    isDone = aDiscretizer.IsDone();
+                    aNbPoints = isDone ? aDiscretizer.NbPoints() : 0;
+                    for (Standard_Integer j = 1; j <= aNbPoints; ++j) aParams.push_back(aDiscretizer.Parameter(j));
+                } else {
+                    GCPnts_UniformDeflection aDiscretizer(aCurve, theDeflection, aFirst, aLast);
+                    isDone = aDiscretizer.IsDone();
+                    aNbPoints = isDone ? aDiscretizer.NbPoints() : 0;
+                    for (Standard_Integer j = 1; j <= aNbPoints; ++j) aParams.push_back(aDiscretizer.Parameter(j));
+                }
+                if (!isDone || aNbPoints <= 0) {
+                    aFailed[i] = 1;
+                    return;
+                }
+                std::vector<gp_Pnt>& anEdgePoints = aPoints[i];
+                anEdgePoints.reserve(aNbPoints);
+                for (size_t j = 0; j < aParams.size(); ++j) {
+                    anEdgePoints.push_back(aCurve.Value(aParams[j]));
+                }
+                if (anEdge.Orientation() == TopAbs_REVERSED) {
+                    std::reverse(anEdgePoints.begin(), anEdgePoints.end());
+                }
+            } catch (Standard_Failure const&) {
+                aFailed[i] = 1;
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        for (Standard_Integer i = 0; i < aNbEdges; ++i) {
+            if (aFailed[i]) {
+                throw Standard_Failure((TCollection_AsciiString("Discretization failed for edge ") + TCollection_AsciiString(i)).ToCString());
+            }
+        }
+        // the coordinates are packed as float64, in one buffer
+        PyObject* anOffsets = PyList_New(aNbEdges + 1);
+        PyList_SET_ITEM(anOffsets, 0, PyLong_FromLong(0));
+        Py_ssize_t aNbPoints = 0;
+        for (Standard_Integer i = 0; i < aNbEdges; ++i) {
+            aNbPoints += (Py_ssize_t) aPoints[i].size();
+            PyList_SET_ITEM(anOffsets, i + 1, PyLong_FromSsize_t(aNbPoints));
+        }
+        PyObject* aCoords = PyBytes_FromStringAndSize(NULL, aNbPoints * 3 * sizeof(double));
+        double* aBuffer = (double*) PyBytes_AS_STRING(aCoords);
+        for (Standard_Integer i = 0; i < aNbEdges; ++i) {
+            for (size_t j = 0; j < aPoints[i].size(); ++j) {
+                const gp_Pnt& aPnt = aPoints[i][j];
+                *aBuffer++ = aPnt.X();
+                *aBuffer++ = aPnt.Y();
+                *aBuffer++ = aPnt.Z();
+            }
+        }
+        return Py_BuildValue("(NN)", aCoords, anOffsets);
+    }
+};
+%extend BRepAdaptor_Curve {
+    %feature("autodoc", "Sample all the edges of a shape at uniform parameters, in parallel across the edges and with the GIL released.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theNbSamples: int, the number of samples per edge, first and last parameters included
+theParallel: bool
+
+Return
+-------
+tuple: the float64 points and unit tangents, as bytes of (nb edges, theNbSamples, 3) arrays.
+
+Description
+-----------
+The edges are the ones of TopExp::MapShapes, sampled in the direction of their parameter. Degenerated edges, and the edges without 3d curve, are left to 0.") SampleEdges;
+    static PyObject* SampleEdges(const TopoDS_Shape& theShape, const Standard_Integer theNbSamples, const Standard_Boolean theParallel=Standard_True) {
+        if (theNbSamples < 2) {
+            throw Standard_Failure("At least 2 samples per edge are required");
+        }
+        TopTools_IndexedMapOfShape anEdges;
+        TopExp::MapShapes(theShape, TopAbs_EDGE, anEdges);
+        const Standard_Integer aNbEdges = anEdges.Extent();
+        const size_t aStride = (size_t) theNbSamples * 3;
+        std::vector<double> aPoints(aNbEdges * aStride, 0.0);
+        std::vector<double> aTangents(aNbEdges * aStride, 0.0);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbEdges, [&](const Standard_Integer i) {
+            const TopoDS_Edge& anEdge = TopoDS::Edge(anEdges(i + 1));
+            if (BRep_Tool::Degenerated(anEdge)) {
+                return;
+            }
+            try {
+                OCC_CATCH_SIGNALS
+                BRepAdaptor_Curve aCurve(anEdge);
+                const Standard_Real aFirst = aCurve.FirstParameter();
+                const Standard_Real aStep = (aCurve.LastParameter() - aFirst) / (theNbSamples - 1);
+                double* aPnt = &aPoints[i * aStride];
+                double* aTgt = &aTangents[i * aStride];
+                gp_Pnt P;
+                gp_Vec V;
+                for (Standard_Integer j = 0; j < theNbSamples; ++j) {
+                    aCurve.D1(aFirst + j * aStep, P, V);
+                    aPnt[3 * j] = P.X(); aPnt[3 * j + 1] = P.Y(); aPnt[3 * j + 2] = P.Z();
+                    if (V.Magnitude() > gp::Resolution()) {
+                        V.Normalize();
+                        aTgt[3 * j] = V.X(); aTgt[3 * j + 1] = V.Y(); aTgt[3 * j + 2] = V.Z();
+                    }
+                }
+            } catch (Standard_Failure const&) {
+                // an edge without 3d curve is left to 0
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return Py_BuildValue("(NN)",
+            PyBytes_FromStringAndSize((const char*) aPoints.data(), aPoints.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aTangents.data(), aTangents.size() * sizeof(double)));
+    }
+};
 
 /****************************
 * class BRepAdaptor_Curve2d *
@@ -2315,6 +2499,242 @@ Computes the point of parameters U,V on the surface. Tip: use GeomLib::NormEstim
 	__repr__ = _dumps_object
 	}
 };
+%{
+#include <BRepBndLib.hxx>
+#include <BRepGProp.hxx>
+#include <BRepLProp_SLProps.hxx>
+#include <Bnd_Box.hxx>
+#include <GProp_GProps.hxx>
+#include <NCollection_Map.hxx>
+#include <Precision.hxx>
+#include <TopTools_IndexedDataMapOfShapeListOfShape.hxx>
+#include <TopTools_ListIteratorOfListOfShape.hxx>
+%}
+%extend BRepAdaptor_Surface {
+    %feature("autodoc", "Compute a row of descriptors for each face of a shape, in parallel across the faces.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theParallel: bool
+
+Return
+-------
+bytes: the float64 rows of 15 descriptors, one per face in the order of TopExp::MapShapes: the GeomAbs_SurfaceType, the area, the x, y, z of the centroid, of the bounding box min and max corners and of the direction, and the number of adjacent faces.
+
+Description
+-----------
+The direction is the normal of a plane, oriented as the face, the axis of the elementary surfaces and of the surfaces of revolution, the direction of the surfaces of extrusion, or else the normal at the middle of the parametric domain.") FaceDescriptors;
+    static PyObject* FaceDescriptors(const TopoDS_Shape& theShape, const Standard_Boolean theParallel=Standard_True) {
+        const Standard_Integer aNbColumns = 15;
+        TopTools_IndexedMapOfShape aFaces;
+        TopExp::MapShapes(theShape, TopAbs_FACE, aFaces);
+        const Standard_Integer aNbFaces = aFaces.Extent();
+        // the faces adjacent to a face share one of its edges
+        TopTools_IndexedDataMapOfShapeListOfShape anEdgeFaces;
+        TopExp::MapShapesAndUniqueAncestors(theShape, TopAbs_EDGE, TopAbs_FACE, anEdgeFaces);
+        std::vector<Standard_Integer> aNbAdjacent(aNbFaces, 0);
+        for (Standard_Integer i = 1; i <= aNbFaces; ++i) {
+            NCollection_Map<Standard_Integer> aNeighbours;
+            for (TopExp_Explorer anExp(aFaces(i), TopAbs_EDGE); anExp.More(); anExp.Next()) {
+                const TopTools_ListOfShape* aList = anEdgeFaces.Seek(anExp.Current());
+                if (aList == NULL) continue;
+                for (TopTools_ListIteratorOfListOfShape it(*aList); it.More(); it.Next()) {
+                    const Standard_Integer j = aFaces.FindIndex(it.Value());
+                    if (j != 0 && j != i) aNeighbours.Add(j);
+                }
+            }
+            aNbAdjacent[i - 1] = aNeighbours.Extent();
+        }
+        std::vector<double> aRows(aNbFaces * aNbColumns, 0.0);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbFaces, [&](const Standard_Integer i) {
+            double* aRow = &aRows[i * aNbColumns];
+            const TopoDS_Face& aFace = TopoDS::Face(aFaces(i + 1));
+            aRow[14] = aNbAdjacent[i];
+            try {
+                OCC_CATCH_SIGNALS
+                BRepAdaptor_Surface aSurface(aFace, Standard_True);
+                const GeomAbs_SurfaceType aType = aSurface.GetType();
+                aRow[0] = (double) aType;
+                GProp_GProps aProps;
+                BRepGProp::SurfaceProperties(aFace, aProps);
+                aRow[1] = aProps.Mass();
+                const gp_Pnt aCentroid = aProps.CentreOfMass();
+                aRow[2] = aCentroid.X(); aRow[3] = aCentroid.Y(); aRow[4] = aCentroid.Z();
+                Bnd_Box aBox;
+                BRepBndLib::AddOptimal(aFace, aBox, Standard_True, Standard_False);
+                if (!aBox.IsVoid()) {
+                    aBox.Get(aRow[5], aRow[6], aRow[7], aRow[8], aRow[9], aRow[10]);
+                }
+                gp_Dir aDirection;
+                Standard_Boolean hasDirection = Standard_True;
+                switch (aType) {
+                    case GeomAbs_Plane:
+                        aDirection = aSurface.Plane().Axis().Direction();
+                        if (aFace.Orientation() == TopAbs_REVERSED) aDirection.Reverse();
+                        break;
+                    case GeomAbs_Cylinder: aDirection = aSurface.Cylinder().Axis().Direction(); break;
+                    case GeomAbs_Cone: aDirection = aSurface.Cone().Axis().Direction(); break;
+                    case GeomAbs_Sphere: aDirection = aSurface.Sphere().Position().Direction(); break;
+                    case GeomAbs_Torus: aDirection = aSurface.Torus().Axis().Direction(); break;
+                    case GeomAbs_SurfaceOfRevolution: aDirection = aSurface.AxeOfRevolution().Direction(); break;
+                    case GeomAbs_SurfaceOfExtrusion: aDirection = aSurface.Direction(); break;
+                    default: {
+                        const Standard_Real u = 0.5 * (aSurface.FirstUParameter() + aSurface.LastUParameter());
+                        const Standard_Real v = 0.5 * (aSurface.FirstVParameter() + aSurface.LastVParameter());
+                        BRepLProp_SLProps aLProps(aSurface, u, v, 1, Precision::Confusion());
+                        hasDirection = aLProps.IsNormalDefined();
+                        if (hasDirection) {
+                            aDirection = aLProps.Normal();
+                            if (aFace.Orientation() == TopAbs_REVERSED) aDirection.Reverse();
+                        }
+                    }
+                }
+                if (hasDirection) {
+                    aRow[11] = aDirection.X(); aRow[12] = aDirection.Y(); aRow[13] = aDirection.Z();
+                }
+            } catch (Standard_Failure const&) {
+                // the descriptors of a face that can't be evaluated are left to 0
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return PyBytes_FromStringAndSize((const char*) aRows.data(), aRows.size() * sizeof(double));
+    }
+};
+%{
+#include <BRepTools.hxx>
+#include <BRepTopAdaptor_FClass2d.hxx>
+%}
+%extend BRepAdaptor_Surface {
+    %feature("autodoc", "Sample all the faces of a shape on a regular grid of their UV bounds, in parallel across the faces and with the GIL released.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theNbU: int
+theNbV: int
+theParallel: bool
+
+Return
+-------
+tuple: the float64 points and unit normals, as bytes of (nb faces, theNbU, theNbV, 3) arrays, and the uint8 trimming mask, as bytes of a (nb faces, theNbU, theNbV) array.
+
+Description
+-----------
+The faces are the ones of TopExp::MapShapes. The grid spans the BRepTools::UVBounds of each face, bounds included. The normals are oriented as the faces. The mask is 1 for the samples inside the face or on its boundary, 0 for the samples trimmed away.") SampleFacesUVGrid;
+    static PyObject* SampleFacesUVGrid(const TopoDS_Shape& theShape, const Standard_Integer theNbU, const Standard_Integer theNbV, const Standard_Boolean theParallel=Standard_True) {
+        if (theNbU < 2 || theNbV < 2) {
+            throw Standard_Failure("At least 2 samples per parametric direction are required");
+        }
+        TopTools_IndexedMapOfShape aFaces;
+        TopExp::MapShapes(theShape, TopAbs_FACE, aFaces);
+        const Standard_Integer aNbFaces = aFaces.Extent();
+        const size_t aNbSamples = (size_t) theNbU * theNbV;
+        std::vector<double> aPoints(aNbFaces * aNbSamples * 3, 0.0);
+        std::vector<double> aNormals(aNbFaces * aNbSamples * 3, 0.0);
+        std::vector<unsigned char> aMasks(aNbFaces * aNbSamples, 0);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbFaces, [&](const Standard_Integer i) {
+            const TopoDS_Face& aFace = TopoDS::Face(aFaces(i + 1));
+            try {
+                OCC_CATCH_SIGNALS
+                BRepAdaptor_Surface aSurface(aFace, Standard_False);
+                // the 2d classifier is built once per face
+                BRepTopAdaptor_FClass2d aClassifier(aFace, Precision::PConfusion());
+                Standard_Real aUMin, aUMax, aVMin, aVMax;
+                BRepTools::UVBounds(aFace, aUMin, aUMax, aVMin, aVMax);
+                const Standard_Real aUStep = (aUMax - aUMin) / (theNbU - 1);
+                const Standard_Real aVStep = (aVMax - aVMin) / (theNbV - 1);
+                const Standard_Boolean isReversed = aFace.Orientation() == TopAbs_REVERSED;
+                double* aPnt = &aPoints[i * aNbSamples * 3];
+                double* aNrm = &aNormals[i * aNbSamples * 3];
+                unsigned char* aMask = &aMasks[i * aNbSamples];
+                gp_Pnt P;
+                gp_Vec D1U, D1V;
+                for (Standard_Integer iu = 0; iu < theNbU; ++iu) {
+                    const Standard_Real u = aUMin + iu * aUStep;
+                    for (Standard_Integer iv = 0; iv < theNbV; ++iv) {
+                        const Standard_Real v = aVMin + iv * aVStep;
+                        const size_t k = (size_t) iu * theNbV + iv;
+                        aSurface.D1(u, v, P, D1U, D1V);
+                        aPnt[3 * k] = P.X(); aPnt[3 * k + 1] = P.Y(); aPnt[3 * k + 2] = P.Z();
+                        gp_Vec aNormal = D1U.Crossed(D1V);
+                        if (aNormal.Magnitude() > gp::Resolution()) {
+                            aNormal.Normalize();
+                            if (isReversed) aNormal.Reverse();
+                            aNrm[3 * k] = aNormal.X(); aNrm[3 * k + 1] = aNormal.Y(); aNrm[3 * k + 2] = aNormal.Z();
+                        }
+                        const TopAbs_State aState = aClassifier.Perform(gp_Pnt2d(u, v));
+                        aMask[k] = (aState == TopAbs_IN || aState == TopAbs_ON) ? 1 : 0;
+                    }
+                }
+            } catch (Standard_Failure const&) {
+                // a face that can't be evaluated is left to 0
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return Py_BuildValue("(NNN)",
+            PyBytes_FromStringAndSize((const char*) aPoints.data(), aPoints.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aNormals.data(), aNormals.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aMasks.data(), aMasks.size()));
+    }
+};
+%{
+#include <GProp_PrincipalProps.hxx>
+%}
+%extend BRepAdaptor_Surface {
+    %feature("autodoc", "Compute the geometric features of each face of a shape, in parallel across the faces and with the GIL released.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theParallel: bool
+
+Return
+-------
+bytes: the float64 rows of 10 features, one per face in the order of TopExp::MapShapes: the GeomAbs_SurfaceType, the area, the perimeter, the number of edges, the three principal moments of inertia, in increasing order, and the x, y, z of the centroid.
+
+Description
+-----------
+All the features but the centroid are invariant by a rigid motion of the face.") FaceHashFeatures;
+    static PyObject* FaceHashFeatures(const TopoDS_Shape& theShape, const Standard_Boolean theParallel=Standard_True) {
+        const Standard_Integer aNbColumns = 10;
+        TopTools_IndexedMapOfShape aFaces;
+        TopExp::MapShapes(theShape, TopAbs_FACE, aFaces);
+        const Standard_Integer aNbFaces = aFaces.Extent();
+        std::vector<double> aRows(aNbFaces * aNbColumns, 0.0);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbFaces, [&](const Standard_Integer i) {
+            double* aRow = &aRows[i * aNbColumns];
+            const TopoDS_Face& aFace = TopoDS::Face(aFaces(i + 1));
+            try {
+                OCC_CATCH_SIGNALS
+                aRow[0] = (double) BRepAdaptor_Surface(aFace, Standard_False).GetType();
+                GProp_GProps aSurfaceProps;
+                BRepGProp::SurfaceProperties(aFace, aSurfaceProps);
+                aRow[1] = aSurfaceProps.Mass();
+                GProp_GProps aLinearProps;
+                BRepGProp::LinearProperties(aFace, aLinearProps);
+                aRow[2] = aLinearProps.Mass();
+                TopTools_IndexedMapOfShape anEdges;
+                TopExp::MapShapes(aFace, TopAbs_EDGE, anEdges);
+                aRow[3] = anEdges.Extent();
+                Standard_Real anI1, anI2, anI3;
+                aSurfaceProps.PrincipalProperties().Moments(anI1, anI2, anI3);
+                std::vector<double> aMoments = {anI1, anI2, anI3};
+                std::sort(aMoments.begin(), aMoments.end());
+                aRow[4] = aMoments[0]; aRow[5] = aMoments[1]; aRow[6] = aMoments[2];
+                const gp_Pnt aCentroid = aSurfaceProps.CentreOfMass();
+                aRow[7] = aCentroid.X(); aRow[8] = aCentroid.Y(); aRow[9] = aCentroid.Z();
+            } catch (Standard_Failure const&) {
+                // the features of a face that can't be evaluated are left to 0
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return PyBytes_FromStringAndSize((const char*) aRows.data(), aRows.size() * sizeof(double));
+    }
+};
 
 /* harray1 classes */
 
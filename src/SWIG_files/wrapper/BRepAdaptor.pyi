@@ -1,5 +1,5 @@
 from enum import IntEnum
-from typing import overload, NewType, Optional, Tuple
+from typing import overload, NewType, List, Optional, Tuple
 
 from OCC.Core.Standard import *
 from OCC.Core.NCollection import *
@@ -94,6 +94,8 @@ class BRepAdaptor_Curve(Adaptor3d_Curve):
     def Continuity(self) -> GeomAbs_Shape: ...
     def Curve(self) -> GeomAdaptor_Curve: ...
     def CurveOnSurface(self) -> Adaptor3d_CurveOnSurface: ...
+    @staticmethod
+    def DiscretizeEdges(theShape: TopoDS_Shape, theAlgorithm: int, theDeflection: float, theUnique: Optional[bool] = True, theParallel: Optional[bool] = True) -> Tuple[bytes, List[int]]: ...
     def D0(self, U: float, P: gp_Pnt) -> None: ...
     def D1(self, U: float, P: gp_Pnt, V: gp_Vec) -> None: ...
     def D2(self, U: float, P: gp_Pnt, V1: gp_Vec, V2: gp_Vec) -> None: ...
@@ -125,6 +127,8 @@ class BRepAdaptor_Curve(Adaptor3d_Curve):
     def Period(self) -> float: ...
     def Reset(self) -> None: ...
     def Resolution(self, R3d: float) -> float: ...
+    @staticmethod
+    def SampleEdges(theShape: TopoDS_Shape, theNbSamples: int, theParallel: Optional[bool] = True) -> Tuple[bytes, bytes]: ...
     def ShallowCopy(self) -> Adaptor3d_Curve: ...
     def Tolerance(self) -> float: ...
     def Trim(self, First: float, Last: float, Tol: float) -> Adaptor3d_Curve: ...
@@ -161,6 +165,10 @@ class BRepAdaptor_Surface(Adaptor3d_Surface):
     def DN(self, U: float, V: float, Nu: int, Nv: int) -> gp_Vec: ...
     def Direction(self) -> gp_Dir: ...
     def Face(self) -> TopoDS_Face: ...
+    @staticmethod
+    def FaceDescriptors(theShape: TopoDS_Shape, theParallel: Optional[bool] = True) -> bytes: ...
+    @staticmethod
+    def FaceHashFeatures(theShape: TopoDS_Shape, theParallel: Optional[bool] = True) -> bytes: ...
     def FirstUParameter(self) -> float: ...
     def FirstVParameter(self) -> float: ...
     def GetType(self) -> GeomAbs_SurfaceType: ...
@@ -181,6 +189,8 @@ class BRepAdaptor_Surface(Adaptor3d_Surface):
     def NbVPoles(self) -> int: ...
     def OffsetValue(self) -> float: ...
     def Plane(self) -> gp_Pln: ...
+    @staticmethod
+    def SampleFacesUVGrid(theShape: TopoDS_Shape, theNbU: int, theNbV: int, theParallel: Optional[bool] = True) -> Tuple[bytes, bytes, bytes]: ...
     def ShallowCopy(self) -> Adaptor3d_Surface: ...
     def Sphere(self) -> gp_Sphere: ...
     def Surface(self) -> GeomAdaptor_Surface: ...
@@ -1855,6 +1855,146 @@ initialize the tool <Sf> - tool Obsolete.
 	}
 };
 
+%{
+#include <algorithm>
+#include <vector>
+#include <BRep_Tool.hxx>
+#include <BRepAdaptor_Curve.hxx>
+#include <BRepTools_WireExplorer.hxx>
+#include <GCPnts_QuasiUniformDeflection.hxx>
+#include <OSD_Parallel.hxx>
+#include <Precision.hxx>
+#include <ShapeAnalysis_FreeBounds.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopExp.hxx>
+#include <TopExp_Explorer.hxx>
+#include <TopTools_HSequenceOfShape.hxx>
+// a contour of a section: its points, and whether it is closed
+struct BRepAlgoAPI_SliceContour {
+    std::vector<gp_Pnt> Points;
+    bool IsClosed;
+};
+// chain the section edges into wires and discretize each wire, in order
+static void BRepAlgoAPI_SectionContours(const TopoDS_Shape& theSection, const Standard_Real theDeflection, std::vector<BRepAlgoAPI_SliceContour>& theContours) {
+    opencascade::handle<TopTools_HSequenceOfShape> anEdges = new TopTools_HSequenceOfShape();
+    for (TopExp_Explorer anExp(theSection, TopAbs_EDGE); anExp.More(); anExp.Next()) {
+        anEdges->Append(anExp.Current());
+    }
+    if (anEdges->IsEmpty()) {
+        return;
+    }
+    opencascade::handle<TopTools_HSequenceOfShape> aWires;
+    ShapeAnalysis_FreeBounds::ConnectEdgesToWires(anEdges, Precision::Confusion(), Standard_False, aWires);
+    for (Standard_Integer w = 1; w <= aWires->Length(); ++w) {
+        const TopoDS_Wire& aWire = TopoDS::Wire(aWires->Value(w));
+        BRepAlgoAPI_SliceContour aContour;
+        for (BRepTools_WireExplorer anExp(aWire); anExp.More(); anExp.Next()) {
+            const TopoDS_Edge& anEdge = anExp.Current();
+            if (BRep_Tool::Degenerated(anEdge)) {
+                continue;
+            }
+            BRepAdaptor_Curve aCurve(anEdge);
+            GCPnts_QuasiUniformDeflection aDiscretizer(aCurve, theDeflection);
+            if (!aDiscretizer.IsDone()) {
+                throw Standard_Failure("Can't discretize a section edge");
+            }
+            std::vector<gp_Pnt> aPoints;
+            for (Standard_Integer i = 1; i <= aDiscretizer.NbPoints(); ++i) {
+                aPoints.push_back(aDiscretizer.Value(i));
+            }
+            if (anEdge.Orientation() == TopAbs_REVERSED) {
+                std::reverse(aPoints.begin(), aPoints.end());
+            }
+            // the first point of an edge is the last one of the previous edge
+            const size_t aFirst = aContour.Points.empty() ? 0 : 1;
+            aContour.Points.insert(aContour.Points.end(), aPoints.begin() + aFirst, aPoints.end());
+        }
+        TopoDS_Vertex aFirstVertex, aLastVertex;
+        TopExp::Vertices(aWire, aFirstVertex, aLastVertex);
+        aContour.IsClosed = !aFirstVertex.IsNull() && aFirstVertex.IsSame(aLastVertex);
+        if (aContour.Points.size() > 1) {
+            theContours.push_back(aContour);
+        }
+    }
+}
+%}
+%extend BRepAlgoAPI_Section {
+    %feature("autodoc", "Section a shape by a family of parallel planes and discretize the sections, in parallel across the planes and with the GIL released.
+
+Each plane is a non destructive BRepAlgoAPI_Section, so that the concurrent sections don't modify the tolerances of the shared shape. The section edges are chained into wires, that are discretized with GCPnts_QuasiUniformDeflection, in the order of the wires.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theNX: float
+theNY: float
+theNZ: float, the normal of the planes
+theOffsets: a bytes-like object of float64 offsets, the plane i is the set of the points P such that N.P = offset i, with N the normalized normal
+theDeflection: float
+theParallel: bool
+
+Return
+-------
+tuple: four bytes objects, the float64 x, y, z of all the contour points, the int64 offsets of the contours into the points, the int64 offsets of the slices into the contours and one uint8 per contour, 1 if the contour is closed. The last point of a closed contour is its first one.") SliceContours;
+    static PyObject* SliceContours(const TopoDS_Shape& theShape, const Standard_Real theNX, const Standard_Real theNY, const Standard_Real theNZ, PyObject* theOffsets, const Standard_Real theDeflection, const Standard_Boolean theParallel=Standard_True) {
+        Py_buffer aView;
+        if (PyObject_GetBuffer(theOffsets, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("SliceContours expects a bytes-like object of float64 offsets");
+        }
+        std::vector<double> aPlaneOffsets((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+        PyBuffer_Release(&aView);
+        const gp_Dir aNormal(theNX, theNY, theNZ);
+        const Standard_Integer aNbSlices = (Standard_Integer) aPlaneOffsets.size();
+        std::vector<std::vector<BRepAlgoAPI_SliceContour> > aSlices(aNbSlices);
+        Standard_Boolean isFailed = Standard_False;
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbSlices, [&](const Standard_Integer i) {
+            try {
+                OCC_CATCH_SIGNALS
+                const gp_Pln aPlane(gp_Pnt(aNormal.XYZ() * aPlaneOffsets[i]), aNormal);
+                BRepAlgoAPI_Section aSection(theShape, aPlane, Standard_False);
+                aSection.SetNonDestructive(Standard_True);
+                aSection.SetRunParallel(Standard_False);
+                aSection.Build();
+                if (!aSection.IsDone()) {
+                    isFailed = Standard_True;
+                    return;
+                }
+                BRepAlgoAPI_SectionContours(aSection.Shape(), theDeflection, aSlices[i]);
+            } catch (Standard_Failure const&) {
+                isFailed = Standard_True;
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        if (isFailed) {
+            throw Standard_Failure("SliceContours failed to section the shape");
+        }
+        std::vector<double> aCoords;
+        std::vector<long long> aContourOffsets(1, 0);
+        std::vector<long long> aSliceOffsets(1, 0);
+        std::vector<unsigned char> isClosed;
+        for (Standard_Integer i = 0; i < aNbSlices; ++i) {
+            for (size_t c = 0; c < aSlices[i].size(); ++c) {
+                const BRepAlgoAPI_SliceContour& aContour = aSlices[i][c];
+                for (size_t p = 0; p < aContour.Points.size(); ++p) {
+                    aCoords.push_back(aContour.Points[p].X());
+                    aCoords.push_back(aContour.Points[p].Y());
+                    aCoords.push_back(aContour.Points[p].Z());
+                }
+                aContourOffsets.push_back((long long) (aCoords.size() / 3));
+                isClosed.push_back(aContour.IsClosed ? 1 : 0);
+            }
+            aSliceOffsets.push_back((long long) isClosed.size());
+        }
+        return Py_BuildValue("(NNNN)",
+            PyBytes_FromStringAndSize((const char*) aCoords.data(), aCoords.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aContourOffsets.data(), aContourOffsets.size() * sizeof(long long)),
+            PyBytes_FromStringAndSize((const char*) aSliceOffsets.data(), aSliceOffsets.size() * sizeof(long long)),
+            PyBytes_FromStringAndSize((const char*) isClosed.data(), isClosed.size()));
+    }
+};
+
 /* harray1 classes */
 /* harray2 classes */
 /* hsequence classes */
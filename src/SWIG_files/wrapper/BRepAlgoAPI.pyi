@@ -164,6 +164,8 @@ class BRepAlgoAPI_Section(BRepAlgoAPI_BooleanOperation):
     def Init2(self, Pl: gp_Pln) -> None: ...
     @overload
     def Init2(self, Sf: Geom_Surface) -> None: ...
+    @staticmethod
+    def SliceContours(theShape: TopoDS_Shape, theNX: float, theNY: float, theNZ: float, theOffsets: bytes, theDeflection: float, theParallel: Optional[bool] = True) -> Tuple[bytes, bytes, bytes, bytes]: ...
 
 # harray1 classes
 # harray2 classes
@@ -176,6 +176,59 @@ Adds the shape S to the bounding box B. This algorithm builds precise bounding b
 	__repr__ = _dumps_object
 	}
 };
+%{
+#include <vector>
+#include <limits>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopoDS_Iterator.hxx>
+%}
+%extend BRepBndLib {
+    %feature("autodoc", "Compute the bounding box of each sub-shape of a compound, in parallel across the sub-shapes and with the GIL released.
+
+Parameters
+----------
+theShapes: TopoDS_Shape, the direct sub-shapes of theShapes are boxed, in order
+theMethod: int, 0 for Add without triangulation, i.e. from the geometry and the control points, 1 for Add with the existing triangulations, 2 for AddOptimal
+theGap: float, the gap of the boxes
+theParallel: bool
+
+Return
+-------
+bytes: the float64 xmin, ymin, zmin, xmax, ymax, zmax of each box, NaN for a void box.") BoundingBoxes;
+    static PyObject* BoundingBoxes(const TopoDS_Shape& theShapes, const Standard_Integer theMethod, const Standard_Real theGap, const Standard_Boolean theParallel=Standard_True) {
+        if (theMethod < 0 || theMethod > 2) {
+            throw Standard_Failure("Unknown bounding box method");
+        }
+        std::vector<TopoDS_Shape> aShapes;
+        for (TopoDS_Iterator it(theShapes); it.More(); it.Next()) {
+            aShapes.push_back(it.Value());
+        }
+        const Standard_Integer aNbShapes = (Standard_Integer) aShapes.size();
+        std::vector<double> aBoxes(aNbShapes * 6, std::numeric_limits<double>::quiet_NaN());
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbShapes, [&](const Standard_Integer i) {
+            try {
+                OCC_CATCH_SIGNALS
+                Bnd_Box aBox;
+                aBox.SetGap(theGap);
+                if (theMethod == 2) {
+                    BRepBndLib::AddOptimal(aShapes[i], aBox, Standard_True, Standard_True);
+                } else {
+                    BRepBndLib::Add(aShapes[i], aBox, theMethod == 1);
+                }
+                if (!aBox.IsVoid()) {
+                    double* aRow = &aBoxes[i * 6];
+                    aBox.Get(aRow[0], aRow[1], aRow[2], aRow[3], aRow[4], aRow[5]);
+                }
+            } catch (Standard_Failure const&) {
+                // the box of a shape that can't be evaluated is left void
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return PyBytes_FromStringAndSize((const char*) aBoxes.data(), aBoxes.size() * sizeof(double));
+    }
+};
 
 /* harray1 classes */
 /* harray2 classes */
@@ -16,6 +16,8 @@ class brepbndlib:
     def AddOBB(theS: TopoDS_Shape, theOBB: Bnd_OBB, theIsTriangulationUsed: Optional[bool] = True, theIsOptimal: Optional[bool] = False, theIsShapeToleranceUsed: Optional[bool] = True) -> None: ...
     @staticmethod
     def AddOptimal(S: TopoDS_Shape, B: Bnd_Box, useTriangulation: Optional[bool] = True, useShapeTolerance: Optional[bool] = False) -> None: ...
+    @staticmethod
+    def BoundingBoxes(theShapes: TopoDS_Shape, theMethod: int, theGap: float, theParallel: Optional[bool] = True) -> bytes: ...
 
 # harray1 classes
 # harray2 classes
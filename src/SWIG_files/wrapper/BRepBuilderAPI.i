@@ -2821,11 +2821,109 @@ Returns the second vertex of the edge. May be Null. //! Warning The returned ver
 };
 
 
+%{
+#include <vector>
+#include <GeomAPI_PointsToBSpline.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TColgp_Array1OfPnt.hxx>
+// copy the ragged float64 (x, y, z) points and int64 offsets of a batch of curves
+static void BRepBuilderAPI_ReadRaggedPoints(PyObject* thePoints, PyObject* theOffsets, std::vector<double>& theCoords, std::vector<long long>& theRanges) {
+    Py_buffer aView;
+    if (PyObject_GetBuffer(thePoints, &aView, PyBUF_SIMPLE) != 0) {
+        PyErr_Clear();
+        throw Standard_Failure("The points must be a bytes-like object of float64");
+    }
+    theCoords.assign((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+    PyBuffer_Release(&aView);
+    if (PyObject_GetBuffer(theOffsets, &aView, PyBUF_SIMPLE) != 0) {
+        PyErr_Clear();
+        throw Standard_Failure("The offsets must be a bytes-like object of int64");
+    }
+    theRanges.assign((const long long*) aView.buf, (const long long*) aView.buf + aView.len / sizeof(long long));
+    PyBuffer_Release(&aView);
+    if (theRanges.empty() || theRanges.front() != 0 || theRanges.back() * 3 != (long long) theCoords.size()) {
+        throw Standard_Failure("The offsets must start at 0 and end at the number of points");
+    }
+    for (size_t i = 1; i < theRanges.size(); ++i) {
+        if (theRanges[i] < theRanges[i - 1]) {
+            throw Standard_Failure("The offsets must increase");
+        }
+    }
+}
+// gather the built shapes into a compound, in order
+static TopoDS_Shape BRepBuilderAPI_GatherShapes(const std::vector<TopoDS_Shape>& theShapes, const char* theError) {
+    BRep_Builder aBuilder;
+    TopoDS_Compound aCompound;
+    aBuilder.MakeCompound(aCompound);
+    for (size_t i = 0; i < theShapes.size(); ++i) {
+        if (theShapes[i].IsNull()) {
+            throw Standard_Failure((TCollection_AsciiString(theError) + TCollection_AsciiString((Standard_Integer) i)).ToCString());
+        }
+        aBuilder.Add(aCompound, theShapes[i]);
+    }
+    return aCompound;
+}
+%}
 %extend BRepBuilderAPI_MakeEdge {
 	%pythoncode {
 	__repr__ = _dumps_object
 	}
 };
+%extend BRepBuilderAPI_MakeEdge {
+    %feature("autodoc", "Build one BSpline edge approximating each curve of a batch of points, in parallel across the curves and with the GIL released.
+
+Parameters
+----------
+thePoints: a bytes-like object of the float64 x, y, z of all the points
+theOffsets: a bytes-like object of int64 offsets, the points of the curve i are the points theOffsets[i] to theOffsets[i + 1] - 1
+theDegMin: int
+theDegMax: int
+theContinuity: GeomAbs_Shape
+theTol3D: float
+theParallel: bool
+
+Return
+-------
+TopoDS_Compound: the edges, in the order of the curves.
+
+Description
+-----------
+Each curve is approximated by GeomAPI_PointsToBSpline. A RuntimeError is raised if one of the approximations fails.") BSplineEdges;
+    static TopoDS_Shape BSplineEdges(PyObject* thePoints, PyObject* theOffsets, const Standard_Integer theDegMin=3, const Standard_Integer theDegMax=8, const Standard_Integer theContinuity=4, const Standard_Real theTol3D=1.0e-3, const Standard_Boolean theParallel=Standard_True) {
+        std::vector<double> aCoords;
+        std::vector<long long> aRanges;
+        BRepBuilderAPI_ReadRaggedPoints(thePoints, theOffsets, aCoords, aRanges);
+        const Standard_Integer aNbCurves = (Standard_Integer) aRanges.size() - 1;
+        std::vector<TopoDS_Shape> anEdges(aNbCurves);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbCurves, [&](const Standard_Integer i) {
+            const Standard_Integer aNbPoints = (Standard_Integer) (aRanges[i + 1] - aRanges[i]);
+            if (aNbPoints < 2) {
+                return;
+            }
+            try {
+                OCC_CATCH_SIGNALS
+                TColgp_Array1OfPnt aPoints(1, aNbPoints);
+                const double* c = &aCoords[3 * aRanges[i]];
+                for (Standard_Integer j = 0; j < aNbPoints; ++j) {
+                    aPoints.SetValue(j + 1, gp_Pnt(c[3 * j], c[3 * j + 1], c[3 * j + 2]));
+                }
+                GeomAPI_PointsToBSpline anApprox(aPoints, theDegMin, theDegMax, (GeomAbs_Shape) theContinuity, theTol3D);
+                if (anApprox.IsDone()) {
+                    BRepBuilderAPI_MakeEdge aMakeEdge(anApprox.Curve());
+                    if (aMakeEdge.IsDone()) {
+                        anEdges[i] = aMakeEdge.Edge();
+                    }
+                }
+            } catch (Standard_Failure const&) {
+                // the edge is left null, and reported below
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return BRepBuilderAPI_GatherShapes(anEdges, "BSpline approximation failed for curve ");
+    }
+};
 
 /**********************************
 * class BRepBuilderAPI_MakeEdge2d *
@@ -4418,6 +4516,51 @@ Returns the constructed polygonal wire, or the already built part of the polygon
 	__repr__ = _dumps_object
 	}
 };
+%extend BRepBuilderAPI_MakePolygon {
+    %feature("autodoc", "Build one polygonal wire for each polyline of a batch of points, in parallel across the polylines and with the GIL released.
+
+Parameters
+----------
+thePoints: a bytes-like object of the float64 x, y, z of all the points
+theOffsets: a bytes-like object of int64 offsets, the points of the polyline i are the points theOffsets[i] to theOffsets[i + 1] - 1
+theClosed: bool, if True, each wire is closed back to its first point
+theParallel: bool
+
+Return
+-------
+TopoDS_Compound: the wires, in the order of the polylines.
+
+Description
+-----------
+Consecutive coincident points are skipped. A RuntimeError is raised if a polyline has less than two distinct points.") Polylines;
+    static TopoDS_Shape Polylines(PyObject* thePoints, PyObject* theOffsets, const Standard_Boolean theClosed=Standard_False, const Standard_Boolean theParallel=Standard_True) {
+        std::vector<double> aCoords;
+        std::vector<long long> aRanges;
+        BRepBuilderAPI_ReadRaggedPoints(thePoints, theOffsets, aCoords, aRanges);
+        const Standard_Integer aNbPolylines = (Standard_Integer) aRanges.size() - 1;
+        std::vector<TopoDS_Shape> aWires(aNbPolylines);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbPolylines, [&](const Standard_Integer i) {
+            try {
+                OCC_CATCH_SIGNALS
+                BRepBuilderAPI_MakePolygon aMakePolygon;
+                for (long long j = aRanges[i]; j < aRanges[i + 1]; ++j) {
+                    aMakePolygon.Add(gp_Pnt(aCoords[3 * j], aCoords[3 * j + 1], aCoords[3 * j + 2]));
+                }
+                if (theClosed) {
+                    aMakePolygon.Close();
+                }
+                if (aMakePolygon.IsDone()) {
+                    aWires[i] = aMakePolygon.Wire();
+                }
+            } catch (Standard_Failure const&) {
+                // the wire is left null, and reported below
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return BRepBuilderAPI_GatherShapes(aWires, "Can't build the wire of polyline ");
+    }
+};
 
 /***************************************
 * class BRepBuilderAPI_MakeShapeOnMesh *
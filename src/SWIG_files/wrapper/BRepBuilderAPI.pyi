@@ -293,6 +293,8 @@ class BRepBuilderAPI_MakeEdge(BRepBuilderAPI_MakeShape):
     def __init__(self, L: Geom2d_Curve, S: Geom_Surface, P1: gp_Pnt, P2: gp_Pnt, p1: float, p2: float) -> None: ...
     @overload
     def __init__(self, L: Geom2d_Curve, S: Geom_Surface, V1: TopoDS_Vertex, V2: TopoDS_Vertex, p1: float, p2: float) -> None: ...
+    @staticmethod
+    def BSplineEdges(thePoints: bytes, theOffsets: bytes, theDegMin: Optional[int] = 3, theDegMax: Optional[int] = 8, theContinuity: Optional[int] = 4, theTol3D: Optional[float] = 1.0e-3, theParallel: Optional[bool] = True) -> TopoDS_Compound: ...
     def Edge(self) -> TopoDS_Edge: ...
     def Error(self) -> BRepBuilderAPI_EdgeError: ...
     @overload
@@ -479,6 +481,8 @@ class BRepBuilderAPI_MakePolygon(BRepBuilderAPI_MakeShape):
     def FirstVertex(self) -> TopoDS_Vertex: ...
     def IsDone(self) -> bool: ...
     def LastVertex(self) -> TopoDS_Vertex: ...
+    @staticmethod
+    def Polylines(thePoints: bytes, theOffsets: bytes, theClosed: Optional[bool] = False, theParallel: Optional[bool] = True) -> TopoDS_Compound: ...
     def Wire(self) -> TopoDS_Wire: ...
 
 class BRepBuilderAPI_MakeShapeOnMesh(BRepBuilderAPI_MakeShape):
@@ -1273,6 +1273,82 @@ Classify an infinite point with the tolerance Tol on the solid S. Useful for com
 	}
 };
 
+%{
+#include <algorithm>
+#include <vector>
+#include <BRepBndLib.hxx>
+#include <Bnd_Box.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+%}
+%extend BRepClass3d_SolidClassifier {
+    %feature("autodoc", "Classify a batch of points against a solid, in parallel and with the GIL released.
+
+The points outside the bounding box of the solid are OUT without any further test. The other points are split into one block per thread, each block prepares one BRepClass3d_SolidExplorer, i.e. the box tree of the faces, edges and vertices, and reuses it for all its points.
+
+Parameters
+----------
+theShape: TopoDS_Shape, a solid, or a compound of solids
+thePoints: a bytes-like object of float64 x, y, z coordinates
+theTolerance: float
+theParallel: bool
+
+Return
+-------
+bytes: one int8 TopAbs_State per point, TopAbs_IN=0, TopAbs_OUT=1, TopAbs_ON=2, TopAbs_UNKNOWN=3.") ClassifyPoints;
+    static PyObject* ClassifyPoints(const TopoDS_Shape& theShape, PyObject* thePoints, const Standard_Real theTolerance, const Standard_Boolean theParallel=Standard_True) {
+        Py_buffer aView;
+        if (PyObject_GetBuffer(thePoints, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("ClassifyPoints expects a bytes-like object of float64 points");
+        }
+        std::vector<double> aCoords((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+        PyBuffer_Release(&aView);
+        if (aCoords.size() % 3 != 0) {
+            throw Standard_Failure("ClassifyPoints expects 3 float64 values per point");
+        }
+        const Standard_Integer aNbPoints = (Standard_Integer) (aCoords.size() / 3);
+        std::vector<signed char> aStates(aNbPoints, (signed char) TopAbs_OUT);
+        // the bounding box pre-filter
+        Bnd_Box aBox;
+        BRepBndLib::Add(theShape, aBox, Standard_False);
+        aBox.Enlarge(theTolerance);
+        std::vector<Standard_Integer> aCandidates;
+        for (Standard_Integer i = 0; i < aNbPoints; ++i) {
+            if (!aBox.IsOut(gp_Pnt(aCoords[3 * i], aCoords[3 * i + 1], aCoords[3 * i + 2]))) {
+                aCandidates.push_back(i);
+            }
+        }
+        const Standard_Integer aNbCandidates = (Standard_Integer) aCandidates.size();
+        // one prepared explorer per block, at least 64 points per block
+        Standard_Integer aNbBlocks = theParallel ? OSD_Parallel::NbLogicalProcessors() : 1;
+        aNbBlocks = std::max(1, std::min(aNbBlocks, aNbCandidates / 64));
+        Standard_Boolean isFailed = Standard_False;
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbBlocks, [&](const Standard_Integer theBlock) {
+            try {
+                OCC_CATCH_SIGNALS
+                BRepClass3d_SolidExplorer anExplorer(theShape);
+                BRepClass3d_SClassifier aClassifier;
+                const Standard_Integer aFirst = (Standard_Integer) ((long long) aNbCandidates * theBlock / aNbBlocks);
+                const Standard_Integer aLast = (Standard_Integer) ((long long) aNbCandidates * (theBlock + 1) / aNbBlocks);
+                for (Standard_Integer k = aFirst; k < aLast; ++k) {
+                    const Standard_Integer i = aCandidates[k];
+                    aClassifier.Perform(anExplorer, gp_Pnt(aCoords[3 * i], aCoords[3 * i + 1], aCoords[3 * i + 2]), theTolerance);
+                    aStates[i] = (signed char) aClassifier.State();
+                }
+            } catch (Standard_Failure const&) {
+                isFailed = Standard_True;
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        if (isFailed) {
+            throw Standard_Failure("ClassifyPoints failed to classify the points");
+        }
+        return PyBytes_FromStringAndSize((const char*) aStates.data(), aStates.size());
+    }
+};
+
 /* python proxy for excluded classes */
 %pythoncode {
 @classnotwrapped
@@ -112,6 +112,8 @@ class BRepClass3d_SolidClassifier(BRepClass3d_SClassifier):
     def __init__(self, S: TopoDS_Shape) -> None: ...
     @overload
     def __init__(self, S: TopoDS_Shape, P: gp_Pnt, Tol: float) -> None: ...
+    @staticmethod
+    def ClassifyPoints(theShape: TopoDS_Shape, thePoints: bytes, theTolerance: float, theParallel: Optional[bool] = True) -> bytes: ...
     def Destroy(self) -> None: ...
     def Load(self, S: TopoDS_Shape) -> None: ...
     def Perform(self, P: gp_Pnt, Tol: float) -> None: ...
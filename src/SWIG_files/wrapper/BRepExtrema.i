@@ -609,6 +609,167 @@ Returns the value of the minimum distance. .
 	}
 };
 
+%{
+#include <limits>
+#include <vector>
+#include <BRep_Tool.hxx>
+#include <BRepBndLib.hxx>
+#include <BRepBuilderAPI_MakeVertex.hxx>
+#include <BVH_BoxSet.hxx>
+#include <BVH_Distance.hxx>
+#include <BVH_Tools.hxx>
+#include <OSD_Parallel.hxx>
+#include <Precision.hxx>
+#include <ShapeAnalysis_Surface.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopExp.hxx>
+#include <TopTools_IndexedMapOfShape.hxx>
+// the box tree of the faces of a shape, the elements are the zero based face indices
+typedef BVH_BoxSet<Standard_Real, 3, Standard_Integer> BRepExtrema_FaceBoxSet;
+// build the box tree of the faces of theFaces, faces without any geometry are left out
+static void BRepExtrema_BuildFaceBoxSet(const TopTools_IndexedMapOfShape& theFaces, BRepExtrema_FaceBoxSet& theBoxSet) {
+    for (Standard_Integer i = 1; i <= theFaces.Extent(); ++i) {
+        Bnd_Box aBox;
+        BRepBndLib::Add(theFaces(i), aBox, Standard_False);
+        if (aBox.IsVoid()) {
+            continue;
+        }
+        Standard_Real aXmin, aYmin, aZmin, aXmax, aYmax, aZmax;
+        aBox.Get(aXmin, aYmin, aZmin, aXmax, aYmax, aZmax);
+        theBoxSet.Add(i - 1, BVH_Box<Standard_Real, 3>(BVH_Vec3d(aXmin, aYmin, aZmin), BVH_Vec3d(aXmax, aYmax, aZmax)));
+    }
+    // the tree is built before any concurrent traversal
+    theBoxSet.Build();
+}
+// branch and bound search of the closest point on the faces of the box tree,
+// the metric is the square distance
+class BRepExtrema_ClosestFaceSelector : public BVH_Distance<Standard_Real, 3, BVH_Vec3d, BRepExtrema_FaceBoxSet> {
+public:
+    BRepExtrema_ClosestFaceSelector(const TopTools_IndexedMapOfShape& theFaces, const gp_Pnt& thePoint)
+    : myFaces(theFaces), myVertex(BRepBuilderAPI_MakeVertex(thePoint).Vertex()), myFace(-1), myU(0.0), myV(0.0), myIsInFace(Standard_False) {
+        SetObject(BVH_Vec3d(thePoint.X(), thePoint.Y(), thePoint.Z()));
+    }
+    Standard_Boolean RejectNode(const BVH_Vec3d& theCornerMin, const BVH_Vec3d& theCornerMax, Standard_Real& theMetric) const Standard_OVERRIDE {
+        theMetric = BVH_Tools<Standard_Real, 3>::PointBoxSquareDistance(myObject, theCornerMin, theCornerMax);
+        return RejectMetric(theMetric);
+    }
+    Standard_Boolean Accept(const Standard_Integer theIndex, const Standard_Real&) Standard_OVERRIDE {
+        // the leaves may hold several faces, each face box is tested first
+        const BVH_Box<Standard_Real, 3> aBox = myBVHSet->Box(theIndex);
+        if (RejectMetric(BVH_Tools<Standard_Real, 3>::PointBoxSquareDistance(myObject, aBox.CornerMin(), aBox.CornerMax()))) {
+            return Standard_False;
+        }
+        const Standard_Integer aFace = myBVHSet->Element(theIndex);
+        BRepExtrema_DistShapeShape aDist(myVertex, myFaces(aFace + 1), Extrema_ExtFlag_MIN);
+        if (!aDist.IsDone() || aDist.NbSolution() == 0 || aDist.Value() * aDist.Value() >= myDistance) {
+            return Standard_False;
+        }
+        myDistance = aDist.Value() * aDist.Value();
+        myFace = aFace;
+        myPoint = aDist.PointOnShape2(1);
+        myIsInFace = aDist.SupportTypeShape2(1) == BRepExtrema_IsInFace;
+        if (myIsInFace) {
+            aDist.ParOnFaceS2(1, myU, myV);
+        }
+        return Standard_True;
+    }
+    // the zero based index of the closest face, -1 if none
+    Standard_Integer Face() const { return myFace; }
+    const gp_Pnt& Point() const { return myPoint; }
+    // the (u, v) parameters of the closest point on the closest face
+    void Parameters(Standard_Real& theU, Standard_Real& theV) const {
+        if (myIsInFace) {
+            theU = myU;
+            theV = myV;
+            return;
+        }
+        // the closest point is on an edge or a vertex of the face
+        const TopoDS_Face& aFace = TopoDS::Face(myFaces(myFace + 1));
+        ShapeAnalysis_Surface aSurface(BRep_Tool::Surface(aFace));
+        const gp_Pnt2d aUV = aSurface.ValueOfUV(myPoint, Precision::Confusion());
+        theU = aUV.X();
+        theV = aUV.Y();
+    }
+private:
+    const TopTools_IndexedMapOfShape& myFaces;
+    TopoDS_Vertex myVertex;
+    Standard_Integer myFace;
+    gp_Pnt myPoint;
+    Standard_Real myU;
+    Standard_Real myV;
+    Standard_Boolean myIsInFace;
+};
+%}
+%extend BRepExtrema_DistShapeShape {
+    %feature("autodoc", "Project a batch of points on the faces of a shape, in parallel across the points and with the GIL released.
+
+The faces are sorted into a box tree, the search of each point visits the boxes closest first and skips the boxes farther than the closest face found so far. The distance to each visited face is a BRepExtrema_DistShapeShape, so that the face boundaries are taken into account.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+thePoints: a bytes-like object of float64 x, y, z coordinates
+theParallel: bool
+
+Return
+-------
+tuple: four bytes objects, the float64 x, y, z of the closest points, the float64 distances, the int32 zero based indices of the closest faces in the TopExp::MapShapes order and the float64 u, v of the closest points on these faces. Points are NaN and indices are -1 if the shape has no face.") ProjectPoints;
+    static PyObject* ProjectPoints(const TopoDS_Shape& theShape, PyObject* thePoints, const Standard_Boolean theParallel=Standard_True) {
+        Py_buffer aView;
+        if (PyObject_GetBuffer(thePoints, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("ProjectPoints expects a bytes-like object of float64 points");
+        }
+        std::vector<double> aCoords((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+        PyBuffer_Release(&aView);
+        if (aCoords.size() % 3 != 0) {
+            throw Standard_Failure("ProjectPoints expects 3 float64 values per point");
+        }
+        const Standard_Integer aNbPoints = (Standard_Integer) (aCoords.size() / 3);
+        const double aNaN = std::numeric_limits<double>::quiet_NaN();
+        std::vector<double> aClosest(aNbPoints * 3, aNaN);
+        std::vector<double> aDistances(aNbPoints, aNaN);
+        std::vector<int> aFaceIds(aNbPoints, -1);
+        std::vector<double> aUVs(aNbPoints * 2, aNaN);
+        TopTools_IndexedMapOfShape aFaces;
+        TopExp::MapShapes(theShape, TopAbs_FACE, aFaces);
+        BRepExtrema_FaceBoxSet aBoxSet;
+        BRepExtrema_BuildFaceBoxSet(aFaces, aBoxSet);
+        Standard_Boolean isFailed = Standard_False;
+        if (aBoxSet.Size() > 0) {
+            Py_BEGIN_ALLOW_THREADS
+            OSD_Parallel::For(0, aNbPoints, [&](const Standard_Integer i) {
+                try {
+                    OCC_CATCH_SIGNALS
+                    BRepExtrema_ClosestFaceSelector aSelector(aFaces, gp_Pnt(aCoords[3 * i], aCoords[3 * i + 1], aCoords[3 * i + 2]));
+                    aSelector.SetBVHSet(&aBoxSet);
+                    const Standard_Real aSqDistance = aSelector.ComputeDistance();
+                    if (aSelector.Face() < 0) {
+                        return;
+                    }
+                    aClosest[3 * i] = aSelector.Point().X();
+                    aClosest[3 * i + 1] = aSelector.Point().Y();
+                    aClosest[3 * i + 2] = aSelector.Point().Z();
+                    aDistances[i] = Sqrt(aSqDistance);
+                    aFaceIds[i] = aSelector.Face();
+                    aSelector.Parameters(aUVs[2 * i], aUVs[2 * i + 1]);
+                } catch (Standard_Failure const&) {
+                    isFailed = Standard_True;
+                }
+            }, !theParallel);
+            Py_END_ALLOW_THREADS
+        }
+        if (isFailed) {
+            throw Standard_Failure("ProjectPoints failed to project the points");
+        }
+        return Py_BuildValue("(NNNN)",
+            PyBytes_FromStringAndSize((const char*) aClosest.data(), aClosest.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aDistances.data(), aDistances.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aFaceIds.data(), aFaceIds.size() * sizeof(int)),
+            PyBytes_FromStringAndSize((const char*) aUVs.data(), aUVs.size() * sizeof(double)));
+    }
+};
+
 /*******************************
 * class BRepExtrema_DistanceSS *
 *******************************/
@@ -2461,6 +2622,128 @@ Returns tolerance value for overlap test (distance between shapes).
 	}
 };
 
+%{
+#include <vector>
+#include <BRep_Tool.hxx>
+#include <BRepClass3d_SolidClassifier.hxx>
+#include <BRepExtrema_OverlapTool.hxx>
+#include <BRepExtrema_TriangleSet.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopExp.hxx>
+#include <TopExp_Explorer.hxx>
+#include <TopoDS_Iterator.hxx>
+#include <TopTools_IndexedMapOfShape.hxx>
+// true if a vertex of theInner is inside the solids of theOuter
+static Standard_Boolean BRepExtrema_IsVertexInside(const TopoDS_Shape& theInner, const TopoDS_Shape& theOuter, const Standard_Real theTolerance) {
+    TopExp_Explorer aVertexExp(theInner, TopAbs_VERTEX);
+    TopExp_Explorer aSolidExp(theOuter, TopAbs_SOLID);
+    if (!aVertexExp.More() || !aSolidExp.More()) {
+        return Standard_False;
+    }
+    const gp_Pnt aPoint = BRep_Tool::Pnt(TopoDS::Vertex(aVertexExp.Current()));
+    for (; aSolidExp.More(); aSolidExp.Next()) {
+        BRepClass3d_SolidClassifier aClassifier(aSolidExp.Current(), aPoint, theTolerance);
+        if (aClassifier.State() == TopAbs_IN) {
+            return Standard_True;
+        }
+    }
+    return Standard_False;
+}
+%}
+%extend BRepExtrema_ShapeProximity {
+    %feature("autodoc", "Test pairs of shapes for overlap, in parallel across the pairs and with the GIL released.
+
+The triangle set of each shape, and its box tree, is built once, in parallel, whatever the number of pairs the shape belongs to. Each pair is then tested with a BRepExtrema_OverlapTool on the two triangle sets. The shapes must be meshed. A pair whose triangles don't overlap is tested for containment, by classifying a vertex of each shape against the solids of the other.
+
+Parameters
+----------
+theShapes: TopoDS_Shape, a compound whose direct sub-shapes are the shapes
+thePairs: a bytes-like object of int32 pairs of zero based indices of the sub-shapes
+theTolerance: float, the triangles closer than theTolerance overlap
+theParallel: bool
+
+Return
+-------
+bytes: one int8 per pair, 0 if the shapes don't interfere, 1 if their triangles overlap, 2 if one shape is inside the other.") OverlapPairs;
+    static PyObject* OverlapPairs(const TopoDS_Shape& theShapes, PyObject* thePairs, const Standard_Real theTolerance, const Standard_Boolean theParallel=Standard_True) {
+        std::vector<TopoDS_Shape> aShapes;
+        for (TopoDS_Iterator it(theShapes); it.More(); it.Next()) {
+            aShapes.push_back(it.Value());
+        }
+        Py_buffer aView;
+        if (PyObject_GetBuffer(thePairs, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("OverlapPairs expects a bytes-like object of int32 pairs");
+        }
+        std::vector<int> aPairs((const int*) aView.buf, (const int*) aView.buf + aView.len / sizeof(int));
+        PyBuffer_Release(&aView);
+        if (aPairs.size() % 2 != 0) {
+            throw Standard_Failure("OverlapPairs expects 2 int32 values per pair");
+        }
+        const Standard_Integer aNbShapes = (Standard_Integer) aShapes.size();
+        std::vector<char> isUsed(aNbShapes, 0);
+        for (size_t k = 0; k < aPairs.size(); ++k) {
+            if (aPairs[k] < 0 || aPairs[k] >= aNbShapes) {
+                throw Standard_Failure("OverlapPairs: shape index out of range");
+            }
+            isUsed[aPairs[k]] = 1;
+        }
+        const Standard_Integer aNbPairs = (Standard_Integer) (aPairs.size() / 2);
+        std::vector<opencascade::handle<BRepExtrema_TriangleSet> > aSets(aNbShapes);
+        std::vector<signed char> aStatus(aNbPairs, 0);
+        Standard_Boolean isFailed = Standard_False;
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbShapes, [&](const Standard_Integer i) {
+            if (!isUsed[i]) {
+                return;
+            }
+            try {
+                OCC_CATCH_SIGNALS
+                TopTools_IndexedMapOfShape aFaces;
+                TopExp::MapShapes(aShapes[i], TopAbs_FACE, aFaces);
+                BRepExtrema_ShapeList aFaceList;
+                for (Standard_Integer f = 1; f <= aFaces.Extent(); ++f) {
+                    aFaceList.Append(aFaces(f));
+                }
+                aSets[i] = new BRepExtrema_TriangleSet(aFaceList);
+                // the tree is built before any concurrent traversal
+                aSets[i]->BVH();
+            } catch (Standard_Failure const&) {
+                isFailed = Standard_True;
+            }
+        }, !theParallel);
+        if (!isFailed) {
+            OSD_Parallel::For(0, aNbPairs, [&](const Standard_Integer k) {
+                const Standard_Integer i = aPairs[2 * k];
+                const Standard_Integer j = aPairs[2 * k + 1];
+                try {
+                    OCC_CATCH_SIGNALS
+                    if (aSets[i]->Size() > 0 && aSets[j]->Size() > 0) {
+                        BRepExtrema_OverlapTool aTool(aSets[i], aSets[j]);
+                        aTool.Perform(theTolerance);
+                        if (aTool.IsDone() && !aTool.OverlapSubShapes1().IsEmpty()) {
+                            aStatus[k] = 1;
+                            return;
+                        }
+                    }
+                    if (BRepExtrema_IsVertexInside(aShapes[i], aShapes[j], theTolerance)
+                     || BRepExtrema_IsVertexInside(aShapes[j], aShapes[i], theTolerance)) {
+                        aStatus[k] = 2;
+                    }
+                } catch (Standard_Failure const&) {
+                    isFailed = Standard_True;
+                }
+            }, !theParallel);
+        }
+        Py_END_ALLOW_THREADS
+        if (isFailed) {
+            throw Standard_Failure("OverlapPairs failed to test the pairs");
+        }
+        return PyBytes_FromStringAndSize((const char*) aStatus.data(), aStatus.size());
+    }
+};
+
 /*********************************
 * class BRepExtrema_SolutionElem *
 *********************************/
@@ -59,6 +59,8 @@ class BRepExtrema_DistShapeShape:
     def Perform(self, theRange: Optional[Message_ProgressRange] = Message_ProgressRange()) -> bool: ...
     def PointOnShape1(self, N: int) -> gp_Pnt: ...
     def PointOnShape2(self, N: int) -> gp_Pnt: ...
+    @staticmethod
+    def ProjectPoints(theShape: TopoDS_Shape, thePoints: bytes, theParallel: Optional[bool] = True) -> Tuple[bytes, bytes, bytes, bytes]: ...
     def SetAlgo(self, A: Extrema_ExtAlgo) -> None: ...
     def SetDeflection(self, theDeflection: float) -> None: ...
     def SetFlag(self, F: Extrema_ExtFlag) -> None: ...
@@ -188,6 +190,8 @@ class BRepExtrema_ShapeProximity:
     def IsDone(self) -> bool: ...
     def LoadShape1(self, theShape1: TopoDS_Shape) -> bool: ...
     def LoadShape2(self, theShape2: TopoDS_Shape) -> bool: ...
+    @staticmethod
+    def OverlapPairs(theShapes: TopoDS_Shape, thePairs: bytes, theTolerance: float, theParallel: Optional[bool] = True) -> bytes: ...
     def OverlapSubShapes1(self) -> BRepExtrema_MapOfIntegerPackedMapOfInteger: ...
     def OverlapSubShapes2(self) -> BRepExtrema_MapOfIntegerPackedMapOfInteger: ...
     def Perform(self) -> None: ...
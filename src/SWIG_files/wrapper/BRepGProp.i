@@ -272,6 +272,88 @@ No available documentation.
 	__repr__ = _dumps_object
 	}
 };
+%{
+#include <limits>
+#include <vector>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopoDS_Iterator.hxx>
+#include <TopExp_Explorer.hxx>
+#include <BRep_Builder.hxx>
+#include <TopoDS_Compound.hxx>
+%}
+%extend BRepGProp {
+    %feature("autodoc", "Compute the mass properties of each sub-shape of a compound, in parallel across the sub-shapes and with the GIL released.
+
+Parameters
+----------
+theShapes: TopoDS_Shape, the direct sub-shapes of theShapes are measured, in order
+theUseTriangulation: bool, if True, the faces that have a triangulation are measured from it
+theParallel: bool
+
+Return
+-------
+bytes: the float64 rows of 14 properties, one per sub-shape: the volume, the area, the x, y, z of the centre of mass and the 9 terms of the matrix of inertia at the centre of mass, row by row.
+
+Description
+-----------
+The volume is the one of the solids of a sub-shape, it is 0 for the sub-shapes without solids, such as faces or open shells. The centre of mass and the matrix of inertia are the ones of the volume, or of the surface for the sub-shapes without solids. The properties of a sub-shape that can't be measured are NaN.") MassProperties;
+    static PyObject* MassProperties(const TopoDS_Shape& theShapes, const Standard_Boolean theUseTriangulation=Standard_False, const Standard_Boolean theParallel=Standard_True) {
+        const Standard_Integer aNbColumns = 14;
+        std::vector<TopoDS_Shape> aShapes;
+        for (TopoDS_Iterator it(theShapes); it.More(); it.Next()) {
+            aShapes.push_back(it.Value());
+        }
+        const Standard_Integer aNbShapes = (Standard_Integer) aShapes.size();
+        std::vector<double> aRows(aNbShapes * aNbColumns, 0.0);
+        Py_BEGIN_ALLOW_THREADS
+        OSD_Parallel::For(0, aNbShapes, [&](const Standard_Integer i) {
+            double* aRow = &aRows[i * aNbColumns];
+            try {
+                OCC_CATCH_SIGNALS
+                const TopoDS_Shape& aShape = aShapes[i];
+                // only the solids bound a volume, the volume of a face or an open shell is meaningless
+                TopoDS_Shape aSolids;
+                if (aShape.ShapeType() == TopAbs_SOLID || aShape.ShapeType() == TopAbs_COMPSOLID) {
+                    aSolids = aShape;
+                } else if (aShape.ShapeType() == TopAbs_COMPOUND) {
+                    TopExp_Explorer anExp(aShape, TopAbs_SOLID);
+                    if (anExp.More()) {
+                        TopoDS_Compound aCompound;
+                        BRep_Builder aBuilder;
+                        aBuilder.MakeCompound(aCompound);
+                        for (; anExp.More(); anExp.Next()) {
+                            aBuilder.Add(aCompound, anExp.Current());
+                        }
+                        aSolids = aCompound;
+                    }
+                }
+                GProp_GProps aVolumeProps, aSurfaceProps;
+                if (!aSolids.IsNull()) {
+                    BRepGProp::VolumeProperties(aSolids, aVolumeProps, Standard_False, Standard_False, theUseTriangulation);
+                }
+                BRepGProp::SurfaceProperties(aShape, aSurfaceProps, Standard_False, theUseTriangulation);
+                aRow[0] = aSolids.IsNull() ? 0.0 : aVolumeProps.Mass();
+                aRow[1] = aSurfaceProps.Mass();
+                const GProp_GProps& aProps = aSolids.IsNull() ? aSurfaceProps : aVolumeProps;
+                const gp_Pnt aCentre = aProps.CentreOfMass();
+                aRow[2] = aCentre.X(); aRow[3] = aCentre.Y(); aRow[4] = aCentre.Z();
+                const gp_Mat anInertia = aProps.MatrixOfInertia();
+                for (Standard_Integer r = 1; r <= 3; ++r) {
+                    for (Standard_Integer c = 1; c <= 3; ++c) {
+                        aRow[2 + 3 * r + c - 1] = anInertia(r, c);
+                    }
+                }
+            } catch (Standard_Failure const&) {
+                for (Standard_Integer k = 0; k < aNbColumns; ++k) {
+                    aRow[k] = std::numeric_limits<double>::quiet_NaN();
+                }
+            }
+        }, !theParallel);
+        Py_END_ALLOW_THREADS
+        return PyBytes_FromStringAndSize((const char*) aRows.data(), aRows.size() * sizeof(double));
+    }
+};
 
 /*************************
 * class BRepGProp_Cinert *
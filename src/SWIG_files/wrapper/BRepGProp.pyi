@@ -16,6 +16,8 @@ from OCC.Core.math import *
 class brepgprop:
     @staticmethod
     def LinearProperties(S: TopoDS_Shape, LProps: GProp_GProps, SkipShared: Optional[bool] = False, UseTriangulation: Optional[bool] = False) -> None: ...
+    @staticmethod
+    def MassProperties(theShapes: TopoDS_Shape, theUseTriangulation: Optional[bool] = False, theParallel: Optional[bool] = True) -> bytes: ...
     @overload
     @staticmethod
     def SurfaceProperties(S: TopoDS_Shape, SProps: GProp_GProps, SkipShared: Optional[bool] = False, UseTriangulation: Optional[bool] = False) -> None: ...
@@ -517,6 +517,35 @@ Parameter theRange  the range of progress indicator to fill in.
 ") Write;
 		static Standard_Boolean Write(const TopoDS_Shape & theShape, Standard_CString theFile, const Standard_Boolean theWithTriangles, const Standard_Boolean theWithNormals, const BinTools_FormatVersion theVersion, const Message_ProgressRange & theRange = Message_ProgressRange());
 
+
+%feature("autodoc", "Serializes TopoDS_Shape to bytes, in binary format BinTools_FormatVersion_CURRENT. Triangulations are written only if with_triangles is True, their normals only if with_normals is True.") WriteToBytes;
+%extend{
+    static PyObject* WriteToBytes(const TopoDS_Shape & shape, bool with_triangles = true, bool with_normals = false) {
+    std::ostringstream s(std::ios::out | std::ios::binary);
+    BinTools::Write(shape, s, with_triangles, with_normals, BinTools_FormatVersion_CURRENT);
+    const std::string str = s.str();
+    return PyBytes_FromStringAndSize(str.data(), str.size());}
+};
+%feature("autodoc", "Deserializes TopoDS_Shape from any object that supports the buffer protocol (bytes, bytearray, memoryview, mmap...). Create and return a new TopoDS_Shape each time the method is called. A RuntimeError is raised if the data is not a valid BinTools stream.") ReadFromBytes;
+%extend{
+    static TopoDS_Shape ReadFromBytes(PyObject* data) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("ReadFromBytes expects a bytes-like object");
+        }
+        std::string src((const char*)view.buf, (size_t)view.len);
+        PyBuffer_Release(&view);
+        std::istringstream s(std::move(src), std::ios::in | std::ios::binary);
+        TopoDS_Shape shape;
+        BinTools::Read(shape, s);
+        // a truncated or corrupt stream leaves the shape null
+        if (s.fail() || shape.IsNull()) {
+            throw Standard_Failure("ReadFromBytes: invalid or truncated BinTools stream");
+        }
+        return shape;
+    }
+};
 };
 
 
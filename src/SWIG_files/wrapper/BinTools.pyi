@@ -115,6 +115,11 @@ class bintools:
     @staticmethod
     def Write(theShape: TopoDS_Shape, theFile: str, theWithTriangles: bool, theWithNormals: bool, theVersion: BinTools_FormatVersion, theRange: Optional[Message_ProgressRange] = Message_ProgressRange()) -> bool: ...
 
+    @staticmethod
+    def WriteToBytes(shape: TopoDS_Shape, with_triangles: Optional[bool] = True, with_normals: Optional[bool] = False) -> bytes: ...
+    @staticmethod
+    def ReadFromBytes(data: bytes) -> TopoDS_Shape: ...
+
 class BinTools_Curve2dSet:
     def __init__(self) -> None: ...
     def Add(self, C: Geom2d_Curve) -> int: ...
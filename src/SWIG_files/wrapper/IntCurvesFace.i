@@ -678,6 +678,238 @@ Returns the parameter of the ith intersection point on the line.
 	}
 };
 
+%{
+#include <algorithm>
+#include <limits>
+#include <vector>
+#include <BRepExtrema_TriangleSet.hxx>
+#include <BVH_Traverse.hxx>
+#include <OSD_Parallel.hxx>
+#include <Standard_ErrorHandler.hxx>
+#include <TopExp.hxx>
+#include <TopTools_IndexedDataMapOfShapeListOfShape.hxx>
+#include <TopTools_IndexedMapOfShape.hxx>
+// first hit of a ray on the triangles of a BRepExtrema_TriangleSet,
+// the metric is the ray parameter where a box or a triangle is entered
+class IntCurvesFace_RayTriangleSelector : public BVH_Traverse<Standard_Real, 3, BRepExtrema_TriangleSet, Standard_Real> {
+public:
+    IntCurvesFace_RayTriangleSelector(const BVH_Vec3d& theOrigin, const BVH_Vec3d& theDirection, const Standard_Real theTolerance)
+    : myOrigin(theOrigin), myDirection(theDirection), myTolerance(theTolerance),
+      myParameter(std::numeric_limits<Standard_Real>::infinity()), myTriangle(-1) {}
+    Standard_Boolean IsMetricBetter(const Standard_Real& theLeft, const Standard_Real& theRight) const Standard_OVERRIDE {
+        return theLeft < theRight;
+    }
+    Standard_Boolean RejectMetric(const Standard_Real& theMetric) const Standard_OVERRIDE {
+        return theMetric > myParameter;
+    }
+    // slab test, theMetric is the parameter where the ray enters the box
+    Standard_Boolean RejectNode(const BVH_Vec3d& theCornerMin, const BVH_Vec3d& theCornerMax, Standard_Real& theMetric) const Standard_OVERRIDE {
+        Standard_Real aTmin = 0.0;
+        Standard_Real aTmax = myParameter;
+        for (int k = 0; k < 3; ++k) {
+            const Standard_Real aMin = theCornerMin[k] - myTolerance;
+            const Standard_Real aMax = theCornerMax[k] + myTolerance;
+            if (Abs(myDirection[k]) < 1e-300) {
+                if (myOrigin[k] < aMin || myOrigin[k] > aMax) {
+                    return Standard_True;
+                }
+                continue;
+            }
+            Standard_Real aT1 = (aMin - myOrigin[k]) / myDirection[k];
+            Standard_Real aT2 = (aMax - myOrigin[k]) / myDirection[k];
+            if (aT1 > aT2) {
+                std::swap(aT1, aT2);
+            }
+            aTmin = std::max(aTmin, aT1);
+            aTmax = std::min(aTmax, aT2);
+            if (aTmin > aTmax) {
+                return Standard_True;
+            }
+        }
+        theMetric = aTmin;
+        return Standard_False;
+    }
+    // Moller-Trumbore ray-triangle intersection
+    Standard_Boolean Accept(const Standard_Integer theIndex, const Standard_Real&) Standard_OVERRIDE {
+        BVH_Vec3d aV0, aV1, aV2;
+        myBVHSet->GetVertices(theIndex, aV0, aV1, aV2);
+        const BVH_Vec3d anEdge1 = aV1 - aV0;
+        const BVH_Vec3d anEdge2 = aV2 - aV0;
+        const BVH_Vec3d aP = BVH_Vec3d::Cross(myDirection, anEdge2);
+        const Standard_Real aDet = anEdge1.Dot(aP);
+        if (Abs(aDet) < 1e-300) {
+            return Standard_False;
+        }
+        const BVH_Vec3d aT = myOrigin - aV0;
+        const Standard_Real anU = aT.Dot(aP) / aDet;
+        const Standard_Real anEps = 1e-12;
+        if (anU < -anEps || anU > 1.0 + anEps) {
+            return Standard_False;
+        }
+        const BVH_Vec3d aQ = BVH_Vec3d::Cross(aT, anEdge1);
+        const Standard_Real aV = myDirection.Dot(aQ) / aDet;
+        if (aV < -anEps || anU + aV > 1.0 + anEps) {
+            return Standard_False;
+        }
+        const Standard_Real aParameter = anEdge2.Dot(aQ) / aDet;
+        if (aParameter < 0.0 || aParameter >= myParameter) {
+            return Standard_False;
+        }
+        myParameter = aParameter;
+        myTriangle = theIndex;
+        return Standard_True;
+    }
+    // the parameter of the first hit, infinite if none
+    Standard_Real Parameter() const { return myParameter; }
+    // the index of the first hit triangle, -1 if none
+    Standard_Integer Triangle() const { return myTriangle; }
+private:
+    BVH_Vec3d myOrigin;
+    BVH_Vec3d myDirection;
+    Standard_Real myTolerance;
+    Standard_Real myParameter;
+    Standard_Integer myTriangle;
+};
+%}
+%extend IntCurvesFace_ShapeIntersector {
+    %feature("autodoc", "Cast a batch of rays on the faces of a shape and return the first hit of each ray, in parallel across the rays and with the GIL released.
+
+Parameters
+----------
+theShape: TopoDS_Shape
+theOrigins: a bytes-like object of float64 x, y, z ray origins
+theDirections: a bytes-like object of float64 x, y, z ray directions, that need not be normalized
+theMode: int, 0 to intersect the exact faces, with one IntCurvesFace_ShapeIntersector prepared per thread, 1 to intersect the existing triangulations through their box tree
+theTolerance: float
+theParallel: bool
+
+Return
+-------
+tuple: four bytes objects, the float64 distances from the origins to the first hits, the float64 x, y, z of the hits, the int32 zero based indices of the hit faces and of their solids, in the TopExp::MapShapes order. Distances are infinite, points NaN and indices -1 for the rays that hit nothing.") CastRays;
+    static PyObject* CastRays(const TopoDS_Shape& theShape, PyObject* theOrigins, PyObject* theDirections, const Standard_Integer theMode, const Standard_Real theTolerance, const Standard_Boolean theParallel=Standard_True) {
+        if (theMode < 0 || theMode > 1) {
+            throw Standard_Failure("Unknown ray casting mode");
+        }
+        Py_buffer aView;
+        if (PyObject_GetBuffer(theOrigins, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("CastRays expects a bytes-like object of float64 origins");
+        }
+        std::vector<double> anOrigins((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+        PyBuffer_Release(&aView);
+        if (PyObject_GetBuffer(theDirections, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("CastRays expects a bytes-like object of float64 directions");
+        }
+        std::vector<double> aDirections((const double*) aView.buf, (const double*) aView.buf + aView.len / sizeof(double));
+        PyBuffer_Release(&aView);
+        if (anOrigins.size() % 3 != 0 || anOrigins.size() != aDirections.size()) {
+            throw Standard_Failure("CastRays expects 3 float64 values per origin and per direction");
+        }
+        const Standard_Integer aNbRays = (Standard_Integer) (anOrigins.size() / 3);
+        for (Standard_Integer i = 0; i < aNbRays; ++i) {
+            const gp_XYZ aDirection(aDirections[3 * i], aDirections[3 * i + 1], aDirections[3 * i + 2]);
+            if (aDirection.Modulus() <= gp::Resolution()) {
+                throw Standard_Failure("CastRays expects non null directions");
+            }
+            aDirection.Normalized().Coord(aDirections[3 * i], aDirections[3 * i + 1], aDirections[3 * i + 2]);
+        }
+        // the solid of each face, if any
+        TopTools_IndexedMapOfShape aFaces, aSolids;
+        TopExp::MapShapes(theShape, TopAbs_FACE, aFaces);
+        TopExp::MapShapes(theShape, TopAbs_SOLID, aSolids);
+        TopTools_IndexedDataMapOfShapeListOfShape aFaceSolids;
+        TopExp::MapShapesAndAncestors(theShape, TopAbs_FACE, TopAbs_SOLID, aFaceSolids);
+        std::vector<int> aSolidOfFace(aFaces.Extent(), -1);
+        for (Standard_Integer i = 1; i <= aFaces.Extent(); ++i) {
+            const TopTools_ListOfShape* aList = aFaceSolids.Seek(aFaces(i));
+            if (aList != NULL && !aList->IsEmpty()) {
+                aSolidOfFace[i - 1] = aSolids.FindIndex(aList->First()) - 1;
+            }
+        }
+        const double aNaN = std::numeric_limits<double>::quiet_NaN();
+        std::vector<double> aDistances(aNbRays, std::numeric_limits<double>::infinity());
+        std::vector<double> aPoints(aNbRays * 3, aNaN);
+        std::vector<int> aFaceIds(aNbRays, -1);
+        std::vector<int> aSolidIds(aNbRays, -1);
+        Standard_Boolean isFailed = Standard_False;
+        Py_BEGIN_ALLOW_THREADS
+        if (theMode == 0) {
+            // one prepared intersector per block, at least 64 rays per block
+            Standard_Integer aNbBlocks = theParallel ? OSD_Parallel::NbLogicalProcessors() : 1;
+            aNbBlocks = std::max(1, std::min(aNbBlocks, aNbRays / 64));
+            OSD_Parallel::For(0, aNbBlocks, [&](const Standard_Integer theBlock) {
+                try {
+                    OCC_CATCH_SIGNALS
+                    IntCurvesFace_ShapeIntersector anIntersector;
+                    anIntersector.Load(theShape, theTolerance);
+                    const Standard_Integer aFirst = (Standard_Integer) ((long long) aNbRays * theBlock / aNbBlocks);
+                    const Standard_Integer aLast = (Standard_Integer) ((long long) aNbRays * (theBlock + 1) / aNbBlocks);
+                    for (Standard_Integer i = aFirst; i < aLast; ++i) {
+                        const gp_Lin aRay(gp_Pnt(anOrigins[3 * i], anOrigins[3 * i + 1], anOrigins[3 * i + 2]),
+                                          gp_Dir(aDirections[3 * i], aDirections[3 * i + 1], aDirections[3 * i + 2]));
+                        anIntersector.PerformNearest(aRay, 0.0, RealLast());
+                        if (!anIntersector.IsDone()) {
+                            continue;
+                        }
+                        for (Standard_Integer k = 1; k <= anIntersector.NbPnt(); ++k) {
+                            const Standard_Real aParameter = anIntersector.WParameter(k);
+                            if (aParameter < 0.0 || aParameter >= aDistances[i]) {
+                                continue;
+                            }
+                            aDistances[i] = aParameter;
+                            anIntersector.Pnt(k).Coord(aPoints[3 * i], aPoints[3 * i + 1], aPoints[3 * i + 2]);
+                            aFaceIds[i] = aFaces.FindIndex(anIntersector.Face(k)) - 1;
+                        }
+                    }
+                } catch (Standard_Failure const&) {
+                    isFailed = Standard_True;
+                }
+            }, !theParallel);
+        } else {
+            BRepExtrema_ShapeList aFaceList;
+            for (Standard_Integer i = 1; i <= aFaces.Extent(); ++i) {
+                aFaceList.Append(aFaces(i));
+            }
+            opencascade::handle<BRepExtrema_TriangleSet> aTriangles = new BRepExtrema_TriangleSet(aFaceList);
+            if (aTriangles->Size() > 0) {
+                // the tree is built before any concurrent traversal
+                aTriangles->BVH();
+                OSD_Parallel::For(0, aNbRays, [&](const Standard_Integer i) {
+                    const BVH_Vec3d anOrigin(anOrigins[3 * i], anOrigins[3 * i + 1], anOrigins[3 * i + 2]);
+                    const BVH_Vec3d aDirection(aDirections[3 * i], aDirections[3 * i + 1], aDirections[3 * i + 2]);
+                    IntCurvesFace_RayTriangleSelector aSelector(anOrigin, aDirection, theTolerance);
+                    aSelector.SetBVHSet(aTriangles.get());
+                    aSelector.Select();
+                    if (aSelector.Triangle() < 0) {
+                        return;
+                    }
+                    const BVH_Vec3d aHit = anOrigin + aDirection * aSelector.Parameter();
+                    aDistances[i] = aSelector.Parameter();
+                    aPoints[3 * i] = aHit.x();
+                    aPoints[3 * i + 1] = aHit.y();
+                    aPoints[3 * i + 2] = aHit.z();
+                    aFaceIds[i] = aTriangles->GetFaceID(aSelector.Triangle());
+                }, !theParallel);
+            }
+        }
+        Py_END_ALLOW_THREADS
+        if (isFailed) {
+            throw Standard_Failure("CastRays failed to intersect the rays");
+        }
+        for (Standard_Integer i = 0; i < aNbRays; ++i) {
+            if (aFaceIds[i] >= 0) {
+                aSolidIds[i] = aSolidOfFace[aFaceIds[i]];
+            }
+        }
+        return Py_BuildValue("(NNNN)",
+            PyBytes_FromStringAndSize((const char*) aDistances.data(), aDistances.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aPoints.data(), aPoints.size() * sizeof(double)),
+            PyBytes_FromStringAndSize((const char*) aFaceIds.data(), aFaceIds.size() * sizeof(int)),
+            PyBytes_FromStringAndSize((const char*) aSolidIds.data(), aSolidIds.size() * sizeof(int)));
+    }
+};
+
 /* harray1 classes */
 /* harray2 classes */
 /* hsequence classes */
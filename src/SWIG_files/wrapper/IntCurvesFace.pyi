@@ -36,6 +36,8 @@ class IntCurvesFace_Intersector(Standard_Transient):
 
 class IntCurvesFace_ShapeIntersector:
     def __init__(self) -> None: ...
+    @staticmethod
+    def CastRays(theShape: TopoDS_Shape, theOrigins: bytes, theDirections: bytes, theMode: int, theTolerance: float, theParallel: Optional[bool] = True) -> Tuple[bytes, bytes, bytes, bytes]: ...
     def Face(self, I: int) -> TopoDS_Face: ...
     def IsDone(self) -> bool: ...
     def Load(self, Sh: TopoDS_Shape, Tol: float) -> None: ...
@@ -302,6 +302,40 @@ Returns in Vfirst, Vlast the first and last vertices of the open wire <W>. May b
 	}
 };
 
+%{
+#include <vector>
+%}
+%feature("autodoc", "For each sub-shape of type TS of S, lists the indices of its ancestors of type TA. The sub-shapes and the ancestors are numbered with the zero based indices of sub_map and ancestor_map, as filled by MapShapes. Returns the (offsets, indices) bytes of the compressed sparse rows, int64 offsets and int32 indices in native byte order: the ancestors of the sub-shape i are indices[offsets[i]:offsets[i + 1]].") MapShapesAndAncestorsIndices;
+%extend TopExp {
+    static PyObject* MapShapesAndAncestorsIndices(const TopoDS_Shape & S, const TopAbs_ShapeEnum TS, const TopAbs_ShapeEnum TA, const TopTools_IndexedMapOfShape & sub_map, const TopTools_IndexedMapOfShape & ancestor_map) {
+        TopTools_IndexedDataMapOfShapeListOfShape aMap;
+        TopExp::MapShapesAndUniqueAncestors(S, TS, TA, aMap);
+        const Standard_Integer nbRows = sub_map.Extent();
+        std::vector<std::vector<int> > rows(nbRows);
+        Standard_Integer nbIndices = 0;
+        for (Standard_Integer i = 1; i <= aMap.Extent(); ++i) {
+            const Standard_Integer row = sub_map.FindIndex(aMap.FindKey(i));
+            if (row == 0) continue;
+            for (TopTools_ListIteratorOfListOfShape it(aMap.FindFromIndex(i)); it.More(); it.Next()) {
+                const Standard_Integer col = ancestor_map.FindIndex(it.Value());
+                if (col == 0) continue;
+                rows[row - 1].push_back(col - 1);
+                ++nbIndices;
+            }
+        }
+        std::vector<long long> offsets(nbRows + 1, 0);
+        std::vector<int> indices;
+        indices.reserve(nbIndices);
+        for (Standard_Integer row = 0; row < nbRows; ++row) {
+            indices.insert(indices.end(), rows[row].begin(), rows[row].end());
+            offsets[row + 1] = (long long) indices.size();
+        }
+        return Py_BuildValue("(NN)",
+            PyBytes_FromStringAndSize((const char*) offsets.data(), offsets.size() * sizeof(long long)),
+            PyBytes_FromStringAndSize((const char*) indices.data(), indices.size() * sizeof(int)));
+    }
+};
+
 /************************
 * class TopExp_Explorer *
 ************************/
@@ -1,5 +1,5 @@
 from enum import IntEnum
-from typing import overload, NewType, Optional, Tuple
+from typing import overload, NewType, List, Optional, Tuple
 
 from OCC.Core.Standard import *
 from OCC.Core.NCollection import *
@@ -28,6 +28,8 @@ class topexp:
     @staticmethod
     def MapShapesAndAncestors(S: TopoDS_Shape, TS: TopAbs_ShapeEnum, TA: TopAbs_ShapeEnum, M: TopTools_IndexedDataMapOfShapeListOfShape) -> None: ...
     @staticmethod
+    def MapShapesAndAncestorsIndices(S: TopoDS_Shape, TS: TopAbs_ShapeEnum, TA: TopAbs_ShapeEnum, sub_map: TopTools_IndexedMapOfShape, ancestor_map: TopTools_IndexedMapOfShape) -> Tuple[bytes, bytes]: ...
+    @staticmethod
     def MapShapesAndUniqueAncestors(S: TopoDS_Shape, TS: TopAbs_ShapeEnum, TA: TopAbs_ShapeEnum, M: TopTools_IndexedDataMapOfShapeListOfShape, useOrientation: Optional[bool] = False) -> None: ...
     @overload
     @staticmethod
@@ -151,6 +151,20 @@ Array1ExtendIter(TopoDS_Shape)
 %template(TopTools_IndexedDataMapOfShapeShape) NCollection_IndexedDataMap<TopoDS_Shape,TopoDS_Shape,TopTools_ShapeMapHasher>;
 %template(TopTools_IndexedMapOfOrientedShape) NCollection_IndexedMap<TopoDS_Shape>;
 %template(TopTools_IndexedMapOfShape) NCollection_IndexedMap<TopoDS_Shape,TopTools_ShapeMapHasher>;
+
+%extend NCollection_IndexedMap<TopoDS_Shape,TopTools_ShapeMapHasher> {
+    %pythoncode {
+    def __len__(self):
+        return self.Extent()
+
+    def __iter__(self):
+        for i in range(1, self.Extent() + 1):
+            yield self.FindKey(i)
+
+    def __contains__(self, shape):
+        return self.Contains(shape)
+    }
+};
 %template(TopTools_ListIteratorOfListOfShape) NCollection_TListIterator<TopoDS_Shape>;
 %template(TopTools_ListOfListOfShape) NCollection_List<TopTools_ListOfShape>;
 
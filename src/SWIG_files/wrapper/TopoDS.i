@@ -1367,13 +1367,25 @@ def __eq__(self, right):
 
 %extend TopoDS_Shape {
 %pythoncode {
+    # pickle format, either "binary" (BinTools) or "text" (BRepTools)
+    pickle_format = "binary"
+    # if False, the binary format does not store the triangulations
+    pickle_with_triangles = True
+
     def __getstate__(self):
-        from .BRepTools import breptools
-        str_shape = breptools.WriteToString(self, True)
-        return str_shape
+        if self.pickle_format == "text":
+            from .BRepTools import breptools
+            return breptools.WriteToString(self, True)
+        from .BinTools import bintools
+        return bintools.WriteToBytes(self, self.pickle_with_triangles)
     def __setstate__(self, state):
-        from .BRepTools import breptools
-        the_shape = breptools.ReadFromString(state)
+        # text pickles are still supported
+        if isinstance(state, str):
+            from .BRepTools import breptools
+            the_shape = breptools.ReadFromString(state)
+        else:
+            from .BinTools import bintools
+            the_shape = bintools.ReadFromBytes(state)
         self.this = the_shape.this
     }
 };
@@ -1382,6 +1394,91 @@ def __eq__(self, right):
 	__repr__ = _dumps_object
 	}
 };
+%{
+#include <vector>
+// the TopoDS_Shape out typemap, for the shapes returned in a list
+static PyObject* TopoDS_ShapeToPython(const TopoDS_Shape& S) {
+    if (S.IsNull()) {
+        Py_RETURN_NONE;
+    }
+    switch (S.ShapeType()) {
+      case TopAbs_COMPOUND: return SWIG_NewPointerObj(new TopoDS_Compound(TopoDS::Compound(S)), SWIGTYPE_p_TopoDS_Compound, SWIG_POINTER_OWN);
+      case TopAbs_COMPSOLID: return SWIG_NewPointerObj(new TopoDS_CompSolid(TopoDS::CompSolid(S)), SWIGTYPE_p_TopoDS_CompSolid, SWIG_POINTER_OWN);
+      case TopAbs_SOLID: return SWIG_NewPointerObj(new TopoDS_Solid(TopoDS::Solid(S)), SWIGTYPE_p_TopoDS_Solid, SWIG_POINTER_OWN);
+      case TopAbs_SHELL: return SWIG_NewPointerObj(new TopoDS_Shell(TopoDS::Shell(S)), SWIGTYPE_p_TopoDS_Shell, SWIG_POINTER_OWN);
+      case TopAbs_FACE: return SWIG_NewPointerObj(new TopoDS_Face(TopoDS::Face(S)), SWIGTYPE_p_TopoDS_Face, SWIG_POINTER_OWN);
+      case TopAbs_WIRE: return SWIG_NewPointerObj(new TopoDS_Wire(TopoDS::Wire(S)), SWIGTYPE_p_TopoDS_Wire, SWIG_POINTER_OWN);
+      case TopAbs_EDGE: return SWIG_NewPointerObj(new TopoDS_Edge(TopoDS::Edge(S)), SWIGTYPE_p_TopoDS_Edge, SWIG_POINTER_OWN);
+      case TopAbs_VERTEX: return SWIG_NewPointerObj(new TopoDS_Vertex(TopoDS::Vertex(S)), SWIGTYPE_p_TopoDS_Vertex, SWIG_POINTER_OWN);
+      default: return SWIG_NewPointerObj(new TopoDS_Shape(S), SWIGTYPE_p_TopoDS_Shape, SWIG_POINTER_OWN);
+    }
+}
+%}
+%extend TopoDS_Shape {
+    %feature("autodoc", "Place a sequence of shapes at a sequence of locations, without any copy of their geometry.
+
+Parameters
+----------
+theShapes: a sequence of TopoDS_Shape
+theMatrices: a bytes-like object of float64, the 3 first rows of the 4x4 matrix of each location, row by row, 12 values per shape
+theCompose: bool, if True, the locations are composed with the current locations of the shapes, as Moved does, else they replace them, as Located does
+
+Return
+-------
+list of TopoDS_Shape
+
+Description
+-----------
+The locations must be rigid transformations, a RuntimeError is raised otherwise.") PlaceShapes;
+    static PyObject* PlaceShapes(PyObject* theShapes, PyObject* theMatrices, const Standard_Boolean theCompose=Standard_True) {
+        PyObject* aSequence = PySequence_Fast(theShapes, "theShapes must be a sequence");
+        if (aSequence == NULL) {
+            PyErr_Clear();
+            throw Standard_Failure("PlaceShapes expects a sequence of shapes");
+        }
+        const Py_ssize_t aNbShapes = PySequence_Fast_GET_SIZE(aSequence);
+        std::vector<TopoDS_Shape> aShapes;
+        aShapes.reserve(aNbShapes);
+        for (Py_ssize_t i = 0; i < aNbShapes; ++i) {
+            void* aPtr = NULL;
+            if (!SWIG_IsOK(SWIG_ConvertPtr(PySequence_Fast_GET_ITEM(aSequence, i), &aPtr, SWIGTYPE_p_TopoDS_Shape, 0)) || aPtr == NULL) {
+                Py_DECREF(aSequence);
+                throw Standard_Failure("PlaceShapes expects a sequence of shapes");
+            }
+            aShapes.push_back(*reinterpret_cast<TopoDS_Shape*>(aPtr));
+        }
+        Py_DECREF(aSequence);
+        Py_buffer aView;
+        if (PyObject_GetBuffer(theMatrices, &aView, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            throw Standard_Failure("PlaceShapes expects a bytes-like object of matrices");
+        }
+        if ((size_t) aView.len != (size_t) aNbShapes * 12 * sizeof(double)) {
+            PyBuffer_Release(&aView);
+            throw Standard_Failure("PlaceShapes expects 12 float64 values per shape");
+        }
+        const double* aValues = (const double*) aView.buf;
+        std::vector<TopoDS_Shape> aPlaced(aNbShapes);
+        try {
+            for (Py_ssize_t i = 0; i < aNbShapes; ++i) {
+                const double* m = aValues + 12 * i;
+                gp_Trsf aTrsf;
+                aTrsf.SetValues(m[0], m[1], m[2], m[3], m[4], m[5], m[6], m[7], m[8], m[9], m[10], m[11]);
+                const TopLoc_Location aLocation(aTrsf);
+                aPlaced[i] = theCompose ? aShapes[i].Moved(aLocation, Standard_True) : aShapes[i].Located(aLocation, Standard_True);
+            }
+        } catch (...) {
+            PyBuffer_Release(&aView);
+            throw;
+        }
+        PyBuffer_Release(&aView);
+        PyObject* aList = PyList_New(aNbShapes);
+        for (Py_ssize_t i = 0; i < aNbShapes; ++i) {
+            PyList_SET_ITEM(aList, i, TopoDS_ShapeToPython(aPlaced[i]));
+        }
+        return aList;
+    }
+};
 
 /**********************
 * class TopoDS_TShape *
@@ -1,5 +1,5 @@
 from enum import IntEnum
-from typing import overload, NewType, Optional, Tuple
+from typing import overload, NewType, List, Optional, Tuple
 
 from OCC.Core.Standard import *
 from OCC.Core.NCollection import *
@@ -114,6 +114,8 @@ class TopoDS_Shape:
     @overload
     def Orientation(self, theOrient: TopAbs_Orientation) -> None: ...
     def Oriented(self, theOrient: TopAbs_Orientation) -> TopoDS_Shape: ...
+    @staticmethod
+    def PlaceShapes(theShapes: List[TopoDS_Shape], theMatrices: bytes, theCompose: Optional[bool] = True) -> List[TopoDS_Shape]: ...
     def Reverse(self) -> None: ...
     def Reversed(self) -> TopoDS_Shape: ...
     def ShapeType(self) -> TopAbs_ShapeEnum: ...
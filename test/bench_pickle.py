@@ -0,0 +1,47 @@
+import pickle
+import time
+
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.TopoDS import TopoDS_Shape
+from OCC.Extend.DataExchange import read_step_file, ShapeBatch
+from OCC.Extend.TopologyUtils import TopologyExplorer
+
+NB_ROUNDS = 20
+
+# an assembly, with shared parts, and meshed
+shape = read_step_file("test_io/as1-oc-214.stp")
+BRepMesh_IncrementalMesh(shape, 0.5)
+solids = list(TopologyExplorer(shape).solids())
+
+
+def bench(label, obj):
+    t0 = time.perf_counter()
+    for _ in range(NB_ROUNDS):
+        dump = pickle.dumps(obj)
+    t1 = time.perf_counter()
+    for _ in range(NB_ROUNDS):
+        pickle.loads(dump)
+    t2 = time.perf_counter()
+    print(
+        "  * %-32s size: %8.1f kB, dumps: %7.2f ms, loads: %7.2f ms"
+        % (
+            label,
+            len(dump) / 1024,
+            (t1 - t0) / NB_ROUNDS * 1000,
+            (t2 - t1) / NB_ROUNDS * 1000,
+        )
+    )
+
+
+print(f"Pickle round trip of {len(solids)} solids:")
+TopoDS_Shape.pickle_format = "text"
+bench("text, one by one", solids)
+TopoDS_Shape.pickle_format = "binary"
+bench("binary, one by one", solids)
+TopoDS_Shape.pickle_with_triangles = False
+bench("binary without triangles", solids)
+TopoDS_Shape.pickle_with_triangles = True
+bench("binary, ShapeBatch", ShapeBatch(solids))
+batch = ShapeBatch(solids)
+batch.with_triangles = False
+bench("binary, ShapeBatch w/o triangles", batch)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.gp import gp_Pnt
+
+from OCC.Extend.BooleanUtils import boolean_operation
+
+
+def volume(shape):
+    props = GProp_GProps()
+    brepgprop.VolumeProperties(shape, props)
+    return props.Mass()
+
+
+# a row of 9 unit cubes, each one overlapping the next one by half
+CUBES = [
+    BRepPrimAPI_MakeBox(gp_Pnt(0.5 * i, 0.0, 0.0), 1.0, 1.0, 1.0).Shape()
+    for i in range(9)
+]
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_fuse(parallel) -> None:
+    shape, stages = boolean_operation("fuse", CUBES, parallel=parallel)
+    assert volume(shape) == pytest.approx(5.0)
+    # 9 shapes are reduced in 4 levels
+    levels = [stage for stage in stages if "level" in stage["stage"]]
+    assert [stage["operations"] for stage in levels] == [4, 2, 1, 1]
+    assert all(stage["seconds"] >= 0.0 for stage in stages)
+
+
+def test_cut_and_common() -> None:
+    block = BRepPrimAPI_MakeBox(gp_Pnt(-1.0, 0.0, 0.0), 7.0, 1.0, 1.0).Shape()
+    shape, stages = boolean_operation("cut", [block], CUBES, fuzzy_value=1e-7)
+    assert volume(shape) == pytest.approx(2.0)
+    assert stages[-1]["stage"] == "cut"
+    shape, _ = boolean_operation("common", [block], CUBES, glue="off")
+    assert volume(shape) == pytest.approx(5.0)
+    # the common part of two neighbour cubes is half a cube
+    shape, _ = boolean_operation("common", CUBES[:2])
+    assert volume(shape) == pytest.approx(0.5)
+    with pytest.raises(AssertionError):
+        boolean_operation("cut", [block])
+    with pytest.raises(AssertionError):
+        boolean_operation("xor", [block], CUBES)
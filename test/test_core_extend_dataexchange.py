@@ -18,23 +18,41 @@
 ##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
-
-from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeTorus
+import pickle
+import subprocess
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.Interface import Interface_Static
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeTorus
+from OCC.Core.Tesselator import ShapeTesselator
+from OCC.Core.Poly import Poly_Triangulation
 from OCC.Core.TopoDS import TopoDS_Compound
 
 from OCC.Extend.DataExchange import (
     read_step_file,
     read_step_file_with_names_colors,
+    scan_step_file,
+    read_step_file_subtrees,
     read_stl_file,
+    read_stl_file_as_mesh,
     read_iges_file,
     read_gltf_file,
     write_step_file,
     write_stl_file,
+    write_stl_mesh_file,
+    write_3mf_file,
     write_iges_file,
     write_ply_file,
     write_obj_file,
     write_gltf_file,
     export_shape_to_svg,
+    shapes_to_bytes,
+    shapes_from_bytes,
+    ShapeBatch,
 )
 from OCC.Extend.TopologyUtils import TopologyExplorer
 
@@ -84,6 +102,75 @@ def test_read_step_file_names_colors():
     read_step_file_with_names_colors(STEP_AP214_SAMPLE_FILE)
 
 
+def test_scan_step_file():
+    scan = scan_step_file(STEP_AP214_SAMPLE_FILE)
+    assert scan["header"]["name"] == "Open CASCADE Shape Model"
+    assert len(scan["header"]["schemas"]) == 1
+    assert scan["nb_entities"] == sum(scan["entity_counts"].values())
+    assert scan["entity_counts"]["StepRepr_NextAssemblyUsageOccurrence"] == 13
+    assert len(scan["products"]) == 9
+    # a single root assembly, with 4 components
+    assert len(scan["assembly"]) == 1
+    root = scan["assembly"][0]
+    assert root["name"] == "as1"
+    assert sorted(child["instance_name"] for child in root["children"]) == [
+        "l-bracket-assembly_1",
+        "l-bracket-assembly_2",
+        "plate_1",
+        "rod-assembly_1",
+    ]
+
+
+def test_scan_step_file_without_counts():
+    scan = scan_step_file(STEP_AP203_SAMPLE_FILE, count_entities=False)
+    assert scan["entity_counts"] == {}
+    assert scan["nb_entities"] > 0
+
+
+def test_read_step_file_subtrees_by_path():
+    subtrees = read_step_file_subtrees(
+        STEP_AP214_SAMPLE_FILE, paths=["as1/rod-assembly_1"]
+    )
+    assert len(subtrees) == 1
+    path, shape, _ = subtrees[0]
+    assert path == "as1/rod-assembly_1"
+    # nut_1, nut_2 and rod_1
+    assert TopologyExplorer(shape).number_of_solids() == 3
+
+
+def test_read_step_file_subtrees_by_product_name():
+    subtrees = read_step_file_subtrees(STEP_AP214_SAMPLE_FILE, product_names=["nut"])
+    # 2 nuts in the rod assembly, 3 in each of the 2 l-bracket assemblies
+    assert len(subtrees) == 8
+    assert len({path for path, _, _ in subtrees}) == 8
+    # the placements are composed from the root, all the nuts are at
+    # different locations
+    centers = set()
+    for _, shape, _ in subtrees:
+        box = Bnd_Box()
+        brepbndlib.Add(shape, box)
+        xmin, ymin, zmin, xmax, ymax, zmax = box.Get()
+        centers.add(
+            (
+                round((xmin + xmax) / 2, 3),
+                round((ymin + ymax) / 2, 3),
+                round((zmin + zmax) / 2, 3),
+            )
+        )
+    assert len(centers) == 8
+
+
+def test_read_step_file_subtrees_by_predicate():
+    subtrees = read_step_file_subtrees(
+        STEP_AP214_SAMPLE_FILE,
+        predicate=lambda node: node["instance_name"] == "plate_1",
+    )
+    assert [path for path, _, _ in subtrees] == ["as1/plate_1"]
+    assert (
+        read_step_file_subtrees(STEP_AP214_SAMPLE_FILE, product_names=["missing"]) == []
+    )
+
+
 def test_read_iges_file():
     list_of_shapes = read_iges_file(IGES_SAMPLE_FILE)
     assert isinstance(list_of_shapes, list)
@@ -108,6 +195,27 @@ def test_read_stl_file():
     read_stl_file(STL_BINARY_SAMPLE_FILE)
 
 
+def test_read_stl_file_as_mesh():
+    ascii_mesh = read_stl_file_as_mesh(STL_ASCII_SAMPLE_FILE)
+    assert isinstance(ascii_mesh, Poly_Triangulation)
+    assert ascii_mesh.NbTriangles() > 0
+    # the binary cube is made of 12 triangles sharing 8 nodes
+    vertices, triangles = read_stl_file_as_mesh(STL_BINARY_SAMPLE_FILE, as_numpy=True)
+    assert vertices.shape == (8, 3)
+    assert triangles.shape == (12, 3)
+    assert triangles.min() == 0
+    assert triangles.max() == 7
+
+
+def test_read_stl_file_as_mesh_merge_tolerance():
+    vertices, triangles = read_stl_file_as_mesh(
+        STL_ASCII_SAMPLE_FILE, merge_tolerance=1.0, as_numpy=True
+    )
+    ref_vertices, _ = read_stl_file_as_mesh(STL_ASCII_SAMPLE_FILE, as_numpy=True)
+    assert len(vertices) < len(ref_vertices)
+    assert triangles.max() < len(vertices)
+
+
 def test_export_shape_to_svg():
     svg_filename = get_test_fullname("sample.svg")
     export_shape_to_svg(A_TOPODS_SHAPE, svg_filename)
@@ -144,6 +252,65 @@ def test_write_step_ap242():
     check_is_file(ap242_filename)
 
 
+def test_write_step_concurrent_schemas():
+    """Threads exporting with different schemas don't race each other"""
+    a_box = BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    expected_schemas = {
+        "AP203": "CONFIG_CONTROL_DESIGN",
+        "AP214IS": "AUTOMOTIVE_DESIGN",
+        "AP242DIS": "AP242_MANAGED_MODEL_BASED_3D_ENGINEERING_MIM_LF",
+    }
+    default_schema = Interface_Static.CVal("write.step.schema")
+
+    def _export(i):
+        protocol = list(expected_schemas)[i % 3]
+        filename = get_test_fullname(f"sample_concurrent_{i}.stp")
+        write_step_file(a_box, filename, application_protocol=protocol)
+        # read back the file from another thread meanwhile
+        read_step_file(filename)
+        return protocol, filename
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_export, range(24)))
+
+    for protocol, filename in results:
+        with open(filename, "r") as step_file:
+            header = step_file.read(2048)
+        assert expected_schemas[protocol] in header
+    # the process wide value is left untouched
+    assert Interface_Static.CVal("write.step.schema") == default_schema
+
+
+def test_write_step_schema_in_a_fresh_process():
+    """The first exports of a process, before any STEP reader or writer was
+    created, use the requested schemas"""
+    expected_schemas = {
+        "AP203": "CONFIG_CONTROL_DESIGN",
+        "AP214IS": "AUTOMOTIVE_DESIGN",
+        "AP242DIS": "AP242_MANAGED_MODEL_BASED_3D_ENGINEERING_MIM_LF",
+    }
+    filenames = {
+        protocol: os.path.abspath(get_test_fullname(f"sample_fresh_{protocol}.stp"))
+        for protocol in expected_schemas
+    }
+    # the exports run concurrently, in a clean interpreter
+    script = (
+        "import sys\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox\n"
+        "from OCC.Extend.DataExchange import write_step_file\n"
+        "box = BRepPrimAPI_MakeBox(10, 20, 30).Shape()\n"
+        "args = list(zip(sys.argv[1::2], sys.argv[2::2]))\n"
+        "with ThreadPoolExecutor(max_workers=len(args)) as executor:\n"
+        "    list(executor.map(lambda a: write_step_file(box, a[1], a[0]), args))\n"
+    )
+    arguments = [item for pair in filenames.items() for item in pair]
+    subprocess.run([sys.executable, "-c", script, *arguments], check=True)
+    for protocol, filename in filenames.items():
+        with open(filename, "r") as step_file:
+            assert expected_schemas[protocol] in step_file.read(2048)
+
+
 def test_write_iges():
     iges_filename = get_test_fullname("sample.igs")
     write_iges_file(A_TOPODS_SHAPE, iges_filename)
@@ -162,6 +329,36 @@ def test_stl_binary():
     check_is_file(stl_binary_filename)
 
 
+def test_write_stl_mesh_file_from_shapes():
+    stl_filename = get_test_fullname("sample_mesh_binary.stl")
+    shapes = [A_TOPODS_SHAPE, BRepPrimAPI_MakeBox(10, 20, 30).Shape()]
+    write_stl_mesh_file(shapes, stl_filename)
+    check_is_file(stl_filename)
+    # read the file back, each binary record is 50 bytes long
+    _, triangles = read_stl_file_as_mesh(stl_filename, as_numpy=True)
+    assert (os.path.getsize(stl_filename) - 84) // 50 == len(triangles)
+    assert len(triangles) > 12
+
+
+def test_write_stl_mesh_file_from_tesselator():
+    stl_filename = get_test_fullname("sample_tesselator_binary.stl")
+    tess = ShapeTesselator(A_TOPODS_SHAPE)
+    tess.Compute()
+    write_stl_mesh_file(tess, stl_filename)
+    assert (os.path.getsize(stl_filename) - 84) // 50 == tess.ObjGetTriangleCount()
+
+
+def test_write_3mf_file():
+    threemf_filename = get_test_fullname("sample.3mf")
+    vertices, triangles = read_stl_file_as_mesh(STL_BINARY_SAMPLE_FILE, as_numpy=True)
+    write_3mf_file([(vertices, triangles), A_TOPODS_SHAPE], threemf_filename)
+    check_is_file(threemf_filename)
+    with zipfile.ZipFile(threemf_filename) as archive:
+        model = archive.read("3D/3dmodel.model").decode("utf-8")
+    assert model.count("<object ") == 2
+    assert model.count("<item ") == 2
+
+
 def test_write_ply():
     ply_filename = get_test_fullname("sample.ply")
     write_ply_file(A_TOPODS_SHAPE, ply_filename)
@@ -185,3 +382,31 @@ def test_write_gltf_ascii():
     write_gltf_file(A_TOPODS_SHAPE, gltf_filename, binary=False)
     check_is_file(gltf_filename)
     check_is_file(get_test_fullname("sample_ascii.bin"))
+
+
+def test_shapes_to_from_bytes():
+    shapes = [BRepPrimAPI_MakeBox(i + 1, 2, 3).Shape() for i in range(3)]
+    read_back = shapes_from_bytes(shapes_to_bytes(shapes))
+    assert len(read_back) == 3
+    for shape in read_back:
+        assert TopologyExplorer(shape).number_of_faces() == 6
+
+
+def test_pickle_shape_batch_shares_geometry():
+    # the solids of an assembly share the geometry of instanced parts
+    solids = list(TopologyExplorer(read_step_file(STEP_AP214_SAMPLE_FILE)).solids())
+    batch_dump = pickle.dumps(ShapeBatch(solids))
+    assert len(batch_dump) < len(pickle.dumps(solids))
+    batch = pickle.loads(batch_dump)
+    assert isinstance(batch, ShapeBatch)
+    assert len(batch) == len(solids)
+    # the instances of a same part still share their TShape after the round trip
+    partners = [
+        (i, j)
+        for i in range(len(solids))
+        for j in range(i + 1, len(solids))
+        if solids[i].IsPartner(solids[j])
+    ]
+    assert partners
+    for i, j in partners:
+        assert batch[i].IsPartner(batch[j])
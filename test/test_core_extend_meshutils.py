@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from OCC.Core.TopAbs import TopAbs_FACE
+
+from OCC.Extend.MeshUtils import (
+    merge_vertices,
+    numpy_to_triangulation,
+    triangulation_to_face,
+    triangulation_to_numpy,
+)
+
+# two triangles of a unit square, the diagonal nodes being duplicated
+SQUARE_VERTICES = np.array(
+    [
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0],
+    ]
+)
+SQUARE_TRIANGLES = np.array([[0, 1, 2], [3, 4, 5]], dtype=np.int32)
+
+
+def test_numpy_triangulation_round_trip():
+    triangulation = numpy_to_triangulation(SQUARE_VERTICES, SQUARE_TRIANGLES)
+    assert triangulation.NbNodes() == 6
+    assert triangulation.NbTriangles() == 2
+    vertices, triangles = triangulation_to_numpy(triangulation)
+    assert np.allclose(vertices, SQUARE_VERTICES)
+    assert np.array_equal(triangles, SQUARE_TRIANGLES)
+
+
+def test_merge_vertices():
+    vertices, triangles = merge_vertices(SQUARE_VERTICES, SQUARE_TRIANGLES)
+    assert vertices.shape == (4, 3)
+    assert triangles.shape == (2, 3)
+    assert np.allclose(vertices[triangles], SQUARE_VERTICES[SQUARE_TRIANGLES])
+
+
+def test_merge_vertices_drops_degenerated_triangles():
+    vertices = SQUARE_VERTICES.copy()
+    vertices[2] = [1e-4, 0.0, 0.0]
+    _, triangles = merge_vertices(vertices, SQUARE_TRIANGLES, tolerance=1e-2)
+    assert triangles.shape == (1, 3)
+
+
+def test_triangulation_to_face():
+    triangulation = numpy_to_triangulation(SQUARE_VERTICES, SQUARE_TRIANGLES)
+    face = triangulation_to_face(triangulation)
+    assert face.ShapeType() == TopAbs_FACE
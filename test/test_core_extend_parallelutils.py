@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pickle
+
+import pytest
+
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+from OCC.Core.GProp import GProp_GProps
+
+from OCC.Extend.ParallelUtils import (
+    SharedShapeStore,
+    get_worker_store,
+    map_shapes,
+    store_executor,
+)
+
+BOXES = {f"box_{i}": BRepPrimAPI_MakeBox(i + 1, 2, 3).Shape() for i in range(4)}
+
+
+def shape_volume(shape, scale=1.0):
+    props = GProp_GProps()
+    brepgprop.VolumeProperties(shape, props)
+    return props.Mass() * scale
+
+
+def nb_stored_shapes():
+    return len(get_worker_store())
+
+
+def test_shared_shape_store():
+    with SharedShapeStore.create(BOXES) as store:
+        assert sorted(store.keys()) == sorted(BOXES)
+        assert "box_0" in store
+        assert store.nbytes("box_0") > 0
+        assert shape_volume(store["box_2"]) == pytest.approx(3 * 2 * 3)
+        # the shapes are cached
+        assert store["box_2"] is store["box_2"]
+        # another handle on the same store, as opened by a worker
+        other_store = pickle.loads(pickle.dumps(store))
+        assert shape_volume(other_store["box_3"]) == pytest.approx(4 * 2 * 3)
+        other_store.close()
+        # the file is owned by the store that created it
+        assert os.path.isfile(store.filename)
+    assert not os.path.isfile(store.filename)
+
+
+def test_shared_shape_store_int_keys():
+    shapes = dict(enumerate(BOXES.values()))
+    with SharedShapeStore.create(shapes) as store:
+        assert store.keys() == ["0", "1", "2", "3"]
+        assert 1 in store and "1" in store
+        assert store.nbytes(1) == store.nbytes("1")
+        assert store[1] is store["1"]
+        assert shape_volume(store[2]) == pytest.approx(3 * 2 * 3)
+    with pytest.raises(AssertionError):
+        SharedShapeStore.create({1: BOXES["box_0"], "1": BOXES["box_1"]})
+
+
+def test_map_shapes():
+    with SharedShapeStore.create(BOXES) as store:
+        volumes = map_shapes(shape_volume, store, args=(2.0,), max_workers=2)
+        assert volumes == pytest.approx([2.0 * (i + 1) * 2 * 3 for i in range(4)])
+        # a subset of the keys
+        volumes = map_shapes(shape_volume, store, keys=["box_1"], max_workers=2)
+        assert volumes == pytest.approx([2 * 2 * 3])
+
+
+def test_store_executor():
+    with SharedShapeStore.create(BOXES) as store:
+        with store_executor(store, max_workers=2) as executor:
+            assert executor.submit(nb_stored_shapes).result() == 4
+    with pytest.raises(AssertionError):
+        get_worker_store()
@@ -24,7 +24,10 @@ from OCC.Core.BRepPrimAPI import (
     BRepPrimAPI_MakeSphere,
     BRepPrimAPI_MakeTorus,
 )
-from OCC.Core.gp import gp_Pnt, gp_Vec
+from OCC.Core.gp import gp_Dir, gp_Pln, gp_Pnt, gp_Vec
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
+from OCC.Core.GeomAbs import GeomAbs_Plane, GeomAbs_Sphere
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 
 from OCC.Extend.ShapeFactory import (
     midpoint,
@@ -33,9 +36,24 @@ from OCC.Extend.ShapeFactory import (
     translate_shp,
     measure_shape_mass_center_of_gravity,
     edge_to_bezier,
+    face_descriptors,
+    shape_content_hash,
+    get_boundingbox,
+    get_boundingboxes,
+    center_boundingbox,
+    BoundingBoxCache,
+    measure_shapes_mass_properties,
+    place_shapes,
+    translate_shapes,
+    make_polylines,
+    make_bspline_edges,
+    make_wire,
+    points_to_bspline,
+    stack_ragged_points,
 )
-from OCC.Extend.TopologyUtils import TopologyExplorer
+from OCC.Extend.TopologyUtils import TopologyExplorer, list_of_shapes_to_compound
 
+import numpy as np
 import pytest
 
 
@@ -95,3 +113,190 @@ def test_edge_to_bezier():
             assert bezier_curve is None
         else:
             assert isinstance(degree, int)
+
+
+def test_face_descriptors():
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    descriptors = face_descriptors(box)
+    assert len(descriptors) == 6
+    assert np.all(descriptors["surface_type"] == GeomAbs_Plane)
+    assert math.isclose(descriptors["area"].sum(), 2 * (200 + 300 + 600))
+    assert np.all(descriptors["nb_adjacent_faces"] == 4)
+    # the normals are oriented outwards
+    center = np.array([5.0, 10.0, 15.0])
+    outwards = np.einsum(
+        "ij,ij->i", descriptors["direction"], descriptors["centroid"] - center
+    )
+    assert np.all(outwards > 0.0)
+    assert np.allclose(descriptors["bbox_min"].min(axis=0), 0.0, atol=1e-6)
+    assert np.allclose(descriptors["bbox_max"].max(axis=0), [10, 20, 30])
+    # the serial and parallel computations agree
+    assert np.array_equal(descriptors, face_descriptors(box, parallel=False))
+    sphere_descriptors = face_descriptors(BRepPrimAPI_MakeSphere(10.0).Shape())
+    assert sphere_descriptors["surface_type"][0] == GeomAbs_Sphere
+    assert math.isclose(sphere_descriptors["area"][0], 400 * math.pi, rel_tol=1e-6)
+
+
+def test_shape_content_hash():
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    same_box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    other_box = BRepPrimAPI_MakeBox(10.0, 20.0, 31.0).Shape()
+    # two different TopoDS_Shape objects, the same geometry
+    assert box.__hash__() != same_box.__hash__()
+    assert shape_content_hash(box) == shape_content_hash(same_box)
+    assert shape_content_hash(box) != shape_content_hash(other_box)
+    # below the tolerance
+    close_box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0 + 1e-9).Shape()
+    assert shape_content_hash(box, 1e-4) == shape_content_hash(close_box, 1e-4)
+    # the placement
+    moved_box = translate_shp(box, gp_Vec(100, -50, 3))
+    assert shape_content_hash(box) != shape_content_hash(moved_box)
+    assert shape_content_hash(box, ignore_placement=True) == shape_content_hash(
+        moved_box, ignore_placement=True
+    )
+    assert shape_content_hash(box, parallel=False) == shape_content_hash(box)
+
+
+def test_get_boundingboxes():
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    sphere = BRepPrimAPI_MakeSphere(gp_Pnt(100, 0, 0), 5.0).Shape()
+    for method in ["control_points", "triangulation", "mesh", "optimal"]:
+        boxes = get_boundingboxes([box, sphere], 1e-6, method)
+        assert boxes.shape == (2, 6)
+        assert np.allclose(boxes[0], [0, 0, 0, 10, 20, 30], atol=1e-3)
+        # all the methods bound the sphere
+        assert np.all(boxes[1][:3] <= [95 + 1e-3, -5 + 1e-3, -5 + 1e-3])
+        assert np.all(boxes[1][3:] >= [105 - 1e-3, 5 - 1e-3, 5 - 1e-3])
+    serial = get_boundingboxes([box, sphere], 1e-6, "optimal", parallel=False)
+    assert np.array_equal(serial, get_boundingboxes([box, sphere], 1e-6, "optimal"))
+    # the mesh method leaves the process wide BRepMesh default untouched
+    parallel_default = BRepMesh_IncrementalMesh.IsParallelDefault()
+    for parallel in (not parallel_default, parallel_default):
+        get_boundingboxes([box, sphere], 1e-6, "mesh", parallel=parallel)
+        assert BRepMesh_IncrementalMesh.IsParallelDefault() == parallel_default
+
+
+def test_boundingbox_cache():
+    cache = BoundingBoxCache()
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    bbox = get_boundingbox(box, cache=cache)
+    assert len(cache) == 1
+    assert np.allclose(bbox, get_boundingbox(box), atol=1e-6)
+    # the reversed shape is the same shape for the cache
+    center = center_boundingbox(box.Reversed(), cache=cache)
+    assert len(cache) == 1
+    assert center.IsEqual(gp_Pnt(5, 10, 15), 1e-5)
+    # a moved shape is a new shape
+    moved_box = translate_shp(box, gp_Vec(100, 0, 0))
+    boxes = cache.get_many([box, moved_box, moved_box], method="mesh")
+    assert len(cache) == 2
+    assert np.allclose(boxes[1], boxes[0] + [100, 0, 0, 100, 0, 0], atol=1e-5)
+    cache.invalidate(box)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_measure_shapes_mass_properties():
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    sphere = BRepPrimAPI_MakeSphere(gp_Pnt(100, 0, 0), 5.0).Shape()
+    props = measure_shapes_mass_properties([box, sphere])
+    assert np.allclose(props["volume"], [6000.0, 4.0 / 3.0 * math.pi * 125])
+    assert np.allclose(props["area"], [2200.0, 100 * math.pi])
+    assert np.allclose(props["center_of_mass"], [[5, 10, 15], [100, 0, 0]])
+    # the inertia of the box at its center: m(b^2 + c^2)/12
+    assert math.isclose(props["inertia"][0, 0, 0], 6000 * (400 + 900) / 12)
+    assert np.allclose(props["inertia"][0], props["inertia"][0].T)
+    # the same values as the single shape functions
+    cog, volume, _ = measure_shape_mass_center_of_gravity(sphere)
+    assert math.isclose(props["volume"][1], volume)
+    assert np.allclose(props["center_of_mass"][1], cog.Coord())
+    # all the solids of a compound
+    compound, _ = list_of_shapes_to_compound([box, sphere])
+    compound_props = measure_shapes_mass_properties(compound, parallel=False)
+    assert np.allclose(sorted(compound_props["volume"]), sorted(props["volume"]))
+    # the approximate mode measures the triangulation
+    BRepMesh_IncrementalMesh(sphere, 0.01)
+    approximate = measure_shapes_mass_properties([sphere], approximate=True)
+    assert math.isclose(approximate["volume"][0], props["volume"][1], rel_tol=1e-2)
+    assert approximate["volume"][0] != props["volume"][1]
+
+
+def test_measure_shapes_mass_properties_without_solids():
+    # a face away from the origin has no volume, only a surface
+    plane = gp_Pln(gp_Pnt(0, 0, 50), gp_Dir(0, 0, 1))
+    face = BRepBuilderAPI_MakeFace(plane, 0.0, 10.0, 0.0, 20.0).Face()
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    props = measure_shapes_mass_properties([face, box])
+    assert np.allclose(props["volume"], [0.0, 6000.0])
+    assert np.allclose(props["area"], [200.0, 2200.0])
+    assert np.allclose(props["center_of_mass"], [[5, 10, 50], [5, 10, 15]])
+    # the inertia of the surface at its center: m(b^2)/12 around x
+    assert math.isclose(props["inertia"][0, 0, 0], 200 * 400 / 12)
+
+
+def test_place_shapes():
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    vectors = np.arange(300, dtype=np.float64).reshape(100, 3)
+    placed = translate_shapes([box] * 100, vectors)
+    assert len(placed) == 100
+    for shape, vector in zip(placed[::10], vectors[::10]):
+        # the geometry is shared, only the location differs
+        assert shape.IsPartner(box)
+        assert np.allclose(
+            np.array(get_boundingbox(shape, use_mesh=False))
+            - get_boundingbox(box, use_mesh=False),
+            np.tile(vector, 2),
+        )
+    # a rotation of 90 degrees around z, then composed with a translation
+    matrix = np.array([[0, -1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1.0]])
+    [rotated] = place_shapes([placed[1]], matrix)
+    assert (
+        rotated.Location()
+        .Transformation()
+        .TranslationPart()
+        .IsEqual(gp_Pnt(-4, 3, 5).XYZ(), 1e-9)
+    )
+    [located] = place_shapes([placed[1]], matrix, compose=False)
+    assert located.Location().Transformation().TranslationPart().Modulus() < 1e-9
+    # scaling is not a location
+    with pytest.raises(RuntimeError):
+        place_shapes([box], np.diag([2.0, 2.0, 2.0, 1.0]))
+
+
+def test_numpy_points_to_bspline():
+    t = np.linspace(0, 2 * math.pi, 50)
+    points = np.column_stack([np.cos(t), np.sin(t), t])
+    curve = points_to_bspline(points)
+    assert curve.Value(curve.FirstParameter()).IsEqual(gp_Pnt(1, 0, 0), 1e-6)
+    assert curve.Value(curve.LastParameter()).IsEqual(gp_Pnt(1, 0, 2 * math.pi), 1e-6)
+    # a polyline wire from an array
+    wire = make_wire(points[:4])
+    assert TopologyExplorer(wire).number_of_edges() == 3
+
+
+def test_make_polylines_and_bspline_edges():
+    t = np.linspace(0, 1, 20)
+    curves = [np.column_stack([t, t**2, np.full_like(t, i)]) for i in range(100)]
+    points, offsets = stack_ragged_points(curves)
+    assert points.shape == (2000, 3)
+    assert offsets[-1] == 2000
+    wires = make_polylines(points, offsets)
+    assert len(wires) == 100
+    assert all(TopologyExplorer(w).number_of_edges() == 19 for w in wires[::10])
+    closed_wires = make_polylines(points[:20], [0, 20], closed=True)
+    assert TopologyExplorer(closed_wires[0]).number_of_edges() == 20
+    edges = make_bspline_edges(points, offsets)
+    assert len(edges) == 100
+    # the edges are in the order of the curves
+    _, _, zmin, _, _, zmax = get_boundingbox(edges[42], use_mesh=False)
+    assert math.isclose(zmin, 42, abs_tol=1e-3)
+    assert math.isclose(zmax, 42, abs_tol=1e-3)
+    # the serial build gives the same shapes
+    assert len(make_polylines(points, offsets, parallel=False)) == 100
+    serial_edges = make_bspline_edges(points, offsets, parallel=False)
+    assert get_boundingbox(serial_edges[42], use_mesh=False) == get_boundingbox(
+        edges[42], use_mesh=False
+    )
+    with pytest.raises(AssertionError):
+        make_polylines(points, [0, 10])
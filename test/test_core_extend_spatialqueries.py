@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+##Copyright 2026 Thomas Paviot (tpaviot@gmail.com)
+##
+##This file is part of pythonOCC.
+##
+##pythonOCC is free software: you can redistribute it and/or modify
+##it under the terms of the GNU Lesser General Public License as published by
+##the Free Software Foundation, either version 3 of the License, or
+##(at your option) any later version.
+##
+##pythonOCC is distributed in the hope that it will be useful,
+##but WITHOUT ANY WARRANTY; without even the implied warranty of
+##MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##GNU Lesser General Public License for more details.
+##
+##You should have received a copy of the GNU Lesser General Public License
+##along with pythonOCC.  If not, see <http://www.gnu.org/licenses/>.
+
+import pickle
+
+import numpy as np
+import pytest
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.gp import gp_Pnt
+from OCC.Core.TopAbs import TopAbs_IN, TopAbs_ON, TopAbs_OUT
+
+from OCC.Extend.SpatialQueries import (
+    ShapeBVH,
+    cast_rays,
+    classify_points,
+    find_interferences,
+    project_points,
+    slice_shape,
+)
+from OCC.Extend.TopologyUtils import TopologyExplorer
+
+BOX = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+
+
+def test_classify_points() -> None:
+    points = np.array(
+        [[5.0, 5.0, 5.0], [50.0, 5.0, 5.0], [0.0, 5.0, 5.0], [-1.0, -1.0, -1.0]]
+    )
+    states = classify_points(BOX, points)
+    assert states.dtype == np.int8
+    assert list(states) == [TopAbs_IN, TopAbs_OUT, TopAbs_ON, TopAbs_OUT]
+    # the parallel path gives the same states as the serial one
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 35.0, (2000, 3))
+    states = classify_points(BOX, points)
+    assert np.array_equal(states, classify_points(BOX, points, parallel=False))
+    inside = np.all((points > 0.0) & (points < [10.0, 20.0, 30.0]), axis=1)
+    assert np.array_equal(states == TopAbs_IN, inside)
+    with pytest.raises(AssertionError):
+        classify_points(BOX, np.zeros((3, 2)))
+
+
+def test_project_points() -> None:
+    points = np.array([[5.0, 10.0, 40.0], [5.0, 10.0, 29.0], [-3.0, -4.0, 15.0]])
+    result = project_points(BOX, points)
+    assert np.allclose(result["distances"], [10.0, 1.0, 5.0])
+    assert np.allclose(
+        result["points"], [[5.0, 10.0, 30.0], [5.0, 10.0, 30.0], [0.0, 0.0, 15.0]]
+    )
+    # the closest face of the first two points is the top face z=30
+    faces = list(TopologyExplorer(BOX).faces())
+    top_face = faces[result["face_ids"][0]]
+    assert result["face_ids"][1] == result["face_ids"][0]
+    assert np.isclose(project_points(top_face, points[:1])["distances"][0], 10.0)
+    assert result["uv"].shape == (3, 2)
+    # the serial and parallel paths agree
+    rng = np.random.default_rng(1)
+    points = rng.uniform(-20.0, 50.0, (200, 3))
+    parallel = project_points(BOX, points)
+    serial = project_points(BOX, points, parallel=False)
+    assert np.allclose(parallel["distances"], serial["distances"])
+
+
+@pytest.mark.parametrize("mode", ["exact", "triangulation"])
+def test_cast_rays(mode) -> None:
+    box = BRepPrimAPI_MakeBox(10.0, 20.0, 30.0).Shape()
+    origins = np.array([[5.0, 10.0, -10.0], [5.0, 10.0, 15.0], [50.0, 10.0, -10.0]])
+    result = cast_rays(box, origins, [0.0, 0.0, 2.0], mode=mode)
+    assert np.allclose(result["distances"][:2], [10.0, 15.0])
+    assert np.allclose(result["points"][:2], [[5.0, 10.0, 0.0], [5.0, 10.0, 30.0]])
+    assert np.all(result["solid_ids"][:2] == 0)
+    # the third ray misses the box
+    assert np.isinf(result["distances"][2])
+    assert result["face_ids"][2] == -1
+    assert result["solid_ids"][2] == -1
+    with pytest.raises(AssertionError):
+        cast_rays(box, origins, np.zeros((2, 3)), mode=mode)
+
+
+def test_shape_bvh() -> None:
+    bvh = ShapeBVH.from_shape(BOX, "face")
+    assert len(bvh) == 6
+    # the faces x=0, y=0 and z=0 touch the origin
+    offsets, face_ids = bvh.query_spheres([[0.0, 0.0, 0.0], [5.0, 10.0, 15.0]], 1.0)
+    assert list(offsets) == [0, 3, 3]
+    faces = list(TopologyExplorer(BOX).faces())
+    assert project_points(faces[face_ids[0]], [[0.0, 0.0, 0.0]])["distances"][0] < 1e-6
+    offsets, face_ids = bvh.query_boxes([[-1.0, -1.0, 29.0, 11.0, 21.0, 31.0]])
+    assert offsets[-1] == 5  # all but the bottom face
+    # a void query box overlaps nothing
+    offsets, face_ids = bvh.query_boxes(
+        [[np.nan] * 6, [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0]]
+    )
+    assert list(offsets) == [0, 0, 3]
+    nearest_ids, distances = bvh.nearest([[5.0, 10.0, 40.0], [5.0, 10.0, 15.0]])
+    assert np.isclose(distances[0], 10.0)
+    assert np.isclose(distances[1], 5.0)
+    assert nearest_ids[0] == project_points(BOX, [[5.0, 10.0, 40.0]])["face_ids"][0]
+    # the serialized trees give the same answers
+    for copy in (ShapeBVH.from_bytes(bvh.to_bytes()), pickle.loads(pickle.dumps(bvh))):
+        assert np.array_equal(copy.nearest([[5.0, 10.0, 40.0]])[0], nearest_ids[:1])
+    assert len(ShapeBVH.from_shape(BOX, "solid")) == 1
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_find_interferences(exact) -> None:
+    shapes = [
+        BRepPrimAPI_MakeBox(10.0, 10.0, 10.0).Shape(),
+        # overlaps the first box by 2 along each axis
+        BRepPrimAPI_MakeBox(gp_Pnt(8.0, 2.0, 2.0), 10.0, 10.0, 10.0).Shape(),
+        # far from the others
+        BRepPrimAPI_MakeBox(gp_Pnt(50.0, 50.0, 50.0), 1.0, 1.0, 1.0).Shape(),
+        # inside the first box
+        BRepPrimAPI_MakeBox(gp_Pnt(2.0, 2.0, 2.0), 1.0, 1.0, 1.0).Shape(),
+    ]
+    result = find_interferences(shapes, exact=exact)
+    pairs = [tuple(pair) for pair in result["pairs"]]
+    assert sorted(pairs) == [(0, 1), (0, 3)]
+    assert list(result["contained"][np.argsort(result["pairs"][:, 1])]) == [False, True]
+    depths = dict(zip(pairs, result["depths"]))
+    assert np.isclose(depths[(0, 1)], 2.0, atol=0.1)
+    assert np.isclose(depths[(0, 3)], 3.0, atol=0.1)
+    if exact:
+        volumes = dict(zip(pairs, result["volumes"]))
+        assert np.isclose(volumes[(0, 1)], 128.0)
+        assert np.isclose(volumes[(0, 3)], 1.0)
+
+
+@pytest.mark.parametrize("mode", ["exact", "triangulation"])
+def test_slice_shape(mode) -> None:
+    sphere = BRepPrimAPI_MakeSphere(10.0).Shape()
+    offsets = np.array([0.0, 5.0, 20.0, -5.0])
+    result = slice_shape(sphere, [0.0, 0.0, 2.0], offsets, mode=mode)
+    slice_offsets = result["slice_offsets"]
+    contour_offsets = result["contour_offsets"]
+    # one closed circle per plane, but the one that misses the sphere
+    assert list(np.diff(slice_offsets)) == [1, 1, 0, 1]
+    assert np.all(result["closed"])
+    for plane, offset in ((0, 0.0), (1, 5.0), (3, -5.0)):
+        contour = slice_offsets[plane]
+        points = result["points"][
+            contour_offsets[contour] : contour_offsets[contour + 1]
+        ]
+        assert np.allclose(points[:, 2], offset)
+        assert np.allclose(points[0], points[-1])
+        radii = np.linalg.norm(points[:, :2], axis=1)
+        assert np.allclose(radii, np.sqrt(100.0 - offset**2), rtol=0.1)
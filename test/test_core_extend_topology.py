@@ -21,18 +21,39 @@ from OCC.Core.BRepPrimAPI import (
     BRepPrimAPI_MakeTorus,
     BRepPrimAPI_MakeBox,
     BRepPrimAPI_MakeSphere,
+    BRepPrimAPI_MakeCylinder,
+)
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.TopAbs import (
+    TopAbs_VERTEX,
+    TopAbs_EDGE,
+    TopAbs_WIRE,
+    TopAbs_FACE,
+    TopAbs_SHELL,
+    TopAbs_SOLID,
 )
 from OCC.Extend.TopologyUtils import (
     TopologyExplorer,
+    TopologyIndex,
     WireExplorer,
+    compound_children,
     discretize_edge,
+    discretize_edges,
     discretize_wire,
     dump_topology_to_string,
     get_type_as_string,
     get_sorted_hlr_edges,
+    get_sorted_hlr_edges_views,
     list_of_shapes_to_compound,
+    sample_edges,
+    sample_faces_uv_grid,
 )
 from OCC.Core.TopoDS import TopoDS_Face, TopoDS_Edge
+from OCC.Core.gp import gp_Ax2, gp_Dir, gp_Pnt
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+
+import numpy as np
 
 
 def get_test_box_shape(len_x=10.0, len_y=20.0, len_z=30.0):
@@ -62,6 +83,66 @@ def test_discretize_wire():
         assert pnts
 
 
+def test_discretize_edges():
+    tor = BRepPrimAPI_MakeTorus(50, 20).Shape()
+    index = TopologyIndex(tor)
+    edges = list(index.shapes(TopAbs_EDGE))
+    for algorithm in ["QuasiUniformDeflection", "UniformAbscissa", "UniformDeflection"]:
+        points, offsets = discretize_edges(tor, 0.5, algorithm)
+        assert points.shape == (offsets[-1], 3)
+        assert len(offsets) == len(edges) + 1
+        # same points as the edge by edge discretization
+        for i, edge in enumerate(edges):
+            expected = np.array(discretize_edge(edge, 0.5, algorithm))
+            assert np.allclose(points[offsets[i] : offsets[i + 1]], expected)
+        serial_points, serial_offsets = discretize_edges(
+            tor, 0.5, algorithm, parallel=False
+        )
+        assert np.array_equal(points, serial_points)
+        assert np.array_equal(offsets, serial_offsets)
+    # a list of edges is kept in order, duplicates and orientation included
+    edge = edges[0]
+    points, offsets = discretize_edges([edge, edge.Reversed(), edge])
+    assert len(offsets) == 4
+    first = points[offsets[0] : offsets[1]]
+    assert np.allclose(points[offsets[1] : offsets[2]], first[::-1])
+    assert np.allclose(points[offsets[2] : offsets[3]], first)
+
+
+def test_sample_faces_uv_grid():
+    box = get_test_box_shape()
+    points, normals, masks = sample_faces_uv_grid(box, 5, 4)
+    assert points.shape == (6, 5, 4, 3)
+    assert normals.shape == (6, 5, 4, 3)
+    assert masks.shape == (6, 5, 4)
+    # the faces of a box are not trimmed
+    assert masks.all()
+    assert np.allclose(points.min(axis=(0, 1, 2)), [0, 0, 0])
+    assert np.allclose(points.max(axis=(0, 1, 2)), [10, 20, 30])
+    # the normals point outwards
+    centers = points.mean(axis=(1, 2))
+    outwards = np.einsum("ij,ij->i", normals[:, 0, 0], centers - [5, 10, 15])
+    assert np.all(outwards > 0)
+    serial = sample_faces_uv_grid(box, 5, 4, parallel=False)
+    assert np.array_equal(points, serial[0])
+    # a hole through the box trims the samples of two faces
+    cylinder = BRepPrimAPI_MakeCylinder(
+        gp_Ax2(gp_Pnt(5, 10, -1), gp_Dir(0, 0, 1)), 3, 32
+    )
+    drilled = BRepAlgoAPI_Cut(box, cylinder.Shape()).Shape()
+    _, _, masks = sample_faces_uv_grid(drilled, 11, 11)
+    assert np.sum(~masks.all(axis=(1, 2))) == 2
+
+
+def test_sample_edges():
+    box = get_test_box_shape()
+    points, tangents = sample_edges(box, 3)
+    assert points.shape == (12, 3, 3)
+    # the middle samples are at the middle of the edges
+    assert np.allclose(points[:, 1], (points[:, 0] + points[:, 2]) / 2)
+    assert np.allclose(np.linalg.norm(tangents, axis=2), 1.0)
+
+
 def test_loop_faces():
     i = 0
     for face in topo.faces():
@@ -89,6 +170,37 @@ def test_number_of_topological_entities():
     assert topo.number_of_comp_solids() == 0
 
 
+def test_number_of_topological_entities_with_orientation():
+    topo_with_orientation = TopologyExplorer(
+        get_test_box_shape(), ignore_orientation=False
+    )
+    # each edge is shared by two faces, with opposite orientations
+    assert topo_with_orientation.number_of_edges() == 24
+    assert topo_with_orientation.number_of_vertices() == 48
+    assert topo_with_orientation.number_of_faces() == 6
+
+
+def test_unique_sub_shapes_are_lazy():
+    edges = topo.edges()
+    # an iterator, not a list
+    assert next(edges) is not None
+    assert sum(1 for _ in edges) == 11
+    # the sub-shapes of an entity
+    face = next(topo.faces())
+    assert topo.number_of_edges_from_face(face) == 4
+    assert topo.number_of_vertices_from_face(face) == 4
+
+
+def test_indexed_map_of_shape_iteration():
+    shape_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(get_test_box_shape(), TopAbs_EDGE, shape_map)
+    assert len(shape_map) == 12
+    edges = list(shape_map)
+    assert len(edges) == 12
+    assert edges[0] in shape_map
+    assert get_test_box_shape() not in shape_map
+
+
 def test_nested_iteration():
     """check nested looping"""
     for f in topo.faces():
@@ -192,9 +304,91 @@ def test_get_sorted_hlr_edges():
     get_sorted_hlr_edges(box_shp)
 
 
+def test_get_sorted_hlr_edges_poly():
+    box_shp = get_test_box_shape()
+    visible, hidden = get_sorted_hlr_edges(
+        box_shp, direction=gp_Dir(1, 1, 1), algorithm="poly"
+    )
+    assert visible
+    assert hidden
+
+
+def test_get_sorted_hlr_edges_views():
+    box_shp = get_test_box_shape()
+    # in the calling process by default
+    views = get_sorted_hlr_edges_views(box_shp)
+    assert list(views) == ["front", "top", "side", "iso"]
+    parallel_views = get_sorted_hlr_edges_views(box_shp, max_workers=2)
+    for name, (visible, hidden) in views.items():
+        assert visible
+        assert len(parallel_views[name][0]) == len(visible)
+        assert len(parallel_views[name][1]) == len(hidden)
+    # the same as one view at a time
+    visible, hidden = get_sorted_hlr_edges(box_shp, direction=gp_Dir(1, 1, 1))
+    assert len(views["iso"][0]) == len(visible)
+    assert len(views["iso"][1]) == len(hidden)
+
+
 def test_list_of_shapes_to_compound():
     box_shp = get_test_box_shape()
     sph_shp = get_test_sphere_shape(20.0)
     result, all_shape_converted = list_of_shapes_to_compound([box_shp, sph_shp])
     assert all_shape_converted
     assert get_type_as_string(result) == "Compound"
+    # and back to the list of shapes, in order
+    children = compound_children(result)
+    assert len(children) == 2
+    assert children[0].IsSame(box_shp) and children[1].IsSame(sph_shp)
+
+
+def test_topology_index_counts():
+    index = TopologyIndex(get_test_box_shape())
+    assert index.counts() == {
+        TopAbs_VERTEX: 8,
+        TopAbs_EDGE: 12,
+        TopAbs_WIRE: 6,
+        TopAbs_FACE: 6,
+        TopAbs_SHELL: 1,
+        TopAbs_SOLID: 1,
+    }
+    # ids and entities
+    for face_id in range(6):
+        face = index.get_shape(TopAbs_FACE, face_id)
+        assert isinstance(face, TopoDS_Face)
+        assert index.get_id(face) == face_id
+    assert index.get_id(get_test_box_shape()) == -1
+
+
+def test_topology_index_adjacency():
+    index = TopologyIndex(get_test_box_shape())
+    # each face has 4 edges, each edge 2 faces
+    offsets, edge_ids = index.adjacency(TopAbs_FACE, TopAbs_EDGE)
+    assert np.all(np.diff(offsets) == 4)
+    assert len(edge_ids) == 24
+    offsets, face_ids = index.adjacency(TopAbs_EDGE, TopAbs_FACE)
+    assert np.all(np.diff(offsets) == 2)
+    # the two adjacencies are consistent
+    pairs = index.adjacency_pairs(TopAbs_FACE, TopAbs_EDGE)
+    reversed_pairs = index.adjacency_pairs(TopAbs_EDGE, TopAbs_FACE)
+    assert sorted(map(tuple, pairs)) == sorted(map(tuple, reversed_pairs[:, ::-1]))
+    # each vertex belongs to 3 edges, each edge has 2 vertices
+    offsets, _ = index.adjacency(TopAbs_VERTEX, TopAbs_EDGE)
+    assert np.all(np.diff(offsets) == 3)
+    offsets, _ = index.adjacency(TopAbs_EDGE, TopAbs_VERTEX)
+    assert np.all(np.diff(offsets) == 2)
+    # all the faces belong to the single solid
+    offsets, solid_ids = index.adjacency(TopAbs_FACE, TopAbs_SOLID)
+    assert np.all(solid_ids == 0)
+
+
+def test_topology_index_neighbours():
+    index = TopologyIndex(get_test_box_shape())
+    # each face of a box is adjacent to 4 faces, all but itself and the opposite
+    offsets, face_ids = index.neighbours(TopAbs_FACE)
+    assert np.all(np.diff(offsets) == 4)
+    for face_id in range(6):
+        neighbours = face_ids[offsets[face_id] : offsets[face_id + 1]]
+        assert face_id not in neighbours
+    # each vertex is linked to 3 vertices by the edges
+    offsets, _ = index.neighbours(TopAbs_VERTEX)
+    assert np.all(np.diff(offsets) == 3)
@@ -80,11 +80,13 @@ from OCC.Core.TopoDS import (
     TopoDS_Edge,
     TopoDS_Vertex,
     TopoDS_Shape,
+    topods,
 )
 from OCC.Core.TColStd import TColStd_Array1OfReal, TColStd_Array1OfInteger
 from OCC.Core.TColgp import TColgp_Array1OfPnt
 from OCC.Core.TDF import TDF_LabelSequence
 from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopLoc import TopLoc_Location
 from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_Orientation
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.BRepGProp import brepgprop
@@ -449,6 +451,55 @@ def test_pickle_topods_shape_to_from() -> None:
     assert not pickled_shape.IsNull()
 
 
+def test_pickle_topods_shape_binary_and_text() -> None:
+    """
+    Checks the binary and text pickle formats of TopoDS_Shapes
+    """
+    box_shape = BRepPrimAPI_MakeBox(100, 200, 300).Shape()
+    BRepMesh_IncrementalMesh(box_shape, 1.0)
+    # binary is the default format
+    assert isinstance(box_shape.__getstate__(), bytes)
+    binary_shape = pickle.loads(pickle.dumps(box_shape))
+    props = GProp_GProps()
+    brepgprop.VolumeProperties(binary_shape, props)
+    assert props.Mass() == pytest.approx(100 * 200 * 300)
+    # triangulations are kept by default
+    face = topods.Face(TopExp_Explorer(binary_shape, TopAbs_FACE).Current())
+    assert BRep_Tool.Triangulation(face, TopLoc_Location()) is not None
+    # the text format is still available, and old pickles can be read
+    TopoDS_Shape.pickle_format = "text"
+    try:
+        text_dump = pickle.dumps(box_shape)
+    finally:
+        TopoDS_Shape.pickle_format = "binary"
+    assert not pickle.loads(text_dump).IsNull()
+    assert len(pickle.dumps(box_shape)) < len(text_dump)
+
+
+def test_pickle_topods_shape_without_triangles() -> None:
+    box_shape = BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    BRepMesh_IncrementalMesh(box_shape, 1.0)
+    TopoDS_Shape.pickle_with_triangles = False
+    try:
+        unpickled_shape = pickle.loads(pickle.dumps(box_shape))
+    finally:
+        TopoDS_Shape.pickle_with_triangles = True
+    face = topods.Face(TopExp_Explorer(unpickled_shape, TopAbs_FACE).Current())
+    assert BRep_Tool.Triangulation(face, TopLoc_Location()) is None
+
+
+def test_unpickle_corrupted_topods_shape() -> None:
+    box_shape = BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    state = box_shape.__getstate__()
+    # the end of the BinTools stream is zeroed, the pickle itself stays valid
+    corrupted_state = state[:64] + bytes(len(state) - 64)
+    corrupted_dump = pickle.dumps(box_shape).replace(state, corrupted_state)
+    with pytest.raises(RuntimeError):
+        pickle.loads(corrupted_dump)
+    with pytest.raises(RuntimeError):
+        pickle.loads(pickle.dumps(box_shape).replace(state, state[::-1]))
+
+
 def test_sub_class() -> None:
     """Test: subclass"""
     # Checks that OCC objects can be subclassed, and passed as parameters.